@@ -0,0 +1,54 @@
+"""Benchmark compose and map chains.
+
+Cont.map and Observable.map are run over chains of maps, and compose
+is called with 1 to 4 functions.
+"""
+
+from __future__ import annotations
+
+import timeit
+from collections.abc import Callable
+
+from oslash import Cont, Observable
+from oslash.util import compose, identity
+
+N = 10_000
+DEPTH = 10
+ITEMS = 100
+
+
+def inc(x: int) -> int:
+    return x + 1
+
+
+def cont_map_chain() -> int:
+    m: Cont[int, int] = Cont.unit(0)
+    for _ in range(DEPTH):
+        m = m.map(inc)
+    return m.run(identity)
+
+
+def observable_map_chain() -> int:
+    def subscribe(on_next: Callable[[int], None]) -> None:
+        for i in range(ITEMS):
+            on_next(i)
+
+    m = Observable(subscribe)
+    for _ in range(DEPTH):
+        m = m.map(inc)
+    result: list[int] = []
+    m.subscribe(result.append)
+    return len(result)
+
+
+if __name__ == "__main__":
+    seconds = min(timeit.repeat(cont_map_chain, number=N, repeat=3))
+    print(f"Cont.map: {N} runs of {DEPTH} maps in {seconds:.3f}s")
+
+    seconds = min(timeit.repeat(observable_map_chain, number=N // ITEMS, repeat=3))
+    print(f"Observable.map: {N} items through {DEPTH} maps in {seconds:.3f}s")
+
+    for n in range(1, 5):
+        fn: Callable[[int], int] = compose(*[inc] * n)
+        seconds = min(timeit.repeat(lambda fn=fn: fn(0), number=N * 10, repeat=3))
+        print(f"compose of {n}: {N * 10} calls in {seconds:.3f}s")
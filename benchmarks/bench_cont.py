@@ -0,0 +1,44 @@
+"""Benchmark deep continuation-passing loops.
+
+Runs CPS loops of 10^6 steps. These are only possible since Cont is
+trampolined; without it they would overflow the stack.
+"""
+
+from __future__ import annotations
+
+import timeit
+from collections.abc import Callable
+
+from oslash import Cont
+from oslash.util import identity
+
+N = 1_000_000
+
+
+def countdown(n: int) -> Cont[int, int]:
+    return Cont.unit(n) if n == 0 else Cont.unit(n - 1).bind(countdown)
+
+
+def bind_chain(n: int) -> int:
+    m: Cont[int, int] = Cont.unit(0)
+    for _ in range(n):
+        m = m.bind(lambda x: Cont.unit(x + 1))
+    return m.run(identity)
+
+
+def call_cc_loop(n: int) -> int:
+    def loop(i: int, escape: Callable[[int], Cont[int, int]]) -> Cont[int, int]:
+        return escape(i) if i == n else Cont.unit(i + 1).bind(lambda j: loop(j, escape))
+
+    return Cont.call_cc(lambda escape: loop(0, escape)).run(identity)
+
+
+if __name__ == "__main__":
+    benches = [
+        ("recursive countdown", lambda: countdown(N).run(identity)),
+        ("left-nested bind chain", lambda: bind_chain(N)),
+        ("call_cc loop", lambda: call_cc_loop(N)),
+    ]
+    for name, bench in benches:
+        seconds = min(timeit.repeat(bench, number=1, repeat=3))
+        print(f"{name}: {N} steps in {seconds:.3f}s")
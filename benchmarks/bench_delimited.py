@@ -0,0 +1,80 @@
+"""Benchmark delimited continuations.
+
+Compares continuations built from nested closures with continuations
+backed by generators, for an early-exit search and for a producer that
+suspends with shift for every value it produces.
+"""
+
+from __future__ import annotations
+
+import timeit
+from collections.abc import Callable, Generator
+from typing import Any
+
+from oslash import Cont
+from oslash.util import identity
+
+N = 100_000
+
+type Step = tuple[int, Callable[[Any], Step]] | None
+
+
+def search_closures(xs: list[int], target: int) -> Cont[Any, int]:
+    def go(i: int) -> Cont[Any, int]:
+        if i == len(xs):
+            return Cont.unit(-1)
+        if xs[i] == target:
+            return Cont.shift(lambda _: Cont.unit(i))
+        return Cont.unit(i + 1).bind(go)
+
+    return go(0)
+
+
+def search_generator(xs: list[int], target: int) -> Cont[Any, int]:
+    def go() -> Generator[Cont[Any, int], Any, int]:
+        for i, x in enumerate(xs):
+            if x == target:
+                yield Cont.shift(lambda _, i=i: Cont.unit(i))
+        return -1
+
+    return Cont.from_generator(go)
+
+
+def producer_closures(n: int) -> Cont[Any, Step]:
+    def go(i: int) -> Cont[Any, Step]:
+        if i == n:
+            return Cont.unit(None)
+        return Cont.shift(lambda k: Cont.unit((i, k))).bind(lambda _: go(i + 1))
+
+    return go(0)
+
+
+def producer_generator(n: int) -> Cont[Any, Step]:
+    def go() -> Generator[Cont[Any, Step], Any, None]:
+        for i in range(n):
+            yield Cont.shift(lambda k, i=i: Cont.unit((i, k)))
+
+    return Cont.from_generator(go)
+
+
+def consume(producer: Cont[Any, Step]) -> int:
+    total = 0
+    step: Step = Cont.reset(producer).run(identity)
+    while step is not None:
+        value, resume = step
+        total += value
+        step = resume(None)
+    return total
+
+
+if __name__ == "__main__":
+    xs = list(range(N))
+    benches: list[tuple[str, Callable[[], object]]] = [
+        ("early-exit search, closures", lambda: Cont.reset(search_closures(xs, N - 1)).run(identity)),
+        ("early-exit search, generator", lambda: Cont.reset(search_generator(xs, N - 1)).run(identity)),
+        ("producer, closures", lambda: consume(producer_closures(N))),
+        ("producer, generator", lambda: consume(producer_generator(N))),
+    ]
+    for name, bench in benches:
+        seconds = min(timeit.repeat(bench, number=1, repeat=3))
+        print(f"{name}: {N} steps in {seconds:.3f}s")
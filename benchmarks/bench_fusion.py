@@ -0,0 +1,35 @@
+"""Benchmark the throughput of fused Observable chains.
+
+Items are pushed through chains of 1 to 20 alternating map and filter
+operators, and the throughput is reported in items per second.
+"""
+
+from __future__ import annotations
+
+import timeit
+
+from oslash import Observable
+
+ITEMS = 10_000
+
+
+def inc(x: int) -> int:
+    return x + 1
+
+
+def positive(x: int) -> bool:
+    return x > 0
+
+
+def chain(length: int) -> Observable[int]:
+    m = Observable.from_iterable(range(ITEMS))
+    for i in range(length):
+        m = m.map(inc) if i % 2 == 0 else m.filter(positive)
+    return m
+
+
+if __name__ == "__main__":
+    for length in (1, 2, 5, 10, 20):
+        m = chain(length)
+        seconds = min(timeit.repeat(lambda m=m: m.subscribe(lambda _: None), number=5, repeat=5))
+        print(f"{length:2} operators: {5 * ITEMS / seconds:,.0f} items/s")
@@ -0,0 +1,56 @@
+"""Benchmark printing with the IO monad to a pipe.
+
+An IO program printing many lines is run with a line buffered stdout
+writing to a pipe, once printing every Put at once, and once with the
+Put output buffered. For comparison, it is also run on a
+StringIOHandler, without any terminal I/O.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import timeit
+
+import oslash.ioaction
+from oslash import IO, StringIOHandler, put_line
+
+LINES = 100_000
+
+
+def program() -> IO[tuple[()]]:
+    action = put_line("0")
+    for i in range(1, LINES):
+        action = action.bind(lambda _, i=i: put_line(f"line {i}"))
+    return action
+
+
+def drain(fd: int) -> None:
+    while os.read(fd, 1 << 16):
+        pass
+
+
+if __name__ == "__main__":
+    read_fd, write_fd = os.pipe()
+    threading.Thread(target=drain, args=(read_fd,), daemon=True).start()
+    stdout = sys.stdout
+    sys.stdout = os.fdopen(write_fd, "w", buffering=1, encoding="utf-8")
+    try:
+        action = program()
+        results: dict[str, float] = {}
+        for name, size in [("per-line print", 0), ("buffered", oslash.ioaction.output_buffer_size)]:
+            oslash.ioaction.output_buffer_size = size
+            results[name] = min(timeit.repeat(action, number=1, repeat=3))
+    finally:
+        sys.stdout.close()
+        sys.stdout = stdout
+
+    def in_memory() -> None:
+        with StringIOHandler():
+            action()
+
+    results["in memory"] = min(timeit.repeat(in_memory, number=1, repeat=3))
+
+    for name, seconds in results.items():
+        print(f"{name}: {LINES} lines in {seconds:.3f}s ({LINES / seconds:,.0f} lines/s)")
@@ -0,0 +1,45 @@
+"""Benchmark reading a file many times with the IO monad.
+
+A small file is read by many IO actions, once opening it for each
+action with read_file, and once reusing the file handles of a
+ResourcePool.
+"""
+
+from __future__ import annotations
+
+import tempfile
+import timeit
+from io import TextIOWrapper
+from pathlib import Path
+
+from oslash import IO, Return, read_file
+from oslash.ioaction import ResourcePool
+
+READS = 10_000
+
+
+def repeat(action: IO[str]) -> IO[str]:
+    program = action
+    for _ in range(1, READS):
+        program = program >> action
+    return program
+
+
+def read_handle(f: TextIOWrapper) -> IO[str]:
+    f.seek(0)
+    return Return(f.read())
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "data.txt"
+        path.write_text("line\n" * 100)
+
+        with ResourcePool(path.open, lambda f: f.close()) as pool:
+            actions = {
+                "reopened": repeat(read_file(str(path))),
+                "pooled": repeat(pool.use(read_handle)),
+            }
+            for name, action in actions.items():
+                seconds = min(timeit.repeat(action, number=1, repeat=3))
+                print(f"{name}: {READS} reads in {seconds:.3f}s ({READS / seconds:,.0f} reads/s)")
@@ -0,0 +1,42 @@
+"""Benchmark reading many files with IO.traverse and IO.par_traverse.
+
+Many files are read with read_file, one after another, and on thread
+pools of several sizes. Files in the page cache read faster than the
+threads start, so the reads are also run with a millisecond of
+latency added, as on network storage.
+"""
+
+from __future__ import annotations
+
+import tempfile
+import time
+import timeit
+from pathlib import Path
+
+from oslash import IO, read_file
+
+FILES = 1_000
+LATENCY = 0.001
+
+
+def slow_read_file(filename: str) -> IO[str]:
+    def wait(text: str) -> str:
+        time.sleep(LATENCY)
+        return text
+
+    return read_file(filename).map(wait)
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as directory:
+        filenames = [str(Path(directory) / f"{i}.txt") for i in range(FILES)]
+        for filename in filenames:
+            Path(filename).write_text("line\n" * 1000)
+
+        for reader in (read_file, slow_read_file):
+            actions: dict[str, IO[list[str]]] = {"traverse": IO.traverse(filenames, reader)}
+            for workers in (2, 4, 8):
+                actions[f"par_traverse, {workers} workers"] = IO.par_traverse(filenames, reader, workers)
+            for name, action in actions.items():
+                seconds = min(timeit.repeat(action, number=1, repeat=3))
+                print(f"{reader.__name__}, {name}: {FILES} files in {seconds:.3f}s ({FILES / seconds:,.0f} files/s)")
@@ -0,0 +1,56 @@
+"""Benchmark running deep IO trees, with and without optimize.
+
+Long chains of map, and of binds to Return, are built on an IO action
+and run with the interpreter, once as built, and once optimized first.
+The trees are also rendered with pretty, and counted with io_stats.
+"""
+
+from __future__ import annotations
+
+import timeit
+from collections.abc import Callable
+from typing import Any
+
+from oslash import IO, Return
+from oslash.ioaction import Bind, Flush, Map, _interpret, io_stats, optimize, pretty  # type: ignore
+
+DEPTH = 100_000
+
+
+def inc(x: int) -> int:
+    return x + 1
+
+
+def map_chain() -> IO[Any]:
+    action: IO[Any] = Return(0)
+    action = Map(Flush(action), inc)
+    for _ in range(DEPTH):
+        action = action.map(inc)
+    return action
+
+
+def return_chain() -> IO[Any]:
+    action: IO[Any] = Flush(Return(0))
+    for _ in range(DEPTH):
+        action = Bind(action, Return)
+    return action
+
+
+TREES: dict[str, Callable[[], IO[Any]]] = {
+    "map chain": map_chain,
+    "bind to Return chain": return_chain,
+}
+
+
+if __name__ == "__main__":
+    for name, tree in TREES.items():
+        action = tree()
+        plain = min(timeit.repeat(lambda action=action: _interpret(action, 0), number=1, repeat=3))
+        optimized = min(timeit.repeat(lambda action=action: _interpret(optimize(action), 0), number=1, repeat=3))
+        print(f"{name}: {DEPTH} nodes in {plain:.3f}s, optimized {optimized:.3f}s ({plain / optimized:.1f}x)")
+
+    for name, tree in TREES.items():
+        action = tree()
+        rendered = min(timeit.repeat(lambda action=action: pretty(action), number=1, repeat=3))
+        counted = min(timeit.repeat(lambda action=action: io_stats(action), number=1, repeat=3))
+        print(f"{name}: rendered in {rendered:.3f}s, counted in {counted:.3f}s")
@@ -0,0 +1,41 @@
+"""Benchmark the time operators of Observable on virtual time.
+
+An hour of events, ten per second, is pushed through rate limiting
+pipelines on a VirtualTimeScheduler, so no time is spent waiting.
+"""
+
+from __future__ import annotations
+
+import timeit
+from collections.abc import Callable
+
+from oslash import Observable
+from oslash.scheduler import VirtualTimeScheduler
+
+HOUR = 3600.0
+PERIOD = 0.1
+
+
+def simulate(pipeline: Callable[[Observable[int], VirtualTimeScheduler], Observable[object]]) -> int:
+    scheduler = VirtualTimeScheduler()
+    result: list[object] = []
+    subscription = pipeline(Observable.interval(PERIOD, scheduler), scheduler).subscribe(result.append)
+    scheduler.advance_by(HOUR)
+    subscription.dispose()
+    return len(result)
+
+
+PIPELINES: dict[str, Callable[[Observable[int], VirtualTimeScheduler], Observable[object]]] = {
+    "interval": lambda m, s: m.map(lambda x: x),
+    "buffer_with_time": lambda m, s: m.buffer_with_time(60.0, s).map(len),
+    "debounce": lambda m, s: m.debounce(0.05, s),
+    "delay": lambda m, s: m.delay(1.0, s),
+    "timeout": lambda m, s: m.timeout(1.0, s),
+}
+
+
+if __name__ == "__main__":
+    events = int(HOUR / PERIOD)
+    for name, pipeline in PIPELINES.items():
+        seconds = min(timeit.repeat(lambda pipeline=pipeline: simulate(pipeline), number=1, repeat=3))
+        print(f"{name}: an hour of {events} events in {seconds:.3f}s ({events / seconds:,.0f} events/s)")
@@ -0,0 +1,38 @@
+"""Benchmark Writer log accumulation.
+
+Chains 10^5 binds that each append one entry to the log, and then
+materializes the log with run().
+"""
+
+from __future__ import annotations
+
+import timeit
+from typing import Any
+
+from oslash import StringWriter, Writer
+
+N = 100_000
+
+ListWriter: type[Any] = Writer.create("ListWriter", list)  # type: ignore[assignment]
+
+
+def string_tells(n: int) -> int:
+    w: Any = StringWriter.unit(0)
+    for _ in range(n):
+        w = w.bind(lambda _: StringWriter(None, "x"))
+    _, log = w.run()
+    return len(log)
+
+
+def list_tells(n: int) -> int:
+    w: Any = ListWriter.unit(0)
+    for i in range(n):
+        w = w.bind(lambda _, i=i: ListWriter(None, [i]))
+    _, log = w.run()
+    return len(log)
+
+
+if __name__ == "__main__":
+    for name, bench in [("StringWriter", string_tells), ("ListWriter", list_tells)]:
+        seconds = min(timeit.repeat(lambda bench=bench: bench(N), number=1, repeat=3))
+        print(f"{name}: {N} tells in {seconds:.3f}s")
@@ -6,39 +6,68 @@ A Python library for functional programming with monads, functors, and applicati
 from __future__ import annotations
 
 # Monads
+from .asyncobservable import AsyncObservable, AsyncObserver
 from .cont import Cont
 from .do import do, guard, let
 from .either import Either, Left, Right
 from .identity import Identity
-from .ioaction import IO, Get, Put, ReadFile, Return, get_line, put_line, read_file
+from .ioaction import (
+    IO,
+    AppendFile,
+    Get,
+    Put,
+    ReadFile,
+    Return,
+    WriteFile,
+    append_file,
+    get_line,
+    mmap_file,
+    put_line,
+    read_binary_chunks,
+    read_binary_lines,
+    read_chunks,
+    read_file,
+    read_lines,
+    write_file,
+    write_lines,
+)
+from .iohandler import Handler, RecordingHandler, ReplayHandler, StdioHandler, StringIOHandler
 from .list import List
 from .maybe import Just, Maybe, Nothing
 
 # Utilities
 from .monadic import compose as monadic_compose
-from .observable import Observable
+from .observable import BehaviorSubject, Disposable, Observable, Observer, ReplaySubject, Subject
 from .reader import MonadReader, Reader
+from .scheduler import ProcessPoolScheduler, RealTimeScheduler, ThreadPoolScheduler, VirtualTimeScheduler
 from .state import State
 
 # Protocols
 from .typing import Applicative, Functor, Monad, Monoid
 from .util import Unit, compose, fmap, identity, indent
-from .writer import MonadWriter, StringWriter, Writer
+from .writer import LogSink, MonadWriter, StreamingWriter, StringWriter, Writer
 
 # Version will be managed by release-please
 __version__ = "2.0.0"
 
 __all__ = [
     "IO",
+    "AppendFile",
     "Applicative",
+    "AsyncObservable",
+    "AsyncObserver",
+    "BehaviorSubject",
     "Cont",
+    "Disposable",
     "Either",
     "Functor",
     "Get",
+    "Handler",
     "Identity",
     "Just",
     "Left",
     "List",
+    "LogSink",
     "Maybe",
     "Monad",
     "MonadReader",
@@ -46,15 +75,29 @@ __all__ = [
     "Monoid",
     "Nothing",
     "Observable",
+    "Observer",
+    "ProcessPoolScheduler",
     "Put",
     "ReadFile",
     "Reader",
+    "RealTimeScheduler",
+    "RecordingHandler",
+    "ReplayHandler",
+    "ReplaySubject",
     "Return",
     "Right",
     "State",
+    "StdioHandler",
+    "StreamingWriter",
+    "StringIOHandler",
     "StringWriter",
+    "Subject",
+    "ThreadPoolScheduler",
     "Unit",
+    "VirtualTimeScheduler",
+    "WriteFile",
     "Writer",
+    "append_file",
     "compose",
     "do",
     "fmap",
@@ -63,7 +106,14 @@ __all__ = [
     "identity",
     "indent",
     "let",
+    "mmap_file",
     "monadic_compose",
     "put_line",
+    "read_binary_chunks",
+    "read_binary_lines",
+    "read_chunks",
     "read_file",
+    "read_lines",
+    "write_file",
+    "write_lines",
 ]
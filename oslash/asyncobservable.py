@@ -0,0 +1,311 @@
+"""The Async Observable Monad.
+
+An Observable for asyncio, where the callbacks, mappers and predicates
+may be coroutine functions, and producers await their consumers instead
+of blocking the event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable, Iterable
+from typing import Any
+
+from .observable import Disposable
+from .typing import Functor, Monad
+
+type Callback[T] = Callable[[T], Awaitable[None] | None]
+
+
+async def _resolve[T](value: T | Awaitable[T]) -> T:
+    """Await value if it's awaitable."""
+    if inspect.isawaitable(value):
+        return await value
+    return value
+
+
+class AsyncObserver[T]:
+    """The Observer of an AsyncObservable.
+
+    Same as Observer, except that the notifications are coroutines, and
+    the callbacks may be either plain or coroutine functions.
+    """
+
+    def __init__(
+        self,
+        on_next: Callback[T] | None = None,
+        on_error: Callback[Exception] | None = None,
+        on_completed: Callable[[], Awaitable[None] | None] | None = None,
+        disposable: Disposable | None = None,
+    ) -> None:
+        self._on_next = on_next
+        self._on_error = on_error
+        self._on_completed = on_completed
+        self._owner = disposable is None
+        self.disposable = disposable or Disposable()
+        self._stopped = False
+
+    @property
+    def is_stopped(self) -> bool:
+        """True if producers should stop sending values."""
+        return self._stopped or self.disposable.is_disposed
+
+    async def on_next(self, value: T) -> None:
+        if not self.is_stopped and self._on_next:
+            await _resolve(self._on_next(value))
+
+    async def on_error(self, error: Exception) -> None:
+        if self.is_stopped:
+            return
+
+        self._stopped = True
+        try:
+            if self._on_error is None:
+                raise error
+            await _resolve(self._on_error(error))
+        finally:
+            if self._owner:
+                self.disposable.dispose()
+
+    async def on_completed(self) -> None:
+        if self.is_stopped:
+            return
+
+        self._stopped = True
+        try:
+            if self._on_completed:
+                await _resolve(self._on_completed())
+        finally:
+            if self._owner:
+                self.disposable.dispose()
+
+
+class AsyncObservable[T]:
+    """The Async Observable Monad.
+
+    Subscribing runs the producer as a coroutine, and awaits each
+    notification, so a slow consumer holds back the producer without
+    blocking the event loop.
+    """
+
+    def __init__(self, subscribe: Callable[[AsyncObserver[T]], Awaitable[None]]) -> None:
+        """AsyncObservable constructor.
+
+        Args:
+            subscribe: A coroutine function that takes an async observer
+        """
+        self._subscribe = subscribe
+
+    @classmethod
+    def unit(cls, x: T) -> AsyncObservable[T]:
+        """x -> AsyncObservable x"""
+
+        async def subscribe(observer: AsyncObserver[T]) -> None:
+            await observer.on_next(x)
+            await observer.on_completed()
+
+        return cls(subscribe)
+
+    @classmethod
+    def just(cls, x: T) -> AsyncObservable[T]:
+        """Alias for unit."""
+        return cls.unit(x)
+
+    @classmethod
+    def from_iterable(cls, iterable: Iterable[T]) -> AsyncObservable[T]:
+        """Create async observable that emits the values of the iterable."""
+
+        async def subscribe(observer: AsyncObserver[T]) -> None:
+            for x in iterable:
+                if observer.is_stopped:
+                    return
+                await observer.on_next(x)
+            await observer.on_completed()
+
+        return cls(subscribe)
+
+    @classmethod
+    def from_async_iterable(cls, iterable: AsyncIterable[T]) -> AsyncObservable[T]:
+        """Create async observable that emits the values of the async iterable."""
+
+        async def subscribe(observer: AsyncObserver[T]) -> None:
+            async for x in iterable:
+                if observer.is_stopped:
+                    return
+                await observer.on_next(x)
+            await observer.on_completed()
+
+        return cls(subscribe)
+
+    def map[U](self, mapper: Callable[[T], U | Awaitable[U]]) -> AsyncObservable[U]:
+        """Map a plain or coroutine function over the async observable."""
+        source = self
+
+        async def subscribe(observer: AsyncObserver[U]) -> None:
+            async def on_next(x: T) -> None:
+                try:
+                    value = await _resolve(mapper(x))
+                except Exception as error:
+                    await observer.on_error(error)
+                else:
+                    await observer.on_next(value)
+
+            await source.subscribe(
+                AsyncObserver(on_next, observer.on_error, observer.on_completed, observer.disposable)
+            )
+
+        return AsyncObservable(subscribe)
+
+    def bind[U](self, fn: Callable[[T], AsyncObservable[U]], max_concurrency: int | None = None) -> AsyncObservable[U]:
+        """Merge the async observables returned by fn.
+
+        The inner observables run concurrently, and their values are
+        emitted as they arrive. With max_concurrency, the source is held
+        back while that many inner observables are running. Completes
+        when the source and all the inner observables have completed.
+        """
+        source = self
+
+        async def subscribe(observer: AsyncObserver[U]) -> None:
+            semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+            errors: list[Exception] = []
+
+            async def on_error(error: Exception) -> None:
+                # Raised by observers without on_error. Kept to raise
+                # after the inner observables are done, instead of as
+                # part of an exception group
+                try:
+                    await observer.on_error(error)
+                except Exception:
+                    errors.append(error)
+
+            async def run(inner: AsyncObservable[U]) -> None:
+                try:
+                    await inner.subscribe(AsyncObserver(observer.on_next, on_error, None, observer.disposable))
+                except Exception:
+                    # Errors after the observer stopped have nowhere to go
+                    if not observer.is_stopped:
+                        raise
+                finally:
+                    if semaphore:
+                        semaphore.release()
+
+            async with asyncio.TaskGroup() as tasks:
+
+                async def on_next(x: T) -> None:
+                    if semaphore:
+                        await semaphore.acquire()
+                    try:
+                        inner = fn(x)
+                    except Exception as error:
+                        if semaphore:
+                            semaphore.release()
+                        await on_error(error)
+                    else:
+                        tasks.create_task(run(inner))
+
+                try:
+                    await source.subscribe(AsyncObserver(on_next, on_error, None, observer.disposable))
+                except Exception:
+                    if not observer.is_stopped:
+                        raise
+
+            if errors:
+                raise errors[0]
+            await observer.on_completed()
+
+        return AsyncObservable(subscribe)
+
+    flat_map = bind
+
+    def filter(self, predicate: Callable[[T], bool | Awaitable[bool]]) -> AsyncObservable[T]:
+        """Filter the async observable with a plain or coroutine predicate."""
+        source = self
+
+        async def subscribe(observer: AsyncObserver[T]) -> None:
+            async def on_next(x: T) -> None:
+                try:
+                    keep = await _resolve(predicate(x))
+                except Exception as error:
+                    await observer.on_error(error)
+                else:
+                    if keep:
+                        await observer.on_next(x)
+
+            await source.subscribe(
+                AsyncObserver(on_next, observer.on_error, observer.on_completed, observer.disposable)
+            )
+
+        return AsyncObservable(subscribe)
+
+    async def subscribe(
+        self,
+        on_next: Callback[T] | AsyncObserver[T] | None = None,
+        on_error: Callback[Exception] | None = None,
+        on_completed: Callable[[], Awaitable[None] | None] | None = None,
+    ) -> None:
+        """Subscribe to the async observable, and wait until it stops.
+
+        Takes either an async observer, or the callbacks. Without an
+        on_error callback, errors are raised. To unsubscribe, cancel
+        the task running the subscription.
+        """
+        observer: AsyncObserver[T]
+        if isinstance(on_next, AsyncObserver):
+            observer = on_next  # type: ignore[assignment]
+        else:
+            observer = AsyncObserver(on_next, on_error, on_completed)
+
+        try:
+            await self._subscribe(observer)
+        except Exception as error:
+            if observer.is_stopped:
+                raise
+            await observer.on_error(error)
+
+    async def to_async_iterator(self, maxsize: int = 0) -> AsyncIterator[T]:
+        """Iterate the values of the async observable.
+
+        The values are passed through a queue of at most maxsize
+        values, or unbounded for 0. A full queue holds back the
+        producer until the iterator catches up.
+        """
+        queue: asyncio.Queue[tuple[bool, Any]] = asyncio.Queue(maxsize)
+
+        async def on_next(x: T) -> None:
+            await queue.put((True, x))
+
+        async def on_error(error: Exception) -> None:
+            await queue.put((False, error))
+
+        async def on_completed() -> None:
+            await queue.put((False, None))
+
+        task = asyncio.create_task(self.subscribe(on_next, on_error, on_completed))
+        try:
+            while True:
+                is_value, value = await queue.get()
+                if is_value:
+                    yield value
+                elif value is None:
+                    return
+                else:
+                    raise value
+        finally:
+            task.cancel()
+
+    def __aiter__(self) -> AsyncIterator[T]:
+        return self.to_async_iterator()
+
+    def __or__[U](self, func: Callable[[T], AsyncObservable[U]]) -> AsyncObservable[U]:
+        """Use | as operator for bind.
+
+        Provide the | operator instead of the Haskell >>= operator
+        """
+        return self.bind(func)
+
+
+# Type assertions for runtime checking
+assert isinstance(AsyncObservable, Functor)
+assert isinstance(AsyncObservable, Monad)
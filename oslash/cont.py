@@ -7,20 +7,47 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Generator
+from typing import Any
 
 from .typing import Functor, Monad
-from .util import compose, identity  # type: ignore[attr-defined]
+from .util import identity
 
 # Type alias for continuation
 type Continuation[T, R] = Callable[[T], R]
 
 
+class _Bounce:
+    """A suspended call of a continuation.
+
+    The combinators of Cont return these instead of calling the next
+    continuation directly. The trampoline in Cont.run then makes the
+    calls from a loop, so deep chains of binds do not grow the stack.
+    """
+
+    __slots__ = ("arg", "fn")
+
+    def __init__(self, fn: Callable[[Any], Any], arg: Any) -> None:
+        self.fn = fn
+        self.arg = arg
+
+
+def _trampoline(result: Any) -> Any:
+    """Run bounces until we get the final result."""
+    while type(result) is _Bounce:
+        result = result.fn(result.arg)
+    return result
+
+
 class Cont[T, R]:
     """The Continuation Monad.
 
     The Continuation monad represents suspended computations in continuation-
     passing style (CPS).
+
+    Continuations built with unit, map, bind and call_cc are run by a
+    trampoline, so they are stack-safe no matter how many steps they
+    chain together.
     """
 
     def __init__(self, comp: Callable[[Continuation[T, R]], R]) -> None:
@@ -29,7 +56,16 @@ class Cont[T, R]:
         Args:
             comp: A continuation-passing function
         """
-        self._comp = comp
+        # The continuation given to comp is trampolined to completion,
+        # so comp may use the result in any way it likes.
+        self._comp: Callable[[Continuation[T, Any]], Any] = lambda cont: comp(lambda a: _trampoline(cont(a)))
+
+    @staticmethod
+    def _from_step[T2](step: Callable[[Continuation[T2, Any]], Any]) -> Cont[T2, Any]:
+        """Create continuation from a function that may return bounces."""
+        cont: Cont[T2, Any] = object.__new__(Cont)  # type: ignore[assignment]
+        cont._comp = step
+        return cont
 
     @classmethod
     def unit(cls, value: T) -> Cont[T, R]:
@@ -37,26 +73,33 @@ class Cont[T, R]:
 
         Haskell: a -> Cont a
         """
-        fn: Callable[[Continuation[T, R]], R] = lambda cont: cont(value)
-        return Cont(fn)
+        return Cont._from_step(lambda cont: cont(value))
 
     def map[U](self, fn: Callable[[T], U]) -> Cont[U, R]:
         r"""Map a function over a continuation.
 
         Haskell: fmap f m = Cont $ \c -> runCont m (c . f)
         """
+        comp = self._comp
 
-        def comp(cont: Callable[[U], R]) -> R:
-            return self.run(compose(cont, fn))
+        def step(cont: Continuation[U, Any]) -> Any:
+            k: Continuation[T, Any] = lambda a: _Bounce(cont, fn(a))
+            return _Bounce(comp, k)
 
-        return Cont(comp)
+        return Cont._from_step(step)
 
     def bind[U](self, fn: Callable[[T], Cont[U, R]]) -> Cont[U, R]:
         r"""Chain continuation passing functions.
 
         Haskell: m >>= k = Cont $ \c -> runCont m $ \a -> runCont (k a) c
         """
-        return Cont(lambda cont: self.run(lambda a: fn(a).run(cont)))
+        comp = self._comp
+
+        def step(cont: Continuation[U, Any]) -> Any:
+            k: Continuation[T, Any] = lambda a: _Bounce(fn(a)._comp, cont)
+            return _Bounce(comp, k)
+
+        return Cont._from_step(step)
 
     @staticmethod
     def call_cc[T2, U, R2](fn: Callable[[Callable[[T2], Cont[U, R2]]], Cont[T2, R2]]) -> Cont[T2, R2]:
@@ -64,11 +107,78 @@ class Cont[T, R]:
 
         Haskell: callCC f = Cont $ \c -> runCont (f (\a -> Cont $ \_ -> c a )) c
         """
-        return Cont(lambda c: fn(lambda a: Cont(lambda _: c(a))).run(c))  # type: ignore[arg-type]
+
+        def step(c: Continuation[T2, Any]) -> Any:
+            escape: Callable[[T2], Cont[U, R2]] = lambda a: Cont._from_step(lambda _: _Bounce(c, a))
+            return _Bounce(fn(escape)._comp, c)
+
+        return Cont._from_step(step)
+
+    @staticmethod
+    def reset[T2](m: Cont[T2, T2]) -> Cont[T2, Any]:
+        r"""Delimit the continuations captured by shift.
+
+        Haskell: reset m = Cont $ \c -> c (evalCont m)
+        """
+        return Cont._from_step(lambda c: _Bounce(c, m.run(identity)))
+
+    @staticmethod
+    def shift[T2, R2](fn: Callable[[Callable[[T2], R2]], Cont[R2, R2]]) -> Cont[T2, R2]:
+        r"""Capture the continuation up to the nearest reset.
+
+        Haskell: shift f = Cont $ \c -> evalCont (f c)
+
+        The captured continuation is a plain function that may be
+        called any number of times, or not at all to exit early.
+        """
+
+        def step(c: Continuation[T2, Any]) -> Any:
+            k: Callable[[T2], R2] = lambda a: _trampoline(c(a))
+            return _Bounce(fn(k)._comp, identity)
+
+        return Cont._from_step(step)
+
+    @staticmethod
+    def from_generator[T2, R2](fn: Callable[[], Generator[Cont[Any, R2], Any, T2]]) -> Cont[T2, R2]:
+        """Create continuation from a generator function.
+
+        The generator yields continuations and is sent back their
+        results, and its return value is the result of the continuation.
+        Binding is thus replaced by resuming the generator, which is a
+        single frame switch instead of a tower of nested closures.
+
+        Since a generator can only be resumed once from each yield, the
+        continuations captured with shift or call_cc from within it are
+        one-shot. Resuming the same one twice raises ValueError.
+        """
+
+        def step(cont: Continuation[T2, Any]) -> Any:
+            gen = fn()
+
+            def advance(value: Any) -> Any:
+                try:
+                    m = gen.send(value)
+                except StopIteration as stop:
+                    return _Bounce(cont, stop.value)
+
+                resumed = False
+
+                def resume(value: Any) -> Any:
+                    nonlocal resumed
+                    if resumed:
+                        raise ValueError("Continuation of a generator can only be resumed once")
+                    resumed = True
+                    return advance(value)
+
+                return _Bounce(m._comp, resume)
+
+            return advance(None)
+
+        return Cont._from_step(step)
 
     def run(self, cont: Callable[[T], R]) -> R:
         """Run the continuation with the given continuation function."""
-        return self._comp(cont)
+        return _trampoline(self._comp(cont))
 
     def __or__[U](self, func: Callable[[T], Cont[U, R]]) -> Cont[U, R]:
         """Use | as operator for bind.
@@ -6,11 +6,26 @@ while maintaining functional purity through the IO monad.
 
 from __future__ import annotations
 
+import asyncio
+import contextvars
+import mmap
+import os
+import subprocess
+import threading
 from abc import abstractmethod
-from collections.abc import Callable
-
+from collections import Counter
+from collections.abc import Awaitable, Callable, Generator, Iterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager, contextmanager
+from functools import partial
+from io import StringIO
+from subprocess import CompletedProcess
+from types import TracebackType
+from typing import Any, NamedTuple, Self
+
+from .iohandler import current_handler
 from .typing import Functor, Monad
-from .util import Unit
+from .util import Unit, compose, identity
 from .util import indent as ind
 
 
@@ -28,20 +43,65 @@ class IO[T]:
         """Wrap a value in an IO action."""
         return Return(value)
 
-    @abstractmethod
+    @staticmethod
+    def sequence[U](ios: Iterable[IO[U]]) -> IO[list[U]]:
+        """Run IO actions one after another, and return the list of
+        their results.
+
+        Haskell: sequence :: [IO a] -> IO [a]
+        """
+        return Traverse(ios, identity, Return)
+
+    @staticmethod
+    def traverse[S, U](items: Iterable[S], fn: Callable[[S], IO[U]]) -> IO[list[U]]:
+        """Run the IO action of each item one after another, and return
+        the list of their results.
+
+        Haskell: traverse :: (a -> IO b) -> [a] -> IO [b]
+        """
+        return Traverse(items, fn, Return)
+
+    @staticmethod
+    def par_traverse[S, U](items: Iterable[S], fn: Callable[[S], IO[U]], max_workers: int | None = None) -> IO[list[U]]:
+        """Run the IO action of each item concurrently, at most
+        max_workers at a time, and return the list of their results,
+        in the order of the items.
+        """
+        return Par([fn(item) for item in items], Return, max_workers)
+
     def bind[U](self, func: Callable[[T], IO[U]]) -> IO[U]:
-        """IO a -> (a -> IO b) -> IO b."""
-        raise NotImplementedError
+        """IO a -> (a -> IO b) -> IO b.
+
+        Binding only records the function in a Bind node, so a chain of
+        binds is built in linear time, and is left to run to unfold.
+        """
+        return Bind(self, func)
 
-    @abstractmethod
     def map[U](self, func: Callable[[T], U]) -> IO[U]:
-        """Map a function over an IO action."""
-        raise NotImplementedError
+        """Map a function over an IO action.
+
+        Mapping only records the function in a Map node. Chains of maps
+        are applied without any intermediate IO actions when run, and
+        optimize fuses them into one function.
+        """
+        return Map(self, func)
 
-    @abstractmethod
     def run(self, world: int) -> T:
-        """Run IO action."""
-        raise NotImplementedError
+        """Run IO action.
+
+        The actions are interpreted in a loop with an explicit stack of
+        continuations, so running takes constant Python stack however
+        long the program is.
+        """
+        return _interpret(optimize(self), world)
+
+    async def run_async(self, world: int = 0) -> T:
+        """Run IO action on asyncio.
+
+        Same as run, except that the actions that interact with the
+        world are awaited, so the waits of concurrent actions overlap.
+        """
+        return await _interpret_async(optimize(self), world)
 
     def __or__[U](self, func: Callable[[T], IO[U]]) -> IO[U]:
         """Use | as operator for bind.
@@ -65,9 +125,9 @@ class IO[T]:
         """Run io action."""
         return self.run(world)
 
-    @abstractmethod
-    def __str__(self, m: int = 0, n: int = 0) -> str:
-        raise NotImplementedError
+    def __str__(self) -> str:
+        """Render the tree of IO actions, see pretty."""
+        return pretty(self)
 
     def __repr__(self) -> str:
         return self.__str__()
@@ -92,8 +152,26 @@ class Return[T](IO[T]):
         """Run IO action."""
         return self._value
 
-    def __str__(self, m: int = 0, n: int = 0) -> str:
-        return f"{ind(m)}Return {self._value}"
+
+class Effect[T](IO[T]):
+    """Base class for the IO Actions that interact with the world, and
+    then continue with another IO Action.
+    """
+
+    @abstractmethod
+    def perform(self, world: int) -> tuple[int, IO[T]]:
+        """Interact with the world.
+
+        Returns the new world, and the IO Action to continue with.
+        """
+        raise NotImplementedError
+
+    async def perform_async(self, world: int) -> tuple[int, IO[T]]:
+        """Interact with the world without blocking the event loop.
+
+        Runs perform in a worker thread, unless overridden.
+        """
+        return await asyncio.to_thread(self.perform, world)
 
 
 class Put[T](IO[T]):
@@ -106,102 +184,737 @@ class Put[T](IO[T]):
     def __init__(self, text: str, io: IO[T]) -> None:
         self._value: tuple[str, IO[T]] = (text, io)
 
-    def bind[U](self, func: Callable[[T], IO[U]]) -> IO[U]:
-        """IO a -> (a -> IO b) -> IO b"""
-        text, io = self._value
-        return Put(text, io.bind(func))
 
-    def map[U](self, func: Callable[[T], U]) -> IO[U]:
-        """Put s (fmap f io)"""
-        text, action = self._value
-        return Put(text, action.map(func))
+class Get[T](Effect[T]):
+    """A container holding a function from string -> IO[T], which can
+    be applied to whatever string is read from stdin.
+    """
 
-    def run(self, world: int) -> T:
-        """Run IO action"""
-        text, action = self._value
-        new_world = pure_print(world, text)
-        return action(world=new_world)
+    def __init__(self, fn: Callable[[str], IO[T]]) -> None:
+        self._fn = fn
+
+    def perform(self, world: int) -> tuple[int, IO[T]]:
+        new_world, text = pure_input(world)
+        return new_world, self._fn(text)
 
-    def __call__(self, world: int = 0) -> T:
-        return self.run(world)
 
-    def __str__(self, m: int = 0, n: int = 0) -> str:
-        s, io = self._value
-        a = io.__str__(m + 1, n)
-        return f'{ind(m)}Put ("{s}",\n{a}\n{ind(m)})'
+class ReadFile[T](Effect[T]):
+    """A container holding a filename and a function from string -> IO[T],
+    which can be applied to whatever string is read from the file.
+    """
 
+    def __init__(self, filename: str, func: Callable[[str], IO[T]]) -> None:
+        self._value: tuple[str, Callable[[str], IO[T]]] = (filename, func)
 
-class Get[T](IO[T]):
-    """A container holding a function from string -> IO[T], which can
-    be applied to whatever string is read from stdin.
+    def perform(self, world: int) -> tuple[int, IO[T]]:
+        filename, func = self._value
+        return world + 1, func(current_handler().read_file(filename))
+
+
+class ReadStream[S, T](Effect[T]):
+    """A container holding a filename, a function that opens the file as
+    a stream of type S, and a function from S -> IO[T], which can be
+    applied to the stream.
+
+    The stream is read lazily, so a file can be folded over in bounded
+    memory.
     """
 
-    def __init__(self, fn: Callable[[str], IO[T]]) -> None:
-        self._fn = fn
+    def __init__(self, filename: str, opener: Callable[[str], S], func: Callable[[S], IO[T]]) -> None:
+        self._value: tuple[str, Callable[[str], S], Callable[[S], IO[T]]] = (filename, opener, func)
 
-    def bind[U](self, func: Callable[[T], IO[U]]) -> IO[U]:
-        """IO a -> (a -> IO b) -> IO b"""
-        g = self._fn
-        return Get(lambda text: g(text).bind(func))
+    def perform(self, world: int) -> tuple[int, IO[T]]:
+        filename, opener, func = self._value
+        return world + 1, func(opener(filename))
 
-    def map[U](self, func: Callable[[T], U]) -> IO[U]:
-        r"""Get (\s -> fmap f (g s))"""
-        g = self._fn
-        return Get(lambda s: g(s).map(func))
 
-    def run(self, world: int) -> T:
-        """Run IO Action"""
-        func = self._fn
-        new_world, text = pure_input(world)
-        action = func(text)
-        return action(world=new_world)
+class WriteFile[T](Effect[T]):
+    """A container holding a filename and the text to write to it,
+    followed by another IO Action.
 
-    def __call__(self, world: int = 0) -> T:
-        return self.run(world)
+    The text is either a string, or an iterable of strings that is
+    written as it's consumed, so output can be streamed from a lazy
+    source. If atomic, the text is written to a temporary file that
+    replaces the file once complete, so readers never see a partly
+    written file.
+    """
 
-    def __str__(self, m: int = 0, n: int = 0) -> str:
-        g = self._fn
-        i = f"x{n}"
-        a = g(i).__str__(m + 1, n + 1)
-        return f"{ind(m)}Get ({i} => \n{a}\n{ind(m)})"
+    mode = "w"
 
+    def __init__(
+        self, filename: str, text: str | Iterable[str], io: IO[T], buffer_size: int = -1, atomic: bool = False
+    ) -> None:
+        self._value: tuple[str, str | Iterable[str], IO[T]] = (filename, text, io)
+        self.buffer_size = buffer_size
+        self.atomic = atomic
 
-class ReadFile(IO[str]):
-    """A container holding a filename and a function from string -> IO[str],
-    which can be applied to whatever string is read from the file.
+    def perform(self, world: int) -> tuple[int, IO[T]]:
+        filename, text, io = self._value
+        chunks = [text] if isinstance(text, str) else text
+        current_handler().write_file(filename, chunks, self.mode, self.buffer_size, self.atomic)
+        return world + 1, io
+
+
+class AppendFile[T](WriteFile[T]):
+    """A container holding a filename and the text to append to it,
+    followed by another IO Action.
     """
 
-    def __init__(self, filename: str, func: Callable[[str], IO[str]]) -> None:
-        self.open_func = open
-        self._value: tuple[str, Callable[[str], IO[str]]] = (filename, func)
+    mode = "a"
 
-    def bind[U](self, func: Callable[[str], IO[U]]) -> IO[U]:
-        """IO a -> (a -> IO b) -> IO b"""
-        filename, g = self._value
-        # IO: Flexible IO type for file reading
-        return ReadFile(filename, lambda s: g(s).bind(func))  # type: ignore
+    def __init__(
+        self, filename: str, text: str | Iterable[str], io: IO[T], buffer_size: int = -1, atomic: bool = False
+    ) -> None:
+        if atomic:
+            raise ValueError("Appending to a file can't be atomic")
+        super().__init__(filename, text, io, buffer_size)
 
-    def map[U](self, func: Callable[[str], U]) -> IO[U]:
-        r"""Get (\s -> fmap f (g s))"""
-        _, g = self._value
-        # IO: Flexible IO type for file reading
-        return Get(lambda s: g(s).map(func))  # type: ignore
 
-    def run(self, world: int) -> str:
-        """Run IO Action"""
-        filename, func = self._value
-        with self.open_func(filename) as f:
-            action = func(f.read())
-        return action(world=world + 1)
+class Par[T](Effect[T]):
+    """A container holding IO Actions to run concurrently, and a function
+    from the list of their results -> IO[T].
+
+    The actions run on threads, or as tasks when run on asyncio. At
+    most max_workers of them run at the same time, if given.
+    """
+
+    def __init__(
+        self, ios: Sequence[IO[Any]], func: Callable[[list[Any]], IO[T]], max_workers: int | None = None
+    ) -> None:
+        self._value: tuple[Sequence[IO[Any]], Callable[[list[Any]], IO[T]]] = (ios, func)
+        self.max_workers = max_workers
+
+    def perform(self, world: int) -> tuple[int, IO[T]]:
+        ios, func = self._value
+        workers = min(len(ios), self.max_workers or len(ios))
+        if workers < 2:
+            return world + 1, func([_interpret(io, world) for io in ios])
+
+        with ThreadPoolExecutor(workers) as executor:
+            # Each action runs with the handler of this one
+            futures = [executor.submit(contextvars.copy_context().run, _interpret, io, world) for io in ios]
+            values: list[Any] = [future.result() for future in futures]
+        return world + 1, func(values)
+
+    async def perform_async(self, world: int) -> tuple[int, IO[T]]:
+        ios, func = self._value
+        if self.max_workers is None:
+            values = await asyncio.gather(*(_interpret_async(io, world) for io in ios))
+            return world + 1, func(list(values))
+
+        semaphore = asyncio.Semaphore(self.max_workers)
+
+        async def run(io: IO[Any]) -> Any:
+            async with semaphore:
+                return await _interpret_async(io, world)
+
+        values = await asyncio.gather(*(run(io) for io in ios))
+        return world + 1, func(list(values))
 
-    def __call__(self, world: int = 0) -> str:
-        return self.run(world)
 
-    def __str__(self, m: int = 0, n: int = 0) -> str:
-        filename, g = self._value
-        i = f"x{n}"
-        a = g(i).__str__(m + 2, n + 1)
-        return f'{ind(m)}ReadFile ("{filename}",{i} => \n{a}\n{ind(m)})'
+class Traverse[S, T](Effect[T]):
+    """A container holding items, a function from an item -> IO action,
+    and a function from the list of the results of the actions -> IO[T].
+
+    The actions are made from the items when run, and run one after
+    another, without nesting a Bind for each of them.
+    """
+
+    def __init__(self, items: Iterable[S], fn: Callable[[S], IO[Any]], func: Callable[[list[Any]], IO[T]]) -> None:
+        self._value: tuple[tuple[S, ...], Callable[[S], IO[Any]], Callable[[list[Any]], IO[T]]] = (
+            tuple(items),
+            fn,
+            func,
+        )
+
+    def perform(self, world: int) -> tuple[int, IO[T]]:
+        items, fn, func = self._value
+        return world + 1, func([_interpret(fn(item), world) for item in items])
+
+    async def perform_async(self, world: int) -> tuple[int, IO[T]]:
+        items, fn, func = self._value
+        return world + 1, func([await _interpret_async(fn(item), world) for item in items])
+
+
+class Subprocess[T](Effect[T]):
+    """A container holding a command, and a function from the completed
+    process -> IO[T].
+
+    The output of the command is captured as text.
+    """
+
+    def __init__(
+        self, args: Sequence[str], func: Callable[[CompletedProcess[str]], IO[T]], input: str | None = None
+    ) -> None:
+        self._value: tuple[Sequence[str], Callable[[CompletedProcess[str]], IO[T]]] = (args, func)
+        self.input = input
+
+    def perform(self, world: int) -> tuple[int, IO[T]]:
+        args, func = self._value
+        process = subprocess.run(args, input=self.input, capture_output=True, text=True, check=False)
+        return world + 1, func(process)
+
+    async def perform_async(self, world: int) -> tuple[int, IO[T]]:
+        args, func = self._value
+        process = await asyncio.create_subprocess_exec(
+            *args,
+            stdin=subprocess.PIPE if self.input is not None else None,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        stdout, stderr = await process.communicate(None if self.input is None else self.input.encode())
+        returncode = process.returncode if process.returncode is not None else -1
+        return world + 1, func(CompletedProcess(args, returncode, stdout.decode(), stderr.decode()))
+
+
+class Await[S, T](Effect[T]):
+    """A container holding a coroutine function, e.g. for network IO,
+    and a function from its result -> IO[T].
+
+    Run without asyncio, the coroutine gets an event loop of its own.
+    """
+
+    def __init__(self, fn: Callable[[], Awaitable[S]], func: Callable[[S], IO[T]]) -> None:
+        self._value: tuple[Callable[[], Awaitable[S]], Callable[[S], IO[T]]] = (fn, func)
+
+    def perform(self, world: int) -> tuple[int, IO[T]]:
+        fn, func = self._value
+
+        async def main() -> S:
+            return await fn()
+
+        return world + 1, func(asyncio.run(main()))
+
+    async def perform_async(self, world: int) -> tuple[int, IO[T]]:
+        fn, func = self._value
+        return world + 1, func(await fn())
+
+
+class Bracket[R, S, T](Effect[T]):
+    """A container holding an IO action that acquires a resource, a
+    function from the resource -> IO[S] that uses it, a function from
+    the resource -> IO action that releases it, and a function from the
+    result of using it -> IO[T].
+
+    The resource is released after use, also when using it raises.
+    """
+
+    def __init__(
+        self,
+        acquire: IO[R],
+        use: Callable[[R], IO[S]],
+        release: Callable[[R], IO[Any]],
+        func: Callable[[S], IO[T]],
+    ) -> None:
+        self._value: tuple[IO[R], Callable[[R], IO[S]], Callable[[R], IO[Any]], Callable[[S], IO[T]]] = (
+            acquire,
+            use,
+            release,
+            func,
+        )
+
+    def perform(self, world: int) -> tuple[int, IO[T]]:
+        acquire, use, release, func = self._value
+        resource = _interpret(acquire, world)
+        try:
+            value = _interpret(use(resource), world + 1)
+        finally:
+            _interpret(release(resource), world + 1)
+        return world + 1, func(value)
+
+    async def perform_async(self, world: int) -> tuple[int, IO[T]]:
+        acquire, use, release, func = self._value
+        resource = await _interpret_async(acquire, world)
+        try:
+            value = await _interpret_async(use(resource), world + 1)
+        finally:
+            await _interpret_async(release(resource), world + 1)
+        return world + 1, func(value)
+
+
+class WithResource[R, S, T](Effect[T]):
+    """A container holding a function that returns a context manager, a
+    function from the resource it manages -> IO[S], and a function from
+    the result of using it -> IO[T].
+
+    The IO action using the resource runs inside the with block, so an
+    error is seen by the context manager. As there is no value to go on
+    with, a context manager that suppresses the error gives a
+    RuntimeError instead.
+    """
+
+    def __init__(
+        self,
+        manager: Callable[[], AbstractContextManager[R]],
+        use: Callable[[R], IO[S]],
+        func: Callable[[S], IO[T]],
+    ) -> None:
+        self._value: tuple[Callable[[], AbstractContextManager[R]], Callable[[R], IO[S]], Callable[[S], IO[T]]] = (
+            manager,
+            use,
+            func,
+        )
+
+    def perform(self, world: int) -> tuple[int, IO[T]]:
+        manager, use, func = self._value
+        values: list[S] = []
+        with manager() as resource:
+            values.append(_interpret(use(resource), world))
+        if not values:
+            raise RuntimeError("The context manager suppressed the error of the action using its resource")
+        return world + 1, func(values[0])
+
+    async def perform_async(self, world: int) -> tuple[int, IO[T]]:
+        manager, use, func = self._value
+        values: list[S] = []
+        with manager() as resource:
+            values.append(await _interpret_async(use(resource), world))
+        if not values:
+            raise RuntimeError("The context manager suppressed the error of the action using its resource")
+        return world + 1, func(values[0])
+
+
+class ResourcePool[R]:
+    """A pool of resources, e.g. open files or connections, to reuse
+    across IO actions instead of opening them for each one.
+
+    Resources are created when none is idle. After use, a resource goes
+    back to the pool, or is closed if max_size resources are idle, or
+    if using it raised. The pool is thread safe, so it can be used by
+    the actions of Par.
+
+        with ResourcePool(connect, close=lambda c: c.close()) as pool:
+            action = pool.use(lambda c: query(c, "..."))
+    """
+
+    def __init__(self, create: Callable[[], R], close: Callable[[R], object] | None = None, max_size: int = 8) -> None:
+        self.create = create
+        self.close_func = close
+        self.max_size = max_size
+        self._idle: list[R] = []
+        self._lock = threading.Lock()
+
+    def acquire(self) -> R:
+        """Take an idle resource, or create one."""
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        return self.create()
+
+    def release(self, resource: R) -> None:
+        """Return a resource to the pool."""
+        with self._lock:
+            if len(self._idle) < self.max_size:
+                self._idle.append(resource)
+                return
+        self._close(resource)
+
+    @contextmanager
+    def lease(self) -> Generator[R]:
+        """Acquire a resource for a with block.
+
+        The resource is closed instead of released if the block raises.
+        """
+        resource = self.acquire()
+        try:
+            yield resource
+        except BaseException:
+            self._close(resource)
+            raise
+        self.release(resource)
+
+    def use[T](self, func: Callable[[R], IO[T]]) -> IO[T]:
+        """An IO action using a resource of the pool."""
+        return WithResource(self.lease, func, Return)
+
+    def close(self) -> None:
+        """Close the idle resources."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for resource in idle:
+            self._close(resource)
+
+    def _close(self, resource: R) -> None:
+        if self.close_func is not None:
+            self.close_func(resource)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        self.close()
+
+
+class Bind[T, U](IO[U]):
+    """An IO action followed by a function of its result, that returns
+    the IO action to continue with.
+    """
+
+    def __init__(self, io: IO[T], func: Callable[[T], IO[U]]) -> None:
+        self._value: tuple[IO[T], Callable[[T], IO[U]]] = (io, func)
+
+
+class Map[T, U](IO[U]):
+    """An IO action followed by a function of its result."""
+
+    def __init__(self, io: IO[T], func: Callable[[T], U]) -> None:
+        self._value: tuple[IO[T], Callable[[T], U]] = (io, func)
+
+
+class Flush[T](IO[T]):
+    """The Flush action.
+
+    Prints the buffered output of the Put actions before it, followed
+    by another IO Action.
+    """
+
+    def __init__(self, io: IO[T]) -> None:
+        self._io = io
+
+
+output_buffer_size = 64 * 1024
+"""Characters of Put output to buffer before printing. 0 prints every Put at once."""
+
+
+class _Output:
+    """The output of the Put actions not printed yet."""
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self.lines: list[str] = []
+        self.size = 0
+
+    def put(self, world: int, text: str) -> int:
+        if self.limit <= 0:
+            return pure_print(world, text)
+
+        self.lines.append(text)
+        self.size += len(text) + 1
+        if self.size >= self.limit:
+            return self.flush(world)
+        return world
+
+    def flush(self, world: int) -> int:
+        if not self.lines:
+            return world
+
+        text = "\n".join(self.lines)
+        self.lines.clear()
+        self.size = 0
+        return pure_print(world, text)
+
+
+def _interpret(io: IO[Any], world: int) -> Any:
+    """Run the IO action io, starting in world.
+
+    Bind and Map push their function on the stack of continuations, and
+    run their action. When an action returns a value, the continuations
+    are popped and applied to the value, until the stack is empty.
+
+    The output of consecutive Put actions is buffered, and printed in
+    one go before any other interaction with the world, when
+    output_buffer_size is reached, and when the program ends.
+    """
+    stack: list[tuple[Callable[[Any], Any], bool]] = []
+    output = _Output(output_buffer_size)
+    try:
+        while True:
+            match io:
+                case Bind():
+                    io, func = io._value  # type: ignore[misc]
+                    stack.append((func, True))  # type: ignore[arg-type]
+                    continue
+                case Map():
+                    io, func = io._value  # type: ignore[misc]
+                    stack.append((func, False))  # type: ignore[arg-type]
+                    continue
+                case Put():
+                    text, io = io._value  # type: ignore[misc]
+                    world = output.put(world, text)
+                    continue
+                case Flush():
+                    world = pure_flush(output.flush(world))
+                    io = io._io  # type: ignore
+                    continue
+                case Effect():
+                    world, io = io.perform(output.flush(world))  # type: ignore
+                    continue
+                case Return():
+                    value = io._value  # type: ignore
+                case _:
+                    world = output.flush(world)
+                    value = io.run(world)
+                    world += 1
+
+            next_io, value = _resume(stack, value)
+            if next_io is None:
+                return value
+            io = next_io
+    finally:
+        output.flush(world)
+
+
+def _resume(stack: list[tuple[Callable[[Any], Any], bool]], value: Any) -> tuple[IO[Any] | None, Any]:
+    """Apply the map functions on top of the stack to value, up to the
+    next bind function, and return the IO action that it returns.
+
+    Returns None and the final value once the stack is empty.
+    """
+    while stack:
+        func, is_bind = stack.pop()
+        if is_bind:
+            return func(value), None
+        value = func(value)
+    return None, value
+
+
+def optimize[T](io: IO[T]) -> IO[T]:
+    """Simplify an IO action before it runs.
+
+    The actions of Bind, Map, Put, Flush and WriteFile are known
+    before running, and form a chain that is rewritten from the end:
+
+    - Consecutive maps are fused into one function, also across Put,
+      Flush and WriteFile
+    - Maps and binds of a Return are applied at once, if nothing runs
+      before them, i.e. no Put, Flush or WriteFile is above them
+    - Binds to Return, and maps of identity, are removed
+
+    The actions returned by bind functions are only known when run,
+    and are not optimized.
+    """
+    chain: list[IO[Any]] = []
+    node: IO[Any] = io
+    while True:
+        match node:
+            case Bind() | Map() | Put() | WriteFile():
+                chain.append(node)  # type: ignore
+                node = node._value[-1] if isinstance(node, Put | WriteFile) else node._value[0]  # type: ignore
+            case Flush():
+                chain.append(node)
+                node = node._io  # type: ignore
+            case _:
+                break
+
+    # The effects of Put, Flush and WriteFile run before the actions
+    # below them, so functions below the first one are not applied early
+    head = next((i for i, parent in enumerate(chain) if isinstance(parent, Put | Flush | WriteFile)), len(chain))
+    funcs: list[Callable[[Any], Any]] = []
+    for i in reversed(range(len(chain))):
+        parent = chain[i]
+        if isinstance(parent, Map):
+            func: Callable[[Any], Any] = parent._value[1]  # type: ignore
+            if func is not identity:
+                funcs.append(func)
+        elif isinstance(parent, Bind):
+            node = _rebind(parent, _fuse_maps(node, funcs, i < head), i < head)  # type: ignore
+            funcs = []
+        else:
+            # Put, Flush and WriteFile return the result of their next
+            # action, so maps move up past them to fuse with the maps above
+            node = _rebuild(parent, node)
+    return _fuse_maps(node, funcs, True)
+
+
+def _fuse_maps(io: IO[Any], funcs: list[Callable[[Any], Any]], fold: bool) -> IO[Any]:
+    """Map the functions, first to last, over io, at once if fold and io
+    is a Return.
+    """
+    if not funcs:
+        return io
+    func = compose(*reversed(funcs))
+    if fold and isinstance(io, Return):
+        return Return(func(io._value))  # type: ignore
+    return Map(io, func)
+
+
+def _rebind(parent: Bind[Any, Any], child: IO[Any], fold: bool) -> IO[Any]:
+    """Replace the action of the bind parent with child, and bind at
+    once if fold and child is a Return.
+    """
+    old, func = parent._value  # type: ignore
+    if func is Return:
+        return child
+    if fold and isinstance(child, Return):
+        return func(child._value)  # type: ignore
+    return parent if child is old else Bind(child, func)
+
+
+def _rebuild(parent: IO[Any], child: IO[Any]) -> IO[Any]:
+    """Replace the next action of parent with child."""
+    match parent:
+        case Put():
+            text, old = parent._value  # type: ignore[misc]
+            return parent if child is old else Put(text, child)  # type: ignore
+        case WriteFile():
+            filename, text, old = parent._value  # type: ignore[misc]
+            if child is old:
+                return parent
+            return type(parent)(filename, text, child, parent.buffer_size, parent.atomic)  # type: ignore
+        case _:
+            return parent if child is parent._io else Flush(child)  # type: ignore
+
+
+def _name(obj: object) -> str:
+    return getattr(obj, "__name__", None) or repr(obj)
+
+
+def _parts(io: IO[Any]) -> tuple[str, Sequence[IO[Any]]]:
+    """The label of an IO action, and the actions that it contains."""
+    match io:
+        case Return():
+            label, children = f"Return {io._value}", ()  # type: ignore
+        case Put():
+            text, next_io = io._value  # type: ignore[misc]
+            label, children = f'Put ("{text}")', (next_io,)  # type: ignore
+        case Flush():
+            label, children = "Flush", (io._io,)  # type: ignore
+        case Bind() | Map():
+            next_io, func = io._value  # type: ignore[misc]
+            label, children = f"{type(io).__name__} ({_name(func)})", (next_io,)  # type: ignore
+        case WriteFile():
+            filename, text, next_io = io._value  # type: ignore[misc]
+            shown = f'"{text}"' if isinstance(text, str) else "..."
+            label, children = f'{type(io).__name__} ("{filename}", {shown})', (next_io,)  # type: ignore
+        case Traverse():
+            items, fn, _ = io._value  # type: ignore[misc]
+            label, children = f"Traverse ({len(items)}, {_name(fn)})", ()  # type: ignore
+        case Par():
+            ios, func = io._value  # type: ignore[misc]
+            label, children = f"Par ({_name(func)})", ios  # type: ignore
+        case Get():
+            label, children = f"Get ({_name(io._fn)})", ()  # type: ignore
+        case ReadFile() | ReadStream():
+            filename, *_, func = io._value  # type: ignore[misc]
+            label, children = f'{type(io).__name__} ("{filename}", {_name(func)})', ()  # type: ignore
+        case Bracket():
+            acquire, use, release, _ = io._value  # type: ignore[misc]
+            label, children = f"Bracket ({_name(use)}, {_name(release)})", (acquire,)  # type: ignore
+        case Subprocess() | Await() | WithResource():
+            fn, func, *_ = io._value  # type: ignore[misc]
+            shown = list(fn) if isinstance(io, Subprocess) else _name(fn)  # type: ignore
+            label, children = f"{type(io).__name__} ({shown}, {_name(func)})", ()  # type: ignore
+        case _:
+            label, children = type(io).__name__, ()
+    return label, children  # type: ignore
+
+
+def pretty(io: IO[Any], max_depth: int | None = None, max_width: int | None = None) -> str:
+    """Render the tree of an IO action, one action per line.
+
+    The functions of the actions are shown by name, and never called,
+    so only the actions known before running are shown. An action with
+    a single next action is followed by it on the same indentation, and
+    the actions of Par are listed below it, indented:
+
+        Par (<lambda>)
+          - Put ("a")
+            Return ()
+          - Get (Return)
+
+    Args:
+        io: The IO action to render
+        max_depth: The number of nested actions to show, or None for all
+        max_width: The number of actions of a Par to show, or None for all
+
+    Returns:
+        The rendered tree, in time linear in its size
+    """
+    out = StringIO()
+    # The action, its depth, its indentation level, and if it is listed
+    stack: list[tuple[IO[Any] | str, int, int, bool]] = [(io, 1, 0, False)]
+    while stack:
+        node, depth, level, listed = stack.pop()
+        out.write(ind(level) + "- " if listed else ind(level))
+        if isinstance(node, str):
+            out.write(f"{node}\n")
+            continue
+        if max_depth is not None and depth > max_depth:
+            out.write("...\n")
+            continue
+
+        label, children = _parts(node)
+        out.write(f"{label}\n")
+        level += listed
+        if len(children) == 1:
+            stack.append((children[0], depth + 1, level, False))
+            continue
+
+        shown = children if max_width is None else children[:max_width]
+        if len(shown) < len(children):
+            stack.append((f"... ({len(children) - len(shown)} more)", depth + 1, level + 1, True))
+        stack.extend((child, depth + 1, level + 1, True) for child in reversed(shown))
+    return out.getvalue().rstrip("\n")
+
+
+class IOStats(NamedTuple):
+    """The shape of the tree of an IO action."""
+
+    nodes: int
+    """The number of actions."""
+    depth: int
+    """The length of the longest path of nested actions."""
+    counts: dict[str, int]
+    """The number of actions of each type."""
+
+
+def io_stats(io: IO[Any]) -> IOStats:
+    """Count the actions in the tree of an IO action, without running it."""
+    counts: Counter[str] = Counter()
+    depth = 0
+    stack: list[tuple[IO[Any], int]] = [(io, 1)]
+    while stack:
+        node, node_depth = stack.pop()
+        counts[type(node).__name__] += 1
+        depth = max(depth, node_depth)
+        stack.extend((child, node_depth + 1) for child in _parts(node)[1])
+    return IOStats(counts.total(), depth, dict(counts))
+
+
+async def _interpret_async(io: IO[Any], world: int) -> Any:
+    """Run the IO action io on asyncio, starting in world.
+
+    Same as _interpret, except that effects are awaited.
+    """
+    stack: list[tuple[Callable[[Any], Any], bool]] = []
+    output = _Output(output_buffer_size)
+    try:
+        while True:
+            match io:
+                case Bind():
+                    io, func = io._value  # type: ignore[misc]
+                    stack.append((func, True))  # type: ignore[arg-type]
+                    continue
+                case Map():
+                    io, func = io._value  # type: ignore[misc]
+                    stack.append((func, False))  # type: ignore[arg-type]
+                    continue
+                case Put():
+                    text, io = io._value  # type: ignore[misc]
+                    world = output.put(world, text)
+                    continue
+                case Flush():
+                    world = pure_flush(output.flush(world))
+                    io = io._io  # type: ignore
+                    continue
+                case Effect():
+                    world, io = await io.perform_async(output.flush(world))  # type: ignore
+                    continue
+                case Return():
+                    value = io._value  # type: ignore
+                case _:
+                    world = output.flush(world)
+                    value = await asyncio.to_thread(io.run, world)
+                    world += 1
+
+            next_io, value = _resume(stack, value)
+            if next_io is None:
+                return value
+            io = next_io
+    finally:
+        output.flush(world)
 
 
 def get_line() -> IO[str]:
@@ -219,21 +932,173 @@ def read_file(filename: str) -> IO[str]:
     return ReadFile(filename, Return)
 
 
+def read_lines(filename: str) -> IO[Iterator[str]]:
+    """Read the lines of a file lazily.
+
+    The lines keep their line endings, and the file is closed when the
+    lines are exhausted.
+    """
+    return ReadStream(filename, partial(_open_lines, mode="r"), Return)
+
+
+def read_binary_lines(filename: str) -> IO[Iterator[bytes]]:
+    """Read the lines of a file lazily, as bytes."""
+    return ReadStream(filename, partial(_open_lines, mode="rb"), Return)
+
+
+def read_chunks(filename: str, size: int = 64 * 1024) -> IO[Iterator[str]]:
+    """Read a file lazily, in chunks of at most size characters."""
+    return ReadStream(filename, partial(_open_chunks, size=size, mode="r"), Return)
+
+
+def read_binary_chunks(filename: str, size: int = 64 * 1024) -> IO[Iterator[bytes]]:
+    """Read a file lazily, in chunks of at most size bytes."""
+    return ReadStream(filename, partial(_open_chunks, size=size, mode="rb"), Return)
+
+
+def mmap_file(filename: str) -> IO[memoryview]:
+    """Map a file into memory, read only.
+
+    The memoryview reads the pages of the file on demand without
+    copying them. The mapping is closed when the memoryview and its
+    slices are garbage collected.
+    """
+    return ReadStream(filename, _open_mmap, Return)
+
+
+class _Stream(Iterator[Any]):
+    """Iterate over a file by calling read until it returns nothing.
+
+    The stream owns the file, and closes it when exhausted, when
+    closed, or when garbage collected, also if it was never started.
+    """
+
+    def __init__(self, read: Callable[[], Any], close: Callable[[], None]) -> None:
+        self._read = read
+        self._close: Callable[[], None] | None = close
+
+    def __next__(self) -> Any:
+        if self._close is None:
+            raise StopIteration
+        if item := self._read():
+            return item
+        self.close()
+        raise StopIteration
+
+    def close(self) -> None:
+        """Close the file, ending the stream."""
+        close, self._close = self._close, None
+        if close is not None:
+            close()
+
+    def __del__(self) -> None:
+        self.close()
+
+
+def _open_lines(filename: str, mode: str) -> Iterator[Any]:
+    """Open the file now, so missing files fail when the action runs."""
+    f = current_handler().open(filename, mode)
+    return _Stream(f.readline, f.close)
+
+
+def _open_chunks(filename: str, size: int, mode: str) -> Iterator[Any]:
+    f = current_handler().open(filename, mode)
+    return _Stream(partial(f.read, size), f.close)
+
+
+def _open_mmap(filename: str) -> memoryview:
+    with current_handler().open(filename, "rb") as f:
+        try:
+            fileno = f.fileno()
+        except OSError:
+            # Files of in-memory handlers are read at once
+            return memoryview(f.read())
+        if os.fstat(fileno).st_size == 0:
+            # Empty files can't be mapped
+            return memoryview(b"")
+        return memoryview(mmap.mmap(fileno, 0, access=mmap.ACCESS_READ))
+
+
+def write_file(filename: str, text: str, buffer_size: int = -1, atomic: bool = False) -> IO[tuple[()]]:
+    """Write text to a file."""
+    return WriteFile(filename, text, Return(Unit), buffer_size, atomic)
+
+
+def append_file(filename: str, text: str, buffer_size: int = -1) -> IO[tuple[()]]:
+    """Append text to a file."""
+    return AppendFile(filename, text, Return(Unit), buffer_size)
+
+
+def write_lines(filename: str, lines: Iterable[str], buffer_size: int = -1, atomic: bool = False) -> IO[tuple[()]]:
+    """Write lines to a file, as they are consumed from lines.
+
+    Like writelines, no line endings are added, so the lines from
+    read_lines can be written back as they are.
+    """
+    return WriteFile(filename, lines, Return(Unit), buffer_size, atomic)
+
+
+def par(*ios: IO[Any]) -> IO[list[Any]]:
+    """Run IO actions concurrently, and return the list of their results."""
+    return Par(ios, Return)
+
+
+gather = par
+
+
+def run_process(*args: str, input: str | None = None) -> IO[CompletedProcess[str]]:
+    """Run a command, and return the completed process."""
+    return Subprocess(args, Return, input)
+
+
+def from_async[T](fn: Callable[[], Awaitable[T]]) -> IO[T]:
+    """Await the coroutine function fn, and return its result."""
+    return Await(fn, Return)
+
+
+def bracket[R, T](acquire: IO[R], use: Callable[[R], IO[T]], release: Callable[[R], IO[Any]]) -> IO[T]:
+    """Acquire a resource, use it, and release it, also on errors."""
+    return Bracket(acquire, use, release, Return)
+
+
+def with_resource[R, T](manager: Callable[[], AbstractContextManager[R]], use: Callable[[R], IO[T]]) -> IO[T]:
+    """Use the resource of a context manager, e.g. a file, in an IO action.
+
+    The context manager is created, and entered, each time the action
+    runs, so the action can be run more than once.
+    """
+    return WithResource(manager, use, Return)
+
+
+def flush() -> IO[tuple[()]]:
+    """Print the buffered output."""
+    return Flush(Return(Unit))
+
+
 def pure_print(world: int, text: str) -> int:
-    """Impure print function.
+    """Impure print function, printing with the current handler.
+
+    NOTE: If you see this line you need to wash your hands
+    """
+    current_handler().print(text)  # Impure side effect
+    return world + 1
+
+
+def pure_flush(world: int) -> int:
+    """Impure flush function, flushing the current handler.
 
     NOTE: If you see this line you need to wash your hands
     """
-    print(text)  # Impure side effect
+    current_handler().flush()  # Impure side effect
     return world + 1
 
 
 def pure_input(world: int) -> tuple[int, str]:
-    """Impure input function.
+    """Impure input function, reading from the current handler.
 
     NOTE: If you see this line you need to wash your hands
     """
-    text = input()  # Impure side effect
+    text = current_handler().input()  # Impure side effect
     return (world + 1, text)
 
 
@@ -249,3 +1114,36 @@ assert isinstance(Get, Monad)
 
 assert isinstance(ReadFile, Functor)
 assert isinstance(ReadFile, Monad)
+
+assert isinstance(Flush, Functor)
+assert isinstance(Flush, Monad)
+
+assert isinstance(ReadStream, Functor)
+assert isinstance(ReadStream, Monad)
+
+assert isinstance(WriteFile, Functor)
+assert isinstance(WriteFile, Monad)
+
+assert isinstance(Par, Functor)
+assert isinstance(Par, Monad)
+
+assert isinstance(Subprocess, Functor)
+assert isinstance(Subprocess, Monad)
+
+assert isinstance(Await, Functor)
+assert isinstance(Await, Monad)
+
+assert isinstance(Traverse, Functor)
+assert isinstance(Traverse, Monad)
+
+assert isinstance(Bracket, Functor)
+assert isinstance(Bracket, Monad)
+
+assert isinstance(WithResource, Functor)
+assert isinstance(WithResource, Monad)
+
+assert isinstance(Map, Functor)
+assert isinstance(Map, Monad)
+
+assert isinstance(Bind, Functor)
+assert isinstance(Bind, Monad)
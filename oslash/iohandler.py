@@ -0,0 +1,317 @@
+"""Handlers for the interactions of IO actions with the world.
+
+The actions that print, read input, or read or write files do not do
+so themselves, but call the current handler. By default that is
+the StdioHandler, on the terminal and the file system. Any handler can
+be made current for a block:
+
+    with StringIOHandler("Ada\\n36\\n") as handler:
+        program()
+    handler.getvalue()  # Everything program printed
+
+A session can be recorded, and replayed later without a terminal:
+
+    with RecordingHandler() as recorder:
+        program()
+    with ReplayHandler(recorder.events):
+        program()  # Same input, and checked to give the same output
+
+The current handler is a context variable, so it is kept in asyncio
+tasks, and in the threads of Par.
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import secrets
+import shutil
+import sys
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Mapping
+from contextvars import ContextVar, Token
+from pathlib import Path
+from types import TracebackType
+from typing import IO, Any, Self
+
+
+class Handler(ABC):
+    """Base class for handlers of the interactions of IO actions.
+
+    Subclasses define all the interactions. Used as a context manager,
+    the handler is current inside the block.
+    """
+
+    def __init__(self) -> None:
+        self._tokens: list[Token[Handler]] = []
+
+    @abstractmethod
+    def print(self, text: str) -> None:
+        """Print a line of text."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def flush(self) -> None:
+        """Flush the printed text."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def input(self) -> str:
+        """Read a line of input, without the line ending."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def read_file(self, filename: str) -> str:
+        """Read the text of a file."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def open(self, filename: str, mode: str) -> IO[Any]:
+        """Open a file for reading, as text for mode "r", or as bytes
+        for mode "rb", e.g. to stream it.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def write_file(
+        self, filename: str, chunks: Iterable[str], mode: str = "w", buffer_size: int = -1, atomic: bool = False
+    ) -> None:
+        """Write the chunks of text to a file, or append them for mode "a".
+
+        If atomic, the file is replaced once the text is complete.
+        """
+        raise NotImplementedError
+
+    def __enter__(self) -> Self:
+        self._tokens.append(_current.set(self))
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        _current.reset(self._tokens.pop())
+
+
+class StdioHandler(Handler):
+    """Interact with the terminal and the file system."""
+
+    def print(self, text: str) -> None:
+        print(text)
+
+    def flush(self) -> None:
+        sys.stdout.flush()
+
+    def input(self) -> str:
+        return input()
+
+    def read_file(self, filename: str) -> str:
+        return Path(filename).read_text()
+
+    def open(self, filename: str, mode: str) -> IO[Any]:
+        return Path(filename).open(mode)
+
+    def write_file(
+        self, filename: str, chunks: Iterable[str], mode: str = "w", buffer_size: int = -1, atomic: bool = False
+    ) -> None:
+        if atomic:
+            _write_atomic(Path(filename), chunks, buffer_size)
+            return
+        with Path(filename).open(mode, buffering=buffer_size) as f:
+            f.writelines(chunks)
+
+
+def _write_atomic(path: Path, chunks: Iterable[str], buffer_size: int) -> None:
+    """Write to a temporary file next to path, and rename it to path."""
+    temp = path.with_name(f".{path.name}.{secrets.token_hex(8)}.tmp")
+    # Unlike mkstemp, which creates files with mode 0o600, os.open
+    # applies the umask to the mode, as for a new file written directly
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+    fd = os.open(temp, flags, 0o666)
+    try:
+        with os.fdopen(fd, "w", buffering=buffer_size) as f:
+            f.writelines(chunks)
+            f.flush()
+            os.fsync(f.fileno())
+        if path.exists():
+            shutil.copymode(path, temp)
+        temp.replace(path)
+    except BaseException:
+        temp.unlink(missing_ok=True)
+        raise
+
+
+class StringIOHandler(Handler):
+    """Interact with in-memory buffers, at memory speed.
+
+    Input is read from the given text, output is written to stdout, and
+    files are read from, and written to, the files mapping of filenames
+    to text.
+    """
+
+    def __init__(self, input: str = "", files: Mapping[str, str] | None = None) -> None:
+        super().__init__()
+        self.stdin = io.StringIO(input)
+        self.stdout = io.StringIO()
+        self.files = dict(files or {})
+
+    def print(self, text: str) -> None:
+        self.stdout.write(text)
+        self.stdout.write("\n")
+
+    def flush(self) -> None:
+        pass
+
+    def input(self) -> str:
+        line = self.stdin.readline()
+        if not line:
+            raise EOFError("No more input")
+        return line.removesuffix("\n")
+
+    def read_file(self, filename: str) -> str:
+        try:
+            return self.files[filename]
+        except KeyError:
+            raise FileNotFoundError(filename) from None
+
+    def open(self, filename: str, mode: str) -> IO[Any]:
+        text = self.read_file(filename)
+        return io.BytesIO(text.encode()) if "b" in mode else io.StringIO(text)
+
+    def write_file(
+        self, filename: str, chunks: Iterable[str], mode: str = "w", buffer_size: int = -1, atomic: bool = False
+    ) -> None:
+        text = "".join(chunks)
+        self.files[filename] = self.files.get(filename, "") + text if mode == "a" else text
+
+    def getvalue(self) -> str:
+        """The text printed so far."""
+        return self.stdout.getvalue()
+
+
+type Event = tuple[str, str | None, str | bytes | None]
+"""An interaction: the name of the method, its argument, and its result."""
+
+
+class RecordingHandler(Handler):
+    """Record the interactions passed on to another handler.
+
+    The events can be replayed with a ReplayHandler. Files opened for
+    streaming are read, and files written, in full to record them.
+    """
+
+    def __init__(self, handler: Handler | None = None) -> None:
+        super().__init__()
+        self.handler = handler or StdioHandler()
+        self.events: list[Event] = []
+
+    def print(self, text: str) -> None:
+        self.handler.print(text)
+        self.events.append(("print", text, None))
+
+    def flush(self) -> None:
+        self.handler.flush()
+        self.events.append(("flush", None, None))
+
+    def input(self) -> str:
+        text = self.handler.input()
+        self.events.append(("input", None, text))
+        return text
+
+    def read_file(self, filename: str) -> str:
+        text = self.handler.read_file(filename)
+        self.events.append(("read_file", filename, text))
+        return text
+
+    def open(self, filename: str, mode: str) -> IO[Any]:
+        with self.handler.open(filename, mode) as f:
+            data: str | bytes = f.read()
+        self.events.append(("open", filename, data))
+        return _open_data(data)
+
+    def write_file(
+        self, filename: str, chunks: Iterable[str], mode: str = "w", buffer_size: int = -1, atomic: bool = False
+    ) -> None:
+        text = "".join(chunks)
+        self.handler.write_file(filename, [text], mode, buffer_size, atomic)
+        self.events.append(("append_file" if mode == "a" else "write_file", filename, text))
+
+
+class ReplayHandler(Handler):
+    """Replay recorded interactions, without touching the world.
+
+    Input and files read give their recorded results, and each
+    interaction, including the text written to files, is checked
+    against the recording. Raises ValueError when the
+    program interacts differently, or past the end of the recording.
+    """
+
+    def __init__(self, events: Iterable[Event]) -> None:
+        super().__init__()
+        self.events = list(events)
+        self.position = 0
+
+    def _replay(self, name: str, argument: str | None) -> Any:
+        if self.position >= len(self.events):
+            raise ValueError(f"Replay ended, but got {name}({argument!r})")
+
+        expected, expected_argument, result = self.events[self.position]
+        if (expected, expected_argument) != (name, argument):
+            raise ValueError(
+                f"Replay expected {expected}({expected_argument!r}) at event {self.position}, "
+                f"but got {name}({argument!r})"
+            )
+        self.position += 1
+        return result
+
+    def print(self, text: str) -> None:
+        self._replay("print", text)
+
+    def flush(self) -> None:
+        self._replay("flush", None)
+
+    def input(self) -> str:
+        return self._replay("input", None) or ""
+
+    def read_file(self, filename: str) -> str:
+        return self._replay("read_file", filename) or ""
+
+    def open(self, filename: str, mode: str) -> IO[Any]:
+        return _open_data(self._replay("open", filename))
+
+    def write_file(
+        self, filename: str, chunks: Iterable[str], mode: str = "w", buffer_size: int = -1, atomic: bool = False
+    ) -> None:
+        name = "append_file" if mode == "a" else "write_file"
+        expected = self._replay(name, filename)
+        text = "".join(chunks)
+        if text != expected:
+            raise ValueError(f"Replay expected {name}({filename!r}) to write {expected!r}, but got {text!r}")
+
+    @property
+    def done(self) -> bool:
+        """Whether all recorded events have been replayed."""
+        return self.position == len(self.events)
+
+
+def _open_data(data: str | bytes) -> IO[Any]:
+    """Open the data read from a file as an in-memory file."""
+    return io.BytesIO(data) if isinstance(data, bytes) else io.StringIO(data)
+
+
+_current: ContextVar[Handler] = ContextVar("handler", default=StdioHandler())  # noqa: B039
+
+
+def current_handler() -> Handler:
+    """The handler of the running IO actions."""
+    return _current.get()
+
+
+__all__ = [
+    "Event",
+    "Handler",
+    "RecordingHandler",
+    "ReplayHandler",
+    "StdioHandler",
+    "StringIOHandler",
+    "current_handler",
+]
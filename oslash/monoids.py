@@ -0,0 +1,174 @@
+"""Monoids for numeric and counting logs.
+
+Ready-made monoids for Writer logs that collect metrics, e.g.:
+
+    SumWriter = Writer.create("SumWriter", Sum)
+
+Each monoid implements ``+`` as a pure append, and ``+=`` as an in-place
+append. When a Writer runs it folds the log entries into a private
+accumulator created with ``empty()`` using ``+=``, so emitting metrics
+does not allocate a new monoid for every step.
+"""
+
+from __future__ import annotations
+
+import collections
+from collections.abc import Hashable
+from typing import Self
+
+from .typing import Monoid
+
+
+class Sum:
+    """The monoid of numbers under addition."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: float = 0) -> None:
+        self.value = value
+
+    @classmethod
+    def empty(cls) -> Self:
+        return cls(0)
+
+    def __add__(self, other: Sum) -> Self:
+        return type(self)(self.value + other.value)
+
+    def __iadd__(self, other: Sum) -> Self:
+        self.value += other.value
+        return self
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Sum):
+            return self.value == other.value
+        return NotImplemented
+
+    def __str__(self) -> str:
+        return f"Sum({self.value})"
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+class Product:
+    """The monoid of numbers under multiplication."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: float = 1) -> None:
+        self.value = value
+
+    @classmethod
+    def empty(cls) -> Self:
+        return cls(1)
+
+    def __add__(self, other: Product) -> Self:
+        return type(self)(self.value * other.value)
+
+    def __iadd__(self, other: Product) -> Self:
+        self.value *= other.value
+        return self
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Product):
+            return self.value == other.value
+        return NotImplemented
+
+    def __str__(self) -> str:
+        return f"Product({self.value})"
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+class Max:
+    """The monoid of numbers under max, with -inf as the empty element."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: float = float("-inf")) -> None:
+        self.value = value
+
+    @classmethod
+    def empty(cls) -> Self:
+        return cls(float("-inf"))
+
+    def __add__(self, other: Max) -> Self:
+        return type(self)(max(self.value, other.value))
+
+    def __iadd__(self, other: Max) -> Self:
+        self.value = max(self.value, other.value)
+        return self
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Max):
+            return self.value == other.value
+        return NotImplemented
+
+    def __str__(self) -> str:
+        return f"Max({self.value})"
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+class Min:
+    """The monoid of numbers under min, with inf as the empty element."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: float = float("inf")) -> None:
+        self.value = value
+
+    @classmethod
+    def empty(cls) -> Self:
+        return cls(float("inf"))
+
+    def __add__(self, other: Min) -> Self:
+        return type(self)(min(self.value, other.value))
+
+    def __iadd__(self, other: Min) -> Self:
+        self.value = min(self.value, other.value)
+        return self
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Min):
+            return self.value == other.value
+        return NotImplemented
+
+    def __str__(self) -> str:
+        return f"Min({self.value})"
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+class Counter[K: Hashable](collections.Counter[K]):
+    """The monoid of counts (multisets), e.g. for histograms.
+
+    Unlike collections.Counter, appending keeps zero and negative
+    counts, so that the monoid laws hold.
+    """
+
+    @classmethod
+    def empty(cls) -> Self:
+        return cls()
+
+    def __add__(self, other: collections.Counter[K]) -> Self:  # type: ignore[override]
+        result = type(self)(self)
+        result.update(other)
+        return result
+
+    def __iadd__(self, other: collections.Counter[K]) -> Self:  # type: ignore[override]
+        self.update(other)
+        return self
+
+
+__all__ = ["Counter", "Max", "Min", "Product", "Sum"]
+
+# Type assertions for runtime checking
+assert isinstance(Sum, Monoid)
+assert isinstance(Product, Monoid)
+assert isinstance(Max, Monoid)
+assert isinstance(Min, Monoid)
+assert isinstance(Counter, Monoid)
@@ -8,10 +8,206 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+import asyncio
+import itertools
+import threading
+from collections import deque
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future
+from enum import Enum
+from itertools import takewhile
+from typing import Any
 
+from .scheduler import PoolScheduler, TimeScheduler, default_scheduler
 from .typing import Functor, Monad
-from .util import compose, identity
+
+
+def _noop(*args: object) -> None:
+    pass
+
+
+def _raise(error: Exception) -> None:
+    raise error
+
+
+class Overflow(Enum):
+    """What to do when a bounded buffer is full."""
+
+    DROP = "drop"
+    """Drop the new value."""
+    LATEST = "latest"
+    """Drop the oldest buffered value to make room for the new value."""
+    BLOCK = "block"
+    """Block the producer until the consumer makes room."""
+
+
+class Disposable:
+    """A handle for tearing down a subscription.
+
+    Disposing runs the teardown actions added to the disposable, and
+    tells the producers still holding an observer of the subscription
+    that nobody is listening anymore.
+    """
+
+    def __init__(self, action: Callable[[], None] | None = None) -> None:
+        # Used as an ordered set, so actions can be discarded cheaply
+        self._actions: dict[Callable[[], None], None] = dict.fromkeys([action] if action else [])
+        self.is_disposed = False
+
+    def add(self, action: Callable[[], None]) -> None:
+        """Add teardown action, which is run at once if already disposed."""
+        if self.is_disposed:
+            action()
+        else:
+            self._actions[action] = None
+
+    def discard(self, action: Callable[[], None]) -> None:
+        """Remove teardown action that is no longer needed."""
+        self._actions.pop(action, None)
+
+    def dispose(self) -> None:
+        """Dispose the subscription. Disposing twice does nothing."""
+        if self.is_disposed:
+            return
+
+        self.is_disposed = True
+        actions, self._actions = self._actions, {}
+        for action in actions:
+            action()
+
+
+class Observer[T]:
+    """The Observer of an Observable.
+
+    An observer gets zero or more values through on_next, followed by
+    at most one of on_error or on_completed. Once stopped, or when the
+    subscription is disposed, any further notifications are ignored.
+    Without an on_error callback, errors are raised to the caller.
+
+    Observers are callable as on_next, so subscribe functions written
+    for a plain on_next callback work as before.
+    """
+
+    def __init__(
+        self,
+        on_next: Callable[[T], None] | None = None,
+        on_error: Callable[[Exception], None] | None = None,
+        on_completed: Callable[[], None] | None = None,
+        disposable: Disposable | None = None,
+    ) -> None:
+        """Observer constructor.
+
+        Args:
+            on_next: Called with each value
+            on_error: Called if the observable fails
+            on_completed: Called when the observable completes
+            disposable: Share the subscription of another observer. If
+                not given the observer gets its own subscription, which
+                is disposed when the observer stops.
+        """
+        self._on_next = on_next or _noop
+        self._on_error = on_error or _raise
+        self._on_completed = on_completed or _noop
+        self._owner = disposable is None
+        self.disposable = disposable or Disposable()
+        self._stopped = False
+
+    @property
+    def is_stopped(self) -> bool:
+        """True if producers should stop sending values."""
+        return self._stopped or self.disposable.is_disposed
+
+    def on_next(self, value: T) -> None:
+        if not self.is_stopped:
+            self._on_next(value)
+
+    def on_error(self, error: Exception) -> None:
+        if self.is_stopped:
+            return
+
+        self._stopped = True
+        try:
+            self._on_error(error)
+        finally:
+            if self._owner:
+                self.disposable.dispose()
+
+    def on_completed(self) -> None:
+        if self.is_stopped:
+            return
+
+        self._stopped = True
+        try:
+            self._on_completed()
+        finally:
+            if self._owner:
+                self.disposable.dispose()
+
+    def dispose(self) -> None:
+        """Dispose the subscription of the observer."""
+        self.disposable.dispose()
+
+    def __call__(self, value: T) -> None:
+        self.on_next(value)
+
+
+type _Stage = tuple[bool, Callable[[Any], Any]]
+"""A map (True) or filter (False) stage of a fused observable."""
+
+
+def _fused_on_next(stages: tuple[_Stage, ...], observer: Observer[Any]) -> Callable[[Any], None]:
+    """Create one on_next callback that runs all the stages."""
+    if all(is_map for is_map, _ in stages):
+        mappers = [fn for _, fn in stages]
+
+        def on_next_maps(x: Any) -> None:
+            try:
+                for mapper in mappers:
+                    x = mapper(x)
+            except Exception as error:
+                observer.on_error(error)
+            else:
+                observer.on_next(x)
+
+        return on_next_maps
+
+    def on_next(x: Any) -> None:
+        try:
+            for is_map, fn in stages:
+                if is_map:
+                    x = fn(x)
+                elif not fn(x):
+                    return
+        except Exception as error:
+            observer.on_error(error)
+        else:
+            observer.on_next(x)
+
+    return on_next
+
+
+def _collect[T, U](fn: Callable[[T], Observable[U]], x: T) -> list[U]:
+    """Run fn(x) to completion and return its values.
+
+    Module level, so it can be sent to a process pool.
+    """
+    values: list[U] = []
+    fn(x).subscribe(values.append)
+    return values
+
+
+def _emit_result[U](observer: Observer[U], future: Future[list[U]]) -> None:
+    """Send the values or the error of a finished task to observer."""
+    if future.cancelled():
+        return
+    error = future.exception()
+    if error is None:
+        for value in future.result():
+            observer.on_next(value)
+    elif isinstance(error, Exception):
+        observer.on_error(error)
+    else:
+        raise error
 
 
 class Observable[T]:
@@ -22,52 +218,591 @@ class Observable[T]:
     (CPS).
     """
 
-    def __init__(self, subscribe: Callable[[Callable[[T], None]], object]) -> None:
+    def __init__(self, subscribe: Callable[[Observer[T]], object]) -> None:
         """Observable constructor.
 
         Args:
-            subscribe: A callable that takes a callable (on_next)
+            subscribe: A callable that takes an observer. It may return
+                a Disposable that is disposed with the subscription.
         """
-        self._get_value = lambda: subscribe
+        self._subscribe = subscribe
+        self._fused: tuple[Observable[Any], tuple[_Stage, ...]] | None = None
 
     @classmethod
     def unit(cls, x: T) -> Observable[T]:
         """x -> Observable x"""
-        return cls(lambda on_next: on_next(x))
+
+        def subscribe(observer: Observer[T]) -> None:
+            observer.on_next(x)
+            observer.on_completed()
+
+        return cls(subscribe)
 
     @classmethod
     def just(cls, x: T) -> Observable[T]:
         """Alias for unit."""
         return cls.unit(x)
 
+    @classmethod
+    def from_iterable(cls, iterable: Iterable[T]) -> Observable[T]:
+        """Create observable that emits the values of the iterable.
+
+        Stops iterating as soon as the subscription is disposed.
+        """
+
+        def subscribe(observer: Observer[T]) -> None:
+            for x in iterable:
+                if observer.is_stopped:
+                    return
+                observer.on_next(x)
+            observer.on_completed()
+
+        return cls(subscribe)
+
     def map[U](self, mapper: Callable[[T], U]) -> Observable[U]:
         r"""Map a function over an observable.
 
         Haskell: fmap f m = Cont $ \c -> runCont m (c . f)
+
+        Consecutive map and filter stages are fused, and run by a single
+        callback when subscribed.
         """
-        source = self
-        return Observable(lambda on_next: source.subscribe(compose(on_next, mapper)))
+        return self._fuse((True, mapper))
 
-    def bind[U](self, fn: Callable[[T], Observable[U]]) -> Observable[U]:
+    def bind[U](
+        self,
+        fn: Callable[[T], Observable[U]],
+        scheduler: PoolScheduler | None = None,
+        max_concurrency: int | None = None,
+        ordered: bool = True,
+    ) -> Observable[U]:
         r"""Chain continuation passing functions.
 
         Haskell: m >>= k = Cont $ \c -> runCont m $ \a -> runCont (k a) c
+
+        Completes when the source and all the inner observables have
+        completed.
+
+        Without a scheduler the inner observables run inline, one after
+        the other. With a scheduler each fn(x) runs as a task on the
+        scheduler, see _bind_on.
         """
+        if scheduler is not None:
+            return self._bind_on(fn, scheduler, max_concurrency, ordered)
+
         source = self
-        return Observable(lambda on_next: source.subscribe(lambda a: fn(a).subscribe(on_next)))  # type: ignore[arg-type,return-value]
+
+        def subscribe(observer: Observer[U]) -> object:
+            active = 1
+
+            def on_completed() -> None:
+                nonlocal active
+                active -= 1
+                if active == 0:
+                    observer.on_completed()
+
+            def on_next(x: T) -> None:
+                nonlocal active
+                try:
+                    inner = fn(x)
+                except Exception as error:
+                    observer.on_error(error)
+                    return
+
+                active += 1
+                inner_observer = Observer(observer.on_next, observer.on_error, on_completed)
+                observer.disposable.add(inner_observer.dispose)
+                inner_observer.disposable.add(lambda: observer.disposable.discard(inner_observer.dispose))
+                inner.subscribe(inner_observer)
+
+            return source.subscribe(Observer(on_next, observer.on_error, on_completed, observer.disposable))
+
+        return Observable(subscribe)
+
+    def _bind_on[U](
+        self, fn: Callable[[T], Observable[U]], scheduler: PoolScheduler, max_concurrency: int | None, ordered: bool
+    ) -> Observable[U]:
+        """Bind with the inner observables running on a scheduler.
+
+        Each task subscribes to fn(x) and collects its values, which
+        are then emitted in the order of the source if ordered, or as
+        the tasks finish if not. At most max_concurrency tasks run at a
+        time, and the source is blocked while the limit is reached.
+        Values are delivered to the observer one at a time, from
+        whichever thread finished the task.
+        """
+        source = self
+
+        def subscribe(observer: Observer[U]) -> object:
+            # Reentrant, since the observer may dispose the subscription
+            lock = threading.RLock()
+            slots = threading.Semaphore(max_concurrency) if max_concurrency else None
+            # Used as an ordered set, so finished tasks can be removed cheaply
+            pending: dict[Future[list[U]], None] = {}
+            source_completed = False
+
+            def on_done(future: Future[list[U]]) -> None:
+                if slots:
+                    slots.release()
+                with lock:
+                    ready = list(takewhile(lambda f: f.done(), pending)) if ordered else [future]
+                    for finished in ready:
+                        # Disposing the observer may already have removed it
+                        if finished in pending:
+                            del pending[finished]
+                            _emit_result(observer, finished)
+                    if source_completed and not pending:
+                        observer.on_completed()
+
+            def on_next(x: T) -> None:
+                if slots:
+                    slots.acquire()
+                with lock:
+                    future = scheduler.submit(_collect, fn, x)
+                    pending[future] = None
+                future.add_done_callback(on_done)
+
+            def on_completed() -> None:
+                nonlocal source_completed
+                with lock:
+                    source_completed = True
+                    if not pending:
+                        observer.on_completed()
+
+            def cancel() -> None:
+                with lock:
+                    futures = list(pending)
+                for future in futures:
+                    future.cancel()
+
+            observer.disposable.add(cancel)
+            return source.subscribe(Observer(on_next, observer.on_error, on_completed, observer.disposable))
+
+        return Observable(subscribe)
 
     flat_map = bind
 
     def filter(self, predicate: Callable[[T], bool]) -> Observable[T]:
-        """Filter the on_next continuation functions"""
+        """Filter the on_next continuation functions.
+
+        Consecutive map and filter stages are fused, and run by a single
+        callback when subscribed.
+        """
+        return self._fuse((False, predicate))
+
+    def _fuse(self, stage: _Stage) -> Observable[Any]:
+        """Add a map or filter stage to the stages of this observable."""
+        source, stages = self._fused or (self, ())
+        stages = (*stages, stage)
+
+        def subscribe(observer: Observer[Any]) -> object:
+            on_next = _fused_on_next(stages, observer)
+            return source.subscribe(Observer(on_next, observer.on_error, observer.on_completed, observer.disposable))
+
+        fused: Observable[Any] = Observable(subscribe)
+        fused._fused = (source, stages)
+        return fused
+
+    def take(self, count: int) -> Observable[T]:
+        """Take the first count values, and then complete.
+
+        The source subscription is disposed after the last value, so
+        the producer stops as soon as it is no longer needed.
+        """
+        source = self
+
+        def subscribe(observer: Observer[T]) -> object:
+            if count <= 0:
+                observer.on_completed()
+                return None
+
+            remaining = count
+
+            def on_next(x: T) -> None:
+                nonlocal remaining
+                remaining -= 1
+                observer.on_next(x)
+                if remaining == 0:
+                    upstream.dispose()
+                    observer.on_completed()
+
+            upstream = Observer(on_next, observer.on_error, observer.on_completed)
+            observer.disposable.add(upstream.dispose)
+            return source.subscribe(upstream)
+
+        return Observable(subscribe)
+
+    def buffer(self, count: int) -> Observable[list[T]]:
+        """Collect the values into lists of count values.
+
+        The last list may be shorter, and is emitted when the source
+        completes. At most count values are held at any time.
+        """
+        source = self
+
+        def subscribe(observer: Observer[list[T]]) -> object:
+            chunk: list[T] = []
+
+            def on_next(x: T) -> None:
+                nonlocal chunk
+                chunk.append(x)
+                if len(chunk) >= count:
+                    values, chunk = chunk, []
+                    observer.on_next(values)
+
+            def on_completed() -> None:
+                if chunk:
+                    observer.on_next(chunk)
+                observer.on_completed()
+
+            return source.subscribe(Observer(on_next, observer.on_error, on_completed, observer.disposable))
+
+        return Observable(subscribe)
+
+    def window(self, count: int) -> Observable[Observable[T]]:
+        """Split the values into observables of count values each.
+
+        Each window is emitted once full, or when the source completes,
+        so at most count values are held at any time.
+        """
+        return self.buffer(count).map(Observable[T].from_iterable)
+
+    def throttle(self, duration: float, scheduler: TimeScheduler | None = None) -> Observable[T]:
+        """Emit a value, and then ignore values for duration seconds."""
+        source = self
+        timers = scheduler or default_scheduler
+
+        def subscribe(observer: Observer[T]) -> object:
+            until = float("-inf")
+
+            def on_next(x: T) -> None:
+                nonlocal until
+                now = timers.now()
+                if now >= until:
+                    until = now + duration
+                    observer.on_next(x)
+
+            return source.subscribe(Observer(on_next, observer.on_error, observer.on_completed, observer.disposable))
+
+        return Observable(subscribe)
+
+    def sample(self, duration: float, scheduler: TimeScheduler | None = None) -> Observable[T]:
+        """Emit the latest value of each period of duration seconds.
+
+        The end of a period is noticed when the next value arrives, or
+        when the source completes. Only the latest value is held.
+        """
+        source = self
+        timers = scheduler or default_scheduler
+
+        def subscribe(observer: Observer[T]) -> object:
+            period_end: float | None = None
+            latest: list[T] = []
+
+            def on_next(x: T) -> None:
+                nonlocal period_end
+                now = timers.now()
+                if period_end is None:
+                    period_end = now + duration
+                elif now >= period_end:
+                    observer.on_next(latest.pop())
+                    period_end += duration * ((now - period_end) // duration + 1)
+                latest[:] = [x]
+
+            def on_completed() -> None:
+                if latest:
+                    observer.on_next(latest.pop())
+                observer.on_completed()
+
+            return source.subscribe(Observer(on_next, observer.on_error, on_completed, observer.disposable))
+
+        return Observable(subscribe)
+
+    @staticmethod
+    def interval(period: float, scheduler: TimeScheduler | None = None) -> Observable[int]:
+        """Emit 0, 1, 2, ... every period seconds, until disposed."""
+
+        def subscribe(observer: Observer[int]) -> object:
+            counter = itertools.count()
+            cancel = (scheduler or default_scheduler).schedule_periodic(period, lambda: observer.on_next(next(counter)))
+            return Disposable(cancel)
+
+        return Observable(subscribe)
+
+    def debounce(self, duration: float, scheduler: TimeScheduler | None = None) -> Observable[T]:
+        """Emit a value once no other value has arrived for duration
+        seconds.
+
+        A pending value is emitted at once when the source completes.
+        """
+        source = self
+        timers = scheduler or default_scheduler
+
+        def subscribe(observer: Observer[T]) -> object:
+            lock = threading.RLock()
+            cancel: Callable[[], None] = _noop
+            latest: list[T] = []
+            generation = 0
+
+            def emit(current: int) -> None:
+                with lock:
+                    # A timer may already be running when a newer value arrives
+                    if current == generation and latest:
+                        observer.on_next(latest.pop())
+
+            def on_next(x: T) -> None:
+                nonlocal cancel, generation
+                with lock:
+                    cancel()
+                    generation += 1
+                    current = generation
+                    latest[:] = [x]
+                    cancel = timers.schedule(duration, lambda: emit(current))
+
+            def on_error(error: Exception) -> None:
+                with lock:
+                    cancel()
+                    observer.on_error(error)
+
+            def on_completed() -> None:
+                with lock:
+                    cancel()
+                    emit(generation)
+                    observer.on_completed()
+
+            observer.disposable.add(lambda: cancel())  # noqa: PLW0108 (cancel is reassigned)
+            return source.subscribe(Observer(on_next, on_error, on_completed, observer.disposable))
+
+        return Observable(subscribe)
+
+    def delay(self, duration: float, scheduler: TimeScheduler | None = None) -> Observable[T]:
+        """Emit the values, and completion, duration seconds later.
+
+        Errors are not delayed, and drop the values not yet emitted.
+        """
+        source = self
+        timers = scheduler or default_scheduler
+
+        def subscribe(observer: Observer[T]) -> object:
+            lock = threading.RLock()
+            keys = itertools.count()
+            pending: dict[int, Callable[[], None]] = {}
+
+            def later(action: Callable[[], None]) -> None:
+                key = next(keys)
+
+                def run() -> None:
+                    with lock:
+                        pending.pop(key, None)
+                        action()
+
+                with lock:
+                    pending[key] = timers.schedule(duration, run)
+
+            def cancel_all() -> None:
+                with lock:
+                    for cancel in pending.values():
+                        cancel()
+                    pending.clear()
+
+            def on_error(error: Exception) -> None:
+                with lock:
+                    cancel_all()
+                    observer.on_error(error)
+
+            observer.disposable.add(cancel_all)
+            return source.subscribe(
+                Observer(
+                    lambda x: later(lambda: observer.on_next(x)),
+                    on_error,
+                    lambda: later(observer.on_completed),
+                    observer.disposable,
+                )
+            )
+
+        return Observable(subscribe)
+
+    def timeout(self, duration: float, scheduler: TimeScheduler | None = None) -> Observable[T]:
+        """Fail with TimeoutError if no value arrives within duration
+        seconds of subscribing, or of the previous value.
+        """
+        source = self
+        timers = scheduler or default_scheduler
+
+        def subscribe(observer: Observer[T]) -> object:
+            lock = threading.RLock()
+            cancel: Callable[[], None] = _noop
+            generation = 0
+
+            def expire(current: int) -> None:
+                with lock:
+                    if current == generation:
+                        observer.on_error(TimeoutError(f"No value within {duration} seconds"))
+
+            def restart() -> None:
+                nonlocal cancel, generation
+                cancel()
+                generation += 1
+                current = generation
+                cancel = timers.schedule(duration, lambda: expire(current))
+
+            def on_next(x: T) -> None:
+                with lock:
+                    if not observer.is_stopped:
+                        restart()
+                        observer.on_next(x)
+
+            def on_error(error: Exception) -> None:
+                with lock:
+                    cancel()
+                    observer.on_error(error)
+
+            def on_completed() -> None:
+                with lock:
+                    cancel()
+                    observer.on_completed()
+
+            with lock:
+                restart()
+            observer.disposable.add(lambda: cancel())  # noqa: PLW0108 (cancel is reassigned)
+            return source.subscribe(Observer(on_next, on_error, on_completed, observer.disposable))
+
+        return Observable(subscribe)
+
+    def buffer_with_time(self, timespan: float, scheduler: TimeScheduler | None = None) -> Observable[list[T]]:
+        """Collect the values into a list every timespan seconds.
+
+        A list is emitted for each timespan, even if empty. The values
+        that remain when the source completes are emitted at once.
+        """
+        source = self
+        timers = scheduler or default_scheduler
+
+        def subscribe(observer: Observer[list[T]]) -> object:
+            lock = threading.RLock()
+            chunk: list[T] = []
+
+            def flush() -> None:
+                nonlocal chunk
+                with lock:
+                    values, chunk = chunk, []
+                    observer.on_next(values)
+
+            def on_next(x: T) -> None:
+                with lock:
+                    chunk.append(x)
+
+            def on_error(error: Exception) -> None:
+                with lock:
+                    cancel()
+                    observer.on_error(error)
+
+            def on_completed() -> None:
+                with lock:
+                    cancel()
+                    if chunk:
+                        observer.on_next(chunk)
+                    observer.on_completed()
+
+            cancel = timers.schedule_periodic(timespan, flush)
+            observer.disposable.add(cancel)
+            return source.subscribe(Observer(on_next, on_error, on_completed, observer.disposable))
+
+        return Observable(subscribe)
+
+    def observe_on(self, loop: asyncio.AbstractEventLoop) -> Observable[T]:
+        """Deliver the notifications on an asyncio event loop.
+
+        The notifications are scheduled with call_soon_threadsafe, so
+        the source may emit from any thread without blocking on the
+        observer, and the observer always runs on the loop thread.
+        """
         source = self
 
-        def subscribe(on_next: Callable[[T], None]) -> object:
-            def _next(x: T) -> None:
-                if predicate(x):
-                    on_next(x)
+        def subscribe(observer: Observer[T]) -> object:
+            def on_next(x: T) -> None:
+                loop.call_soon_threadsafe(observer.on_next, x)
+
+            def on_error(error: Exception) -> None:
+                loop.call_soon_threadsafe(observer.on_error, error)
+
+            def on_completed() -> None:
+                loop.call_soon_threadsafe(observer.on_completed)
 
-            return source.subscribe(_next)
+            return source.subscribe(Observer(on_next, on_error, on_completed, observer.disposable))
+
+        return Observable(subscribe)
+
+    def on_backpressure_buffer(self, capacity: int, overflow: Overflow = Overflow.BLOCK) -> Observable[T]:
+        """Decouple a fast producer from a slow consumer.
+
+        The values are put in a buffer of at most capacity values, and
+        delivered to the observer from a consumer thread. When the
+        buffer is full the overflow strategy decides whether to drop
+        the new value, drop the oldest value, or block the producer
+        until the consumer has caught up. Errors and completion are
+        delivered after the buffered values. If the observer raises,
+        the error is passed to its on_error, and the producer stops.
+        """
+        source = self
+
+        def subscribe(observer: Observer[T]) -> object:
+            queue: deque[T] = deque()
+            condition = threading.Condition()
+            terminal: list[Callable[[], None]] = []
+
+            def on_next(x: T) -> None:
+                with condition:
+                    while len(queue) >= capacity:
+                        if overflow is Overflow.DROP or observer.is_stopped:
+                            return
+                        if overflow is Overflow.LATEST:
+                            queue.popleft()
+                        else:
+                            condition.wait()
+                    queue.append(x)
+                    condition.notify_all()
+
+            def on_terminal(notify: Callable[[], None]) -> None:
+                with condition:
+                    terminal.append(notify)
+                    condition.notify_all()
+
+            def wake() -> None:
+                with condition:
+                    condition.notify_all()
+
+            def drain() -> None:
+                while True:
+                    with condition:
+                        while not queue and not terminal and not observer.is_stopped:
+                            condition.wait()
+                        if observer.is_stopped:
+                            return
+                        if not queue:
+                            break
+                        x = queue.popleft()
+                        condition.notify_all()
+                    try:
+                        observer.on_next(x)
+                    except Exception as error:
+                        # Stop the observer, and wake a blocked producer
+                        try:
+                            observer.on_error(error)
+                        finally:
+                            wake()
+                        return
+                terminal[0]()
+
+            observer.disposable.add(wake)
+            threading.Thread(target=drain, daemon=True).start()
+            upstream = Observer(
+                on_next,
+                lambda error: on_terminal(lambda: observer.on_error(error)),
+                lambda: on_terminal(observer.on_completed),
+                observer.disposable,
+            )
+            return source.subscribe(upstream)
 
         return Observable(subscribe)
 
@@ -78,14 +813,64 @@ class Observable[T]:
         Haskell: callCC f = Cont $ \c -> runCont (f (\a -> Cont $ \_ -> c a )) c
         """
 
-        def subscribe(on_next: Callable[[T2], None]) -> object:
-            return fn(lambda a: Observable(lambda _: on_next(a))).subscribe(on_next)
+        def subscribe(observer: Observer[T2]) -> object:
+            def escape(a: T2) -> Observable[U]:
+                def subscribe_escape(inner: Observer[U]) -> None:
+                    observer.on_next(a)
+                    inner.on_completed()
+
+                return Observable(subscribe_escape)
+
+            return fn(escape).subscribe(observer)
 
         return Observable(subscribe)
 
-    def subscribe(self, on_next: Callable[[T], None]) -> object:
-        """Subscribe to the observable with an on_next callback."""
-        return self._get_value()(on_next)
+    def subscribe(
+        self,
+        on_next: Callable[[T], None] | Observer[T] | None = None,
+        on_error: Callable[[Exception], None] | None = None,
+        on_completed: Callable[[], None] | None = None,
+    ) -> Disposable:
+        """Subscribe to the observable.
+
+        Takes either an observer, or the on_next, on_error and
+        on_completed callbacks. Returns a Disposable for tearing down
+        the subscription.
+        """
+        observer: Observer[T]
+        if isinstance(on_next, Observer):
+            observer = on_next  # type: ignore[assignment]
+        else:
+            observer = Observer(on_next, on_error, on_completed)
+
+        try:
+            result = self._subscribe(observer)
+        except Exception as error:
+            if observer.is_stopped:
+                raise
+            observer.on_error(error)
+        else:
+            if isinstance(result, Disposable) and result is not observer.disposable:
+                observer.disposable.add(result.dispose)
+        return observer.disposable
+
+    def publish(self, subject_factory: Callable[[], Subject[T]] | None = None) -> ConnectableObservable[T]:
+        """Share one subscription to this observable between subscribers.
+
+        The source is not subscribed until connect is called on the
+        returned observable. The subjects are Subject by default, but
+        may e.g. be ReplaySubject or BehaviorSubject.
+        """
+        return ConnectableObservable(self, subject_factory or Subject[T])
+
+    def share(self) -> Observable[T]:
+        """Share one subscription to this observable while it has
+        subscribers.
+
+        The source is subscribed with the first subscriber, and disposed
+        when the last subscriber is disposed.
+        """
+        return self.publish().ref_count()
 
     def __or__[U](self, func: Callable[[T], Observable[U]]) -> Observable[U]:
         """Use | as operator for bind.
@@ -96,12 +881,224 @@ class Observable[T]:
 
     def __eq__(self, other: object) -> bool:
         if isinstance(other, Observable):
-            # identity returns a value, but subscribe expects a function returning None
-            # We can't properly compare observables this way, so we suppress the type error
-            return self.subscribe(identity) == other.subscribe(identity)  # type: ignore[arg-type]
+            xs: list[object] = []
+            ys: list[object] = []
+            self.subscribe(xs.append)
+            other.subscribe(ys.append)  # type: ignore[arg-type]
+            return xs == ys
         return False
 
 
+class Subject[T](Observable[T]):
+    """An observable that is also an observer.
+
+    The values, error or completion sent to a subject are multicast to
+    all its current subscribers, so an upstream subscribed to a subject
+    runs once however many subscribers there are. Subscribers that
+    arrive after the subject has stopped get the error or completion
+    only. Like observers, subjects expect their notifications to arrive
+    one at a time.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(self._add_observer)
+        # Replaced rather than mutated, so on_next can iterate it without copying
+        self._observers: tuple[Observer[T], ...] = ()
+        self._lock = threading.Lock()
+        self._stopped = False
+        self._error: Exception | None = None
+
+    @property
+    def is_stopped(self) -> bool:
+        """True once the subject has got an error or completed."""
+        return self._stopped
+
+    def _add_observer(self, observer: Observer[T]) -> Disposable | None:
+        with self._lock:
+            if not self._stopped:
+                self._observers = (*self._observers, observer)
+                return Disposable(lambda: self._remove_observer(observer))
+        self._replay_terminal(observer)
+        return None
+
+    def _remove_observer(self, observer: Observer[T]) -> None:
+        with self._lock:
+            self._observers = tuple(o for o in self._observers if o is not observer)
+
+    def _replay_terminal(self, observer: Observer[T]) -> None:
+        if self._error is not None:
+            observer.on_error(self._error)
+        else:
+            observer.on_completed()
+
+    def _stop(self) -> tuple[Observer[T], ...]:
+        with self._lock:
+            if self._stopped:
+                return ()
+            self._stopped = True
+            observers, self._observers = self._observers, ()
+        return observers
+
+    def on_next(self, value: T) -> None:
+        if not self._stopped:
+            for observer in self._observers:
+                observer.on_next(value)
+
+    def on_error(self, error: Exception) -> None:
+        self._error = error
+        for observer in self._stop():
+            observer.on_error(error)
+
+    def on_completed(self) -> None:
+        for observer in self._stop():
+            observer.on_completed()
+
+    def as_observer(self) -> Observer[T]:
+        """Wrap the subject in an observer, for subscribing it to a source."""
+        return Observer(self.on_next, self.on_error, self.on_completed)
+
+    def __call__(self, value: T) -> None:
+        self.on_next(value)
+
+
+class BehaviorSubject[T](Subject[T]):
+    """A subject with a current value.
+
+    New subscribers get the current value first, and then the values
+    that follow.
+    """
+
+    def __init__(self, value: T) -> None:
+        super().__init__()
+        self._value = value
+
+    @property
+    def value(self) -> T:
+        """The latest value sent to the subject."""
+        return self._value
+
+    def _add_observer(self, observer: Observer[T]) -> Disposable | None:
+        with self._lock:
+            value = self._value
+            stopped = self._stopped
+            if not stopped:
+                self._observers = (*self._observers, observer)
+        if stopped:
+            self._replay_terminal(observer)
+            return None
+        observer.on_next(value)
+        return Disposable(lambda: self._remove_observer(observer))
+
+    def on_next(self, value: T) -> None:
+        if not self._stopped:
+            self._value = value
+            super().on_next(value)
+
+
+class ReplaySubject[T](Subject[T]):
+    """A subject that replays past values to new subscribers.
+
+    At most buffer_size values are kept, or all of them if buffer_size
+    is None. New subscribers get the kept values, followed by the error
+    or completion if the subject has stopped.
+    """
+
+    def __init__(self, buffer_size: int | None = None) -> None:
+        super().__init__()
+        self._buffer: deque[T] = deque(maxlen=buffer_size)
+
+    def _add_observer(self, observer: Observer[T]) -> Disposable | None:
+        with self._lock:
+            values = tuple(self._buffer)
+            stopped = self._stopped
+            if not stopped:
+                self._observers = (*self._observers, observer)
+        for value in values:
+            observer.on_next(value)
+        if stopped:
+            self._replay_terminal(observer)
+            return None
+        return Disposable(lambda: self._remove_observer(observer))
+
+    def on_next(self, value: T) -> None:
+        if not self._stopped:
+            self._buffer.append(value)
+            super().on_next(value)
+
+
+class ConnectableObservable[T](Observable[T]):
+    """An observable that shares one subscription to its source.
+
+    Subscribers are added to a subject from subject_factory, and the
+    source is subscribed to the subject when connect is called.
+    """
+
+    def __init__(self, source: Observable[T], subject_factory: Callable[[], Subject[T]] = Subject) -> None:
+        super().__init__(self._add_observer)
+        self._source = source
+        self._subject_factory = subject_factory
+        self._subject = subject_factory()
+        self._connection: Disposable | None = None
+        self._lock = threading.RLock()
+
+    def _add_observer(self, observer: Observer[T]) -> object:
+        return self._subject.subscribe(observer)
+
+    def connect(self) -> Disposable:
+        """Subscribe the subject to the source, if not connected already.
+
+        Returns a Disposable that disconnects the source.
+        """
+        with self._lock:
+            if self._connection is not None:
+                return self._connection
+
+            connection = self._connection = Disposable()
+            connection.add(self._disconnected)
+            subject = self._subject
+        upstream = Observer(subject.on_next, subject.on_error, subject.on_completed)
+        upstream.disposable.add(connection.dispose)
+        connection.add(upstream.dispose)
+        self._source.subscribe(upstream)
+        return connection
+
+    def _disconnected(self) -> None:
+        with self._lock:
+            self._connection = None
+
+    def ref_count(self) -> Observable[T]:
+        """Connect with the first subscriber, and disconnect when the last
+        subscriber is disposed.
+
+        If the subject has stopped, the first subscriber gets a fresh
+        subject, so the source runs again.
+        """
+        count = 0
+
+        def release() -> None:
+            nonlocal count
+            with self._lock:
+                count -= 1
+                connection = self._connection if count == 0 else None
+            if connection is not None:
+                connection.dispose()
+
+        def subscribe(observer: Observer[T]) -> object:
+            nonlocal count
+            with self._lock:
+                count += 1
+                first = count == 1
+                if first and self._subject.is_stopped and self._connection is None:
+                    self._subject = self._subject_factory()
+            self.subscribe(observer)
+            observer.disposable.add(release)
+            if first:
+                self.connect()
+            return None
+
+        return Observable(subscribe)
+
+
 # Type assertions for runtime checking
 assert isinstance(Observable, Functor)
 assert isinstance(Observable, Monad)
@@ -6,8 +6,11 @@ Functions may read that state, but can't change it.
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Executor
 from functools import partial
+from itertools import islice
 
 from .typing import Applicative, Functor, Monad
 
@@ -95,6 +98,32 @@ class Reader[Env, T]:
         """
         return self.fn(env)
 
+    def run_many(
+        self, envs: Iterable[Env], executor: Executor | None = None, chunksize: int = 1, window: int = 64
+    ) -> Iterator[T]:
+        """Run reader in each of the given environments.
+
+        Results are streamed lazily and in the same order as the
+        environments. Since a Reader is a pure function of its
+        environment, the runs are independent and may be fanned out
+        over a ``concurrent.futures`` executor. With a
+        ``ProcessPoolExecutor`` the reader and the environments must be
+        picklable, and a ``chunksize`` larger than 1 batches many
+        environments into each task to amortize the IPC overhead.
+
+        On an executor, at most ``window`` tasks are submitted ahead of
+        the results consumed, so the environments are also read lazily,
+        and memory stays bounded for long or endless iterables. Raises
+        ValueError if ``chunksize`` or ``window`` is less than 1.
+        """
+        if chunksize < 1:
+            raise ValueError(f"chunksize must be at least 1, got {chunksize}")
+        if window < 1:
+            raise ValueError(f"window must be at least 1, got {window}")
+        if executor is None:
+            return map(self.run, envs)
+        return _run_windowed(self, iter(envs), executor, chunksize, window)
+
     def __call__(self, env: Env) -> T:
         """Call the wrapped function."""
         return self.run(env)
@@ -106,6 +135,26 @@ class Reader[Env, T]:
         return str(self)
 
 
+def _run_chunk[Env, T](reader: Reader[Env, T], envs: list[Env]) -> list[T]:
+    return [reader.run(env) for env in envs]
+
+
+def _run_windowed[Env, T](
+    reader: Reader[Env, T], envs: Iterator[Env], executor: Executor, chunksize: int, window: int
+) -> Iterator[T]:
+    """Run reader on the executor, a chunk of environments per task."""
+    chunks = iter(lambda: list(islice(envs, chunksize)), [])
+    pending = deque(executor.submit(_run_chunk, reader, chunk) for chunk in islice(chunks, window))
+    try:
+        while pending:
+            results = pending.popleft().result()
+            pending.extend(executor.submit(_run_chunk, reader, chunk) for chunk in islice(chunks, 1))
+            yield from results
+    finally:
+        for future in pending:
+            future.cancel()
+
+
 class MonadReader[Env, T](Reader[Env, T]):
     """The MonadReader class.
 
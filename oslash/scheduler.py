@@ -0,0 +1,241 @@
+"""Schedulers for running Observable work concurrently, or later.
+
+A pool scheduler runs tasks on a ``concurrent.futures`` executor, e.g.
+the inner observables of ``Observable.flat_map``:
+
+    with ThreadPoolScheduler(4) as scheduler:
+        stream.flat_map(fn, scheduler=scheduler, max_concurrency=8)
+
+A time scheduler runs actions after a delay, for the time operators of
+Observable. The RealTimeScheduler waits on the clock, while the
+VirtualTimeScheduler only moves time forward when told to:
+
+    scheduler = VirtualTimeScheduler()
+    Observable.interval(1.0, scheduler).buffer_with_time(60.0, scheduler).subscribe(print)
+    scheduler.advance_by(3600.0)  # An hour of events, at once
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from types import TracebackType
+from typing import Self
+
+
+class PoolScheduler:
+    """Schedule tasks on a concurrent.futures executor."""
+
+    def __init__(self, executor: Executor) -> None:
+        self.executor = executor
+
+    def submit[T](self, fn: Callable[..., T], *args: object) -> Future[T]:
+        """Run fn(*args) on the executor."""
+        return self.executor.submit(fn, *args)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the executor."""
+        self.executor.shutdown(wait)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        self.shutdown()
+
+
+class ThreadPoolScheduler(PoolScheduler):
+    """Schedule tasks on a pool of threads.
+
+    Suits I/O-bound work, or work that releases the GIL.
+    """
+
+    def __init__(self, max_workers: int | None = None) -> None:
+        super().__init__(ThreadPoolExecutor(max_workers))
+
+
+class ProcessPoolScheduler(PoolScheduler):
+    """Schedule tasks on a pool of processes.
+
+    Suits CPU-bound work. The tasks, their arguments and their results
+    must be picklable, so e.g. the function given to flat_map must be
+    defined at module level.
+    """
+
+    def __init__(self, max_workers: int | None = None) -> None:
+        super().__init__(ProcessPoolExecutor(max_workers))
+
+
+class _Timer:
+    """An action scheduled to run at a due time."""
+
+    __slots__ = ("action", "cancelled", "due", "seq")
+
+    def __init__(self, due: float, seq: int, action: Callable[[], None]) -> None:
+        self.due = due
+        self.seq = seq
+        self.action = action
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+    def __lt__(self, other: _Timer) -> bool:
+        # Actions due at the same time run in the order they were scheduled
+        return (self.due, self.seq) < (other.due, other.seq)
+
+
+class TimeScheduler(ABC):
+    """Base class for schedulers that run actions after a delay.
+
+    Timers are kept in a heap, and cancelled timers are skipped when
+    they come due.
+    """
+
+    def __init__(self) -> None:
+        self._timers: list[_Timer] = []
+        self._seq = itertools.count()
+
+    @abstractmethod
+    def now(self) -> float:
+        """The current time of the scheduler, in seconds."""
+        raise NotImplementedError
+
+    def schedule(self, delay: float, action: Callable[[], None]) -> Callable[[], None]:
+        """Run action after delay seconds.
+
+        Returns a function that cancels the action, if not run already.
+        """
+        timer = _Timer(self.now() + max(delay, 0.0), next(self._seq), action)
+        heapq.heappush(self._timers, timer)
+        return timer.cancel
+
+    def schedule_periodic(self, period: float, action: Callable[[], None]) -> Callable[[], None]:
+        """Run action every period seconds, until cancelled or it raises."""
+        cancelled = False
+        due = self.now() + period
+
+        def tick() -> None:
+            nonlocal cancel_next, due
+            if cancelled:
+                return
+            due += period
+            cancel_next = self.schedule(due - self.now(), tick)
+            try:
+                action()
+            except BaseException:
+                # An action that raises is not run again
+                cancel_next()
+                raise
+
+        cancel_next = self.schedule(period, tick)
+
+        def cancel() -> None:
+            nonlocal cancelled
+            cancelled = True
+            cancel_next()
+
+        return cancel
+
+    def _pop_due(self, until: float) -> _Timer | None:
+        """Pop the next timer that is due at or before until."""
+        while self._timers and self._timers[0].due <= until:
+            timer = heapq.heappop(self._timers)
+            if not timer.cancelled:
+                return timer
+        return None
+
+
+class RealTimeScheduler(TimeScheduler):
+    """Run actions on the monotonic clock.
+
+    The actions run one at a time on a daemon thread of the scheduler,
+    which is started with the first scheduled action. An exception
+    raised by an action is passed to threading.excepthook.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._condition = threading.Condition()
+        self._thread: threading.Thread | None = None
+
+    def now(self) -> float:
+        return time.monotonic()
+
+    def schedule(self, delay: float, action: Callable[[], None]) -> Callable[[], None]:
+        with self._condition:
+            cancel = super().schedule(delay, action)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+            self._condition.notify()
+        return cancel
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                timer = self._pop_due(self.now())
+                while timer is None:
+                    timeout = self._timers[0].due - self.now() if self._timers else None
+                    self._condition.wait(timeout)
+                    timer = self._pop_due(self.now())
+            try:
+                timer.action()
+            except Exception:
+                # Report like an uncaught thread exception, and keep
+                # running the other actions
+                threading.excepthook(threading.ExceptHookArgs((*sys.exc_info(), threading.current_thread())))
+
+
+class VirtualTimeScheduler(TimeScheduler):
+    """Run actions on a virtual clock, for tests and simulations.
+
+    Time stands still until advanced, and then the actions that come
+    due run at once, in order, on the calling thread. Results only
+    depend on the scheduled times, so they are deterministic.
+    """
+
+    def __init__(self, start: float = 0.0) -> None:
+        super().__init__()
+        self._now = start
+
+    def now(self) -> float:
+        return self._now
+
+    def advance_to(self, target: float) -> None:
+        """Run the actions due at or before target, and move the clock to target."""
+        while (timer := self._pop_due(target)) is not None:
+            self._now = max(self._now, timer.due)
+            timer.action()
+        self._now = max(self._now, target)
+
+    def advance_by(self, delta: float) -> None:
+        """Run the actions due in the next delta seconds."""
+        self.advance_to(self._now + delta)
+
+    def run(self) -> None:
+        """Run all scheduled actions. Never returns if a periodic action is scheduled."""
+        while self._timers:
+            self.advance_to(self._timers[0].due)
+
+
+default_scheduler = RealTimeScheduler()
+"""The scheduler of the time operators, unless given another."""
+
+__all__ = [
+    "PoolScheduler",
+    "ProcessPoolScheduler",
+    "RealTimeScheduler",
+    "ThreadPoolScheduler",
+    "TimeScheduler",
+    "VirtualTimeScheduler",
+    "default_scheduler",
+]
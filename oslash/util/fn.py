@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 from collections.abc import Callable
-from functools import reduce
 from typing import Any, overload
 
 
@@ -62,9 +61,26 @@ def compose[T](*funcs: Callable[[Any], Any]) -> Callable[[Any], Any]:
 
     Returns the composed function.
     """
+    # Fast paths for the common cases, so the composed function
+    # makes no more calls than composing by hand would.
+    match funcs:
+        case ():
+            return identity
+        case (op1,):
+            return op1
+        case (op2, op1):
+            return lambda source: op2(op1(source))
+        case (op3, op2, op1):
+            return lambda source: op3(op2(op1(source)))
+        case _:
+            pass
+
+    reversed_funcs = funcs[::-1]
 
     def _compose(source: T) -> T:
-        return reduce(lambda acc, f: f(acc), funcs[::-1], source)  # type: ignore
+        for f in reversed_funcs:
+            source = f(source)
+        return source
 
     return _compose
 
@@ -6,17 +6,83 @@ in addition to the computed values (e.g., logging).
 
 from __future__ import annotations
 
+import operator
+import os
 from collections.abc import Callable
-from typing import Any
+from functools import reduce
+from itertools import chain
+from pathlib import Path
+from typing import IO, Any
 
 from .typing import Functor, Monad, Monoid
 
 
+class _Concat[Log]:
+    """A pending concatenation of two logs.
+
+    Binding writers links their logs together with these rope nodes in
+    constant time. The rope is flattened into a single log only when
+    the Writer is run.
+    """
+
+    __slots__ = ("left", "right")
+
+    def __init__(self, left: Log | _Concat[Log], right: Log | _Concat[Log]) -> None:
+        self.left = left
+        self.right = right
+
+
+def _flatten[Log](rope: _Concat[Log]) -> list[Log]:
+    """Collect the logs of a rope from left to right.
+
+    Uses an explicit stack since long bind chains give deep ropes.
+    """
+    chunks: list[Log] = []
+    stack: list[Log | _Concat[Log]] = [rope]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, _Concat):
+            stack.append(node.right)  # type: ignore[arg-type]
+            stack.append(node.left)  # type: ignore[arg-type]
+        else:
+            chunks.append(node)
+    return chunks
+
+
+def _concat[Log](chunks: list[Log]) -> Log:
+    """Append the logs in a single pass.
+
+    Strings are joined, and lists and tuples are chained, so the result
+    is built once instead of copying the accumulated log on every
+    append. Monoids with an empty element are appended in place to a
+    private accumulator, and any other log type is appended pairwise.
+    """
+    kind = type(chunks[0])
+    if kind is str:
+        return "".join(chunks)  # type: ignore[arg-type,return-value]
+    if kind in (list, tuple) and all(type(chunk) is kind for chunk in chunks):
+        return kind(chain.from_iterable(chunks))  # type: ignore[call-arg,arg-type]
+    if isinstance(chunks[0], Monoid):
+        acc: Any = kind.empty()  # type: ignore[attr-defined]
+        for chunk in chunks:
+            acc += chunk  # type: ignore[operator]
+        return acc  # type: ignore[no-any-return]
+    return reduce(operator.add, chunks)  # type: ignore[arg-type]
+
+
+# Cache of the Writer classes made by Writer.create
+_writer_classes: dict[tuple[str, type[Any]], type[Any]] = {}
+
+
 class Writer[T, Log]:
     """The writer monad.
 
     The Writer monad represents computations that produce a stream of
     data in addition to the computed values.
+
+    Binding does not append the logs right away, but links them in a
+    rope that is materialized once by run(). A chain of n binds is thus
+    linear instead of quadratic in the size of the log.
     """
 
     def __init__(self, value: T, log: Log) -> None:
@@ -26,7 +92,8 @@ class Writer[T, Log]:
             value: The wrapped value
             log: The log/accumulated data
         """
-        self._value: tuple[T, Log] = (value, log)
+        self._value = value
+        self._log: Log | _Concat[Log] = log
 
     def map[U](self, func: Callable[[tuple[T, Log]], tuple[U, Log]]) -> Writer[U, Log]:
         """Map a function func over the Writer value.
@@ -45,12 +112,9 @@ class Writer[T, Log]:
         (Writer (x, v)) >>= f = let
             (Writer (y, v')) = f x in Writer (y, v `append` v')
         """
-        a, w = self.run()
-        b, w_ = func(a).run()
-        # Log type must support addition (Monoid)
-        w__: Log = w + w_  # type: ignore[operator]
-        # Any: Log type is generic and determined at runtime
-        return Writer(b, w__)  # type: ignore[arg-type]
+        other = func(self._value)
+        # Log type must support addition (Monoid), appended lazily by run()
+        return Writer(other._value, _Concat(self._log, other._log))  # type: ignore[arg-type]
 
     @classmethod
     def unit(cls, value: T) -> Writer[T, Log]:
@@ -60,8 +124,16 @@ class Writer[T, Log]:
         use a different monoid than str, or use the constructor
         directly.
         """
-        # Log: Empty log is empty string by default
-        return Writer(value, log="")  # type: ignore
+        return cls(value, cls.empty_log())
+
+    @classmethod
+    def empty_log(cls) -> Log:
+        """Create the empty log used by unit.
+
+        Override in subclasses, or use the factory method, to use a
+        different monoid than str.
+        """
+        return ""  # type: ignore[return-value]
 
     def run(self) -> tuple[T, Log]:
         """Extract value from Writer.
@@ -69,7 +141,10 @@ class Writer[T, Log]:
         This is the inverse function of the constructor and converts the
         Writer to a simple tuple.
         """
-        return self._value
+        log = self._log
+        if isinstance(log, _Concat):
+            log = self._log = _concat(_flatten(log))  # type: ignore[arg-type]
+        return self._value, log  # type: ignore[return-value]
 
     @staticmethod
     def apply_log[V](a: tuple[V, Log], func: Callable[[V], tuple[T, Log]]) -> tuple[T, Log]:
@@ -87,23 +162,30 @@ class Writer[T, Log]:
         """Create Writer subclass using specified monoid type.
 
         Lets us create a Writer that uses a different monoid than str for the log.
+        The classes are cached, so creating a Writer with the same name and
+        monoid type again gives back the same class.
 
         Usage:
             StringWriter = Writer.create("StringWriter", str)
             IntWriter = Writer.create("IntWriter", int)
             ...
-        """
 
-        def unit(cls: type[Writer[T, Log]], value: T) -> Writer[T, Log]:
-            log: Any  # Any: Dynamic monoid type determined at runtime
-            if hasattr(monoid_type, "empty"):
-                log = monoid_type.empty()  # type: ignore[attr-defined]
-            else:
-                log = monoid_type()  # type: ignore[misc]
+        A subclass can also be declared statically by overriding empty_log:
 
-            return cls(value, log)  # type: ignore[arg-type]
+            class ListWriter(Writer[T, list[str]]):
+                @classmethod
+                def empty_log(cls) -> list[str]:
+                    return []
+        """
+        key = (class_name, monoid_type)
+        writer = _writer_classes.get(key)
+        if writer is None:
+            # Any: Dynamic monoid type determined at runtime
+            empty: Callable[[], Any] = getattr(monoid_type, "empty", monoid_type)
+            writer = type(class_name, (Writer,), {"empty_log": staticmethod(empty)})  # type: ignore[arg-type]
+            writer = _writer_classes.setdefault(key, writer)
 
-        return type(class_name, (Writer,), {"unit": classmethod(unit)})  # type: ignore
+        return writer  # type: ignore[return-value]
 
     def __eq__(self, other: object) -> bool:
         if isinstance(other, Writer):
@@ -128,6 +210,136 @@ class MonadWriter[Log](Writer[None, Log]):
         return cls(None, log)  # type: ignore
 
 
+class LogSink[Log]:
+    """A buffered destination for streamed Writer logs.
+
+    The target is a file name, an open file (any object with a write
+    method such as ``io.TextIOBase``), or a callable. Log entries are
+    buffered and handed over in batches of ``flush_size`` entries,
+    joined into a single string for files or as a list for callables.
+    """
+
+    def __init__(
+        self, target: str | os.PathLike[str] | IO[str] | Callable[[list[Log]], object], flush_size: int = 1024
+    ) -> None:
+        self._close = False
+        if isinstance(target, str | os.PathLike):
+            target = Path(target).open("w", encoding="utf-8")  # type: ignore[arg-type]  # noqa: SIM115
+            self._close = True
+        self._target = target
+        self._buffer: list[Log] = []
+        self.flush_size = flush_size
+        self.entries = 0
+
+    def write(self, entry: Log) -> None:
+        """Buffer a log entry, flushing when the buffer is full."""
+        self._buffer.append(entry)
+        self.entries += 1
+        if len(self._buffer) >= self.flush_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Hand the buffered log entries over to the target."""
+        buffer, self._buffer = self._buffer, []
+        target = self._target
+        if isinstance(target, Callable):
+            if buffer:
+                target(buffer)
+            return
+
+        if buffer:
+            target.write("".join(map(str, buffer)))
+        target.flush()
+
+    def close(self) -> None:
+        """Flush the sink, and close the file if opened by the sink."""
+        self.flush()
+        if self._close:
+            self._target.close()  # type: ignore[union-attr]
+
+    def __str__(self) -> str:
+        return f"LogSink({self._target!r}, entries={self.entries})"
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+class StreamingWriter[T, Log](Writer[T, Log]):
+    """A Writer that streams its log to a sink.
+
+    Instead of holding the log in memory until run(), the log entries
+    are written to the sink as the binds execute. Peak memory is thus
+    bounded by the sink's buffer regardless of the log volume. Running
+    the writer flushes the sink and returns it in place of the log, so
+    the number of entries written is available as ``sink.entries``.
+
+    Use ``with_sink`` to create a StreamingWriter class bound to a sink.
+    """
+
+    sink: LogSink[Any]  # Any: Set per class by with_sink
+
+    def _emit(self, writer: Writer[Any, Log]) -> None:
+        """Write the pending log of writer to the sink.
+
+        The writer is left as is, so a writer that is bound, or run,
+        again writes its log again.
+        """
+        log = writer._log
+        if log is not self.sink:
+            self.sink.write(_concat(_flatten(log)) if isinstance(log, _Concat) else log)  # type: ignore[arg-type]
+
+    def map[U](self, func: Callable[[tuple[T, Log]], tuple[U, Log]]) -> Writer[U, Log]:
+        """Map a function func over the Writer value.
+
+        The function gets the sink in place of the log, and may return
+        it as is, or a log entry to write. The pending log is written,
+        but the sink is only flushed by run().
+        """
+        self._emit(self)
+        b, w_ = func((self._value, self.sink))  # type: ignore[arg-type]
+        return type(self)(b, w_)  # type: ignore[arg-type,return-value]
+
+    def bind[U](self, func: Callable[[T], Writer[U, Log]]) -> Writer[U, Log]:
+        """Bind a function, writing the log entries to the sink.
+
+        The log of this writer is written before func is called, so the
+        entries reach the sink in order also for nested binds.
+        """
+        self._emit(self)
+        other = func(self._value)
+        self._emit(other)
+        return type(self)(other._value, self.sink)  # type: ignore[arg-type,return-value]
+
+    @classmethod
+    def unit(cls, value: T) -> Writer[T, Log]:
+        """Wrap a single value in a Writer without writing to the sink."""
+        return cls(value, cls.sink)  # type: ignore[arg-type]
+
+    @classmethod
+    def tell(cls, log: Log) -> Writer[None, Log]:
+        """Log a value without returning a result."""
+        return cls(None, log)  # type: ignore[arg-type,return-value]
+
+    def run(self) -> tuple[T, Log]:
+        """Write any pending log entry and flush the sink.
+
+        Returns the value together with the sink.
+        """
+        self._emit(self)
+        self.sink.flush()
+        return self._value, self.sink  # type: ignore[return-value]
+
+    @classmethod
+    def with_sink(cls, class_name: str, sink: LogSink[Log]) -> type[StreamingWriter[T, Log]]:
+        """Create StreamingWriter subclass that writes to the given sink.
+
+        Usage:
+            AuditWriter = StreamingWriter.with_sink("AuditWriter", LogSink(open("audit.log", "w")))
+            ...
+        """
+        return type(class_name, (cls,), {"sink": sink})  # type: ignore
+
+
 # Convenience: Pre-created StringWriter
 # Any: Dynamic type creation via type() cannot be statically typed
 StringWriter: type[Writer[Any, str]] = Writer.create("StringWriter", str)  # type: ignore[assignment]
@@ -0,0 +1,132 @@
+import asyncio
+import threading
+import unittest
+from collections.abc import AsyncIterator
+
+import pytest
+
+from oslash.asyncobservable import AsyncObservable, AsyncObserver
+from oslash.observable import Observable
+
+
+async def countdown(n: int) -> AsyncIterator[int]:
+    for i in range(n, 0, -1):
+        await asyncio.sleep(0)
+        yield i
+
+
+async def collect[T](stream: AsyncObservable[T]) -> list[T]:
+    return [x async for x in stream]
+
+
+class TestAsyncObservable(unittest.IsolatedAsyncioTestCase):
+    async def test_async_observable_unit(self) -> None:
+        assert await collect(AsyncObservable.unit(42)) == [42]
+
+    async def test_async_observable_from_async_iterable(self) -> None:
+        assert await collect(AsyncObservable.from_async_iterable(countdown(3))) == [3, 2, 1]
+
+    async def test_async_observable_map(self) -> None:
+        async def double(x: int) -> int:
+            await asyncio.sleep(0)
+            return x * 2
+
+        stream = AsyncObservable.from_iterable([1, 2, 3]).map(double).map(lambda x: x + 1)
+        assert await collect(stream) == [3, 5, 7]
+
+    async def test_async_observable_filter(self) -> None:
+        async def is_even(x: int) -> bool:
+            return x % 2 == 0
+
+        stream = AsyncObservable.from_iterable(range(6)).filter(is_even)
+        assert await collect(stream) == [0, 2, 4]
+
+    async def test_async_observable_subscribe(self) -> None:
+        result: list[str] = []
+
+        async def on_next(x: int) -> None:
+            result.append(f"OnNext({x})")
+
+        await AsyncObservable.from_iterable([1, 2]).subscribe(on_next, on_completed=lambda: result.append("Done"))
+        assert result == ["OnNext(1)", "OnNext(2)", "Done"]
+
+    async def test_async_observable_bind(self) -> None:
+        stream = AsyncObservable.from_iterable([1, 2]).bind(lambda x: AsyncObservable.from_iterable([x, x * 10]))
+        assert sorted(await collect(stream)) == [1, 2, 10, 20]
+
+    async def test_async_observable_bind_max_concurrency(self) -> None:
+        running = 0
+        most = 0
+
+        def slow(x: int) -> AsyncObservable[int]:
+            async def subscribe(observer: AsyncObserver[int]) -> None:
+                nonlocal running, most
+                running += 1
+                most = max(most, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+                await observer.on_next(x)
+                await observer.on_completed()
+
+            return AsyncObservable(subscribe)
+
+        stream = AsyncObservable.from_iterable(range(6)).flat_map(slow, max_concurrency=2)
+        assert sorted(await collect(stream)) == list(range(6))
+        assert most == 2
+
+    async def test_async_observable_error(self) -> None:
+        def fail(x: int) -> int:
+            raise ValueError(x)
+
+        errors: list[Exception] = []
+        await AsyncObservable.from_iterable([1, 2]).map(fail).subscribe(on_error=errors.append)
+        assert [str(e) for e in errors] == ["1"]
+
+        with pytest.raises(ValueError, match="1"):
+            await collect(AsyncObservable.from_iterable([1, 2]).map(fail))
+
+    async def test_async_observable_bind_error(self) -> None:
+        async def failing(observer: AsyncObserver[int]) -> None:
+            await asyncio.sleep(0)
+            raise ValueError("inner")
+
+        stream = AsyncObservable.from_iterable([1, 2]).bind(lambda _: AsyncObservable(failing))
+        errors: list[Exception] = []
+        await stream.subscribe(on_error=errors.append)
+        assert [str(e) for e in errors] == ["inner"]
+
+        with pytest.raises(ValueError, match="inner"):
+            await stream.subscribe()
+
+    async def test_async_observable_to_async_iterator_bounded(self) -> None:
+        produced: list[int] = []
+
+        async def numbers() -> AsyncIterator[int]:
+            for i in range(10):
+                produced.append(i)
+                yield i
+
+        iterator = AsyncObservable.from_async_iterable(numbers()).to_async_iterator(maxsize=2)
+        assert await anext(iterator) == 0
+        await asyncio.sleep(0.01)
+        # The producer is held back by the full queue
+        assert len(produced) <= 4
+        assert [x async for x in iterator] == list(range(1, 10))
+
+    async def test_observable_observe_on(self) -> None:
+        loop = asyncio.get_running_loop()
+        done = asyncio.Event()
+        threads: set[int] = set()
+        result: list[int] = []
+
+        def on_next(x: int) -> None:
+            threads.add(threading.get_ident())
+            result.append(x)
+
+        stream = Observable.from_iterable(range(3)).observe_on(loop)
+        worker = threading.Thread(target=stream.subscribe, args=(on_next, None, done.set))
+        worker.start()
+        await done.wait()
+        worker.join()
+        assert result == [0, 1, 2]
+        assert threads == {threading.get_ident()}
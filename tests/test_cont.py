@@ -1,5 +1,8 @@
 import unittest
-from collections.abc import Callable
+from collections.abc import Callable, Generator
+from typing import Any
+
+import pytest
 
 from oslash.cont import Cont
 from oslash.util import compose, identity
@@ -124,3 +127,99 @@ class TestContMonad(unittest.TestCase):
         g: Callable[[int], Cont[int, int]] = lambda y: Cont.unit(y * 42)
 
         assert m.bind(f).bind(g) == m.bind(lambda x: f(x).bind(g))
+
+
+class TestContStackSafety(unittest.TestCase):
+    def test_cont_deep_bind_chain(self) -> None:
+        m: Cont[int, int] = Cont.unit(0)
+        for _ in range(10000):
+            m = m.bind(lambda x: Cont.unit(x + 1))
+
+        assert m.run(identity) == 10000
+
+    def test_cont_deep_map_chain(self) -> None:
+        m: Cont[int, int] = Cont.unit(0)
+        for _ in range(10000):
+            m = m.map(lambda x: x + 1)
+
+        assert m.run(identity) == 10000
+
+    def test_cont_deep_recursive_loop(self) -> None:
+        def loop(n: int) -> Cont[int, int]:
+            return Cont.unit(n) if n == 0 else Cont.unit(n - 1).bind(loop)
+
+        assert loop(10000).run(identity) == 0
+
+    def test_cont_call_cc_loop(self) -> None:
+        def loop(n: int, escape: Callable[[int], Cont[int, int]]) -> Cont[int, int]:
+            return escape(n) if n == 10000 else Cont.unit(n + 1).bind(lambda m: loop(m, escape))
+
+        assert Cont.call_cc(lambda escape: loop(0, escape)).run(identity) == 10000
+
+    def test_cont_comp_uses_result(self) -> None:
+        m: Cont[int, int] = Cont(lambda c: c(20) + 1)
+
+        assert m.bind(lambda x: Cont.unit(x * 2)).run(identity) == 41
+
+
+class TestContDelimited(unittest.TestCase):
+    def test_cont_reset_without_shift(self) -> None:
+        m: Cont[int, int] = Cont.reset(Cont.unit(42).map(lambda x: x + 1))
+
+        assert m.run(identity) == 43
+
+    def test_cont_shift_twice(self) -> None:
+        # reset (shift (\k -> return (k (k 10))) >>= \x -> return (x + 1))
+        m: Cont[int, int] = Cont.shift(lambda k: Cont.unit(k(k(10))))
+        r: Cont[int, int] = Cont.reset(m.map(lambda x: x + 1))
+
+        assert r.map(lambda x: x * 2).run(identity) == 24
+
+    def test_cont_shift_abort(self) -> None:
+        m: Cont[int, int] = Cont.shift(lambda _: Cont.unit(-1))
+        r: Cont[int, int] = Cont.reset(m.map(lambda x: x + 1))
+
+        assert r.map(lambda x: x * 2).run(identity) == -2
+
+
+class TestContGenerator(unittest.TestCase):
+    def test_cont_from_generator(self) -> None:
+        def gen() -> Generator[Cont[int, int], int, int]:
+            x = yield Cont.unit(20)
+            y = yield Cont.unit(x + 1)
+            return x + y
+
+        m: Cont[int, int] = Cont.from_generator(gen)
+
+        assert m.run(identity) == 41
+        assert m.run(identity) == 41
+
+    def test_cont_from_generator_early_exit(self) -> None:
+        visited: list[int] = []
+
+        def search() -> Generator[Cont[Any, int], Any, int]:
+            for x in range(100):
+                visited.append(x)
+                if x * x > 50:
+                    yield Cont.shift(lambda _, x=x: Cont.unit(x))
+            return -1
+
+        assert Cont.reset(Cont.from_generator(search)).run(identity) == 8
+        assert visited == list(range(9))
+
+    def test_cont_from_generator_is_stack_safe(self) -> None:
+        def count() -> Generator[Cont[int, int], int, int]:
+            n = 0
+            for _ in range(10000):
+                n = yield Cont.unit(n + 1)
+            return n
+
+        assert Cont.from_generator(count).run(identity) == 10000
+
+    def test_cont_from_generator_one_shot(self) -> None:
+        def gen() -> Generator[Cont[Any, int], Any, int]:
+            x = yield Cont.shift(lambda k: Cont.unit(k(1) + k(2)))
+            return x
+
+        with pytest.raises(ValueError, match="resumed once"):
+            Cont.reset(Cont.from_generator(gen)).run(identity)
@@ -1,17 +1,58 @@
+import asyncio
+import gc
+import sys
+import tempfile
+import threading
+import typing
 import unittest
+import warnings
+from collections.abc import Iterator
+from contextlib import contextmanager, suppress
+from pathlib import Path
+from typing import Any
+from unittest import mock
+
+import pytest
 
 import oslash.ioaction
-from oslash import Put, Return, put_line
-from oslash.util import Unit
+from oslash import IO, Put, ReadFile, Return, get_line, put_line
+from oslash.ioaction import (
+    AppendFile,
+    Bind,
+    Map,
+    ResourcePool,
+    append_file,
+    bracket,
+    flush,
+    from_async,
+    gather,
+    io_stats,
+    mmap_file,
+    optimize,
+    par,
+    pretty,
+    read_binary_chunks,
+    read_binary_lines,
+    read_chunks,
+    read_file,
+    read_lines,
+    run_process,
+    with_resource,
+    write_file,
+    write_lines,
+)
+from oslash.iohandler import StdioHandler
+from oslash.util import Unit, identity
 
 
 class MyMock:
     """Mock for testing side effects"""
 
-    def __init__(self) -> None:
+    def __init__(self, test: unittest.TestCase) -> None:
         self.value: str | None = None
-        oslash.ioaction.pure_input = self.pure_input
-        oslash.ioaction.pure_print = self.pure_print
+        patcher = mock.patch.multiple(oslash.ioaction, pure_input=self.pure_input, pure_print=self.pure_print)
+        patcher.start()
+        test.addCleanup(patcher.stop)
 
     def pure_print(self, world: int, text: str) -> int:
         self.value = text
@@ -25,13 +66,648 @@ class MyMock:
 
 class TestPut(unittest.TestCase):
     def test_put_line(self) -> None:
-        pm: MyMock = MyMock()
+        pm: MyMock = MyMock(self)
         action = put_line("hello, world!")
         action()
         assert pm.value == "hello, world!"
 
     def test_put_return(self) -> None:
-        pm: MyMock = MyMock()
+        pm: MyMock = MyMock(self)
         action: Put[tuple[()]] = Put("hello, world!", Return(Unit))
         action()
         assert pm.value == "hello, world!"
+
+
+class Recorder:
+    """Mock recording all the side effects"""
+
+    def __init__(self, test: unittest.TestCase, inputs: list[str] | None = None) -> None:
+        self.events: list[str] = []
+        self.writes = 0
+        self.inputs = inputs or []
+        patcher = mock.patch.multiple(
+            oslash.ioaction, pure_input=self.pure_input, pure_print=self.pure_print, pure_flush=self.pure_flush
+        )
+        patcher.start()
+        test.addCleanup(patcher.stop)
+
+    @property
+    def lines(self) -> list[str]:
+        return [event for event in self.events if event not in ("<input>", "<flush>")]
+
+    def pure_print(self, world: int, text: str) -> int:
+        self.writes += 1
+        self.events.extend(text.split("\n"))
+        return world + 1
+
+    def pure_input(self, world: int) -> tuple[int, str]:
+        self.events.append("<input>")
+        return world + 1, self.inputs.pop(0)
+
+    def pure_flush(self, world: int) -> int:
+        self.events.append("<flush>")
+        return world + 1
+
+
+class TestInterpreter(unittest.TestCase):
+    def test_bind_chain_left(self) -> None:
+        recorder = Recorder(self)
+        action: IO[tuple[()]] = put_line("0")
+        for i in range(1, 100_000):
+            action = action.bind(lambda _, i=i: put_line(str(i)))
+        action()
+        assert len(recorder.lines) == 100_000
+        assert recorder.lines[-1] == "99999"
+
+    def test_bind_chain_right(self) -> None:
+        recorder = Recorder(self)
+
+        def count(i: int) -> IO[int]:
+            if i == 100_000:
+                return Return(i)
+            return put_line(str(i)) | (lambda _: count(i + 1))
+
+        assert count(0)() == 100_000
+        assert len(recorder.lines) == 100_000
+
+    def test_get_bind(self) -> None:
+        recorder = Recorder(self, ["Ada", "36"])
+        action = get_line() | (lambda name: get_line().map(lambda age: f"{name} is {age}"))
+        action = action | put_line
+        action()
+        assert recorder.lines == ["Ada is 36"]
+
+    def test_bind_str(self) -> None:
+        action = put_line("hi") | (lambda _: get_line())
+        assert "Bind" in str(action)
+        assert 'Put ("hi"' in str(action)
+
+
+class TestPretty(unittest.TestCase):
+    def test_no_continuations_called(self) -> None:
+        called: list[str] = []
+
+        def greet(name: str) -> IO[tuple[()]]:
+            called.append(name)
+            return put_line(name)
+
+        action = get_line() | greet
+        assert str(action) == "Bind (greet)\nGet (Return)"
+        assert called == []
+
+    def test_par(self) -> None:
+        action = par(put_line("a"), get_line())
+        assert pretty(action) == 'Par (Return)\n  - Put ("a")\n    Return ()\n  - Get (Return)'
+
+    def test_max_depth(self) -> None:
+        action = put_line("a") >> put_line("b")
+        assert pretty(action, max_depth=2) == 'Bind (<lambda>)\nPut ("a")\n...'
+
+    def test_max_width(self) -> None:
+        action = par(*(flush() for _ in range(10)))
+        lines = pretty(action, max_width=2, max_depth=2).splitlines()
+        assert lines == ["Par (Return)", "  - Flush", "    ...", "  - Flush", "    ...", "  - ... (8 more)"]
+
+    def test_deep(self) -> None:
+        action: IO[tuple[()]] = put_line("0")
+        for i in range(1, 100_000):
+            action = action.bind(lambda _, i=i: put_line(str(i)))
+        assert len(pretty(action).splitlines()) == 100_001
+
+    def test_io_stats(self) -> None:
+        action = par(put_line("a"), get_line() >> flush()).map(len)
+        stats = io_stats(action)
+        assert stats.nodes == 6
+        assert stats.depth == 4
+        assert stats.counts == {"Map": 1, "Par": 1, "Put": 1, "Return": 1, "Bind": 1, "Get": 1}
+
+
+class TestOutputBuffer(unittest.TestCase):
+    def tearDown(self) -> None:
+        oslash.ioaction.output_buffer_size = 64 * 1024
+
+    def test_put_buffered(self) -> None:
+        recorder = Recorder(self)
+        action = put_line("a") >> put_line("b") >> put_line("c")
+        action()
+        assert recorder.lines == ["a", "b", "c"]
+        assert recorder.writes == 1
+
+    def test_put_buffer_size(self) -> None:
+        oslash.ioaction.output_buffer_size = 4
+        recorder = Recorder(self)
+        action = put_line("a") >> put_line("b") >> put_line("c")
+        action()
+        assert recorder.lines == ["a", "b", "c"]
+        assert recorder.writes == 2
+
+    def test_put_unbuffered(self) -> None:
+        oslash.ioaction.output_buffer_size = 0
+        recorder = Recorder(self)
+        action = put_line("a") >> put_line("b")
+        action()
+        assert recorder.writes == 2
+
+    def test_put_flushed_before_get(self) -> None:
+        recorder = Recorder(self, ["Ada"])
+        action = put_line("Name?") >> get_line() | (lambda name: put_line(f"Hi {name}"))
+        action()
+        assert recorder.events == ["Name?", "<input>", "Hi Ada"]
+
+    def test_flush(self) -> None:
+        recorder = Recorder(self)
+        action = put_line("a") >> flush() >> put_line("b")
+        action()
+        assert recorder.events == ["a", "<flush>", "b"]
+
+    def test_put_flushed_on_error(self) -> None:
+        recorder = Recorder(self)
+
+        def fail(_: tuple[()]) -> IO[tuple[()]]:
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            (put_line("a") | fail)()
+        assert recorder.lines == ["a"]
+
+
+class TestOptimize(unittest.TestCase):
+    def test_map_chain(self) -> None:
+        recorder = Recorder(self)
+        action: IO[int] = put_line("hi") | (lambda _: Return(0))
+        action = action.map(lambda x: x)  # Bind.map gives a Map
+        for _ in range(100_000):
+            action = action.map(lambda x: x + 1)
+        assert action() == 100_000
+        assert recorder.lines == ["hi"]
+
+    def test_map_chain_fused(self) -> None:
+        action = Map(get_line(), len).map(lambda x: x + 1).map(str)
+        optimized = optimize(action)
+        assert isinstance(optimized, Map)
+        assert not isinstance(optimized._value[0], Map)  # type: ignore
+        Recorder(self, ["abc"])
+        assert optimized() == "4"
+
+    def test_map_return(self) -> None:
+        optimized = optimize(Map(Map(Return(1), lambda x: x + 1), str))
+        assert isinstance(optimized, Return)
+        assert optimized._value == "2"  # type: ignore
+
+    def test_map_return_after_put(self) -> None:
+        optimized = optimize(Put("hi", Map(Return(1), lambda x: x + 1)))
+        assert isinstance(optimized, Map)
+        assert isinstance(optimized._value[0], Put)  # type: ignore
+        recorder = Recorder(self)
+        assert optimized() == 2
+        assert recorder.lines == ["hi"]
+
+    def test_map_return_error_after_put(self) -> None:
+        recorder = Recorder(self)
+        with pytest.raises(ZeroDivisionError):
+            Put("a", Map(Return(1), lambda _: 1 // 0))()
+        assert recorder.lines == ["a"]
+
+    def test_effect_map_chain(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            filename = str(Path(directory) / "data.txt")
+            Path(filename).write_text("text")
+            action: IO[int] = read_file(filename).map(len)
+            for _ in range(50_000):
+                action = action.map(lambda x: x + 1)
+            assert isinstance(optimize(action)._value[0], ReadFile)  # type: ignore
+            assert action() == 50_004
+
+    def test_map_identity(self) -> None:
+        action = get_line()
+        assert optimize(Map(action, identity)) is action
+
+    def test_bind_return(self) -> None:
+        action = get_line()
+        assert optimize(Bind(action, Return)) is action
+        optimized = optimize(Bind(Return(2), lambda x: Put(str(x), Return(x))))
+        assert isinstance(optimized, Put)
+
+    def test_bind_return_after_put(self) -> None:
+        action = Put("a", Bind(Return(2), lambda x: Put(str(x), Return(x))))
+        optimized = optimize(action)
+        assert optimized is action
+        recorder = Recorder(self)
+        assert optimized() == 2
+        assert recorder.lines == ["a", "2"]
+
+    def test_unchanged(self) -> None:
+        action = put_line("a") | (lambda _: put_line("b"))
+        assert optimize(action) is action
+
+    def test_deep_spine(self) -> None:
+        action: IO[int] = Return(0)
+        for i in range(100_000):
+            action = Map(Put(str(i), action), lambda x: x + 1)
+        optimized = optimize(action)
+        assert isinstance(optimized, Map)
+        assert isinstance(optimized._value[0], Put)  # type: ignore
+        recorder = Recorder(self)
+        assert optimized() == 100_000
+        assert len(recorder.lines) == 100_000
+
+    def test_read_file_map(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            filename = str(Path(directory) / "data.txt")
+            Path(filename).write_text("one\ntwo\n")
+            assert read_file(filename).map(str.splitlines)() == ["one", "two"]
+
+
+class TestReadStream(unittest.TestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.filename = str(Path(directory.name) / "data.txt")
+        Path(self.filename).write_text("one\ntwo\nthree\n")
+
+    def test_read_lines(self) -> None:
+        action = read_lines(self.filename).map(list)
+        assert action() == ["one\n", "two\n", "three\n"]
+
+    def test_read_lines_fold(self) -> None:
+        action = read_lines(self.filename).map(lambda lines: sum(len(line) for line in lines))
+        assert action() == 14
+
+    def test_read_lines_bind(self) -> None:
+        recorder = Recorder(self)
+        action = read_lines(self.filename) | (lambda lines: put_line(next(lines).strip()))
+        action()
+        assert recorder.lines == ["one"]
+
+    def test_read_lines_missing(self) -> None:
+        with pytest.raises(FileNotFoundError):
+            read_lines(self.filename + ".missing")()
+
+    def test_read_lines_closes_file(self) -> None:
+        opened: list[typing.IO[Any]] = []
+
+        class Handler(StdioHandler):
+            def open(self, filename: str, mode: str) -> typing.IO[Any]:
+                opened.append(super().open(filename, mode))
+                return opened[-1]
+
+        with Handler():
+            lines = read_lines(self.filename)()
+            assert next(lines) == "one\n"
+            lines.close()  # type: ignore[attr-defined]
+            assert opened[-1].closed
+            assert list(lines) == []
+
+            chunks = read_chunks(self.filename, 5)()
+            assert list(chunks) == ["one\nt", "wo\nth", "ree\n"]
+            assert opened[-1].closed
+
+    def test_read_lines_never_started(self) -> None:
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always", ResourceWarning)
+            lines = read_lines(self.filename)()
+            del lines
+            gc.collect()
+        assert not [warning for warning in caught if warning.category is ResourceWarning]
+
+    def test_read_binary_lines(self) -> None:
+        assert list(read_binary_lines(self.filename)()) == [b"one\n", b"two\n", b"three\n"]
+
+    def test_read_chunks(self) -> None:
+        chunks = list(read_chunks(self.filename, 5)())
+        assert chunks == ["one\nt", "wo\nth", "ree\n"]
+        assert list(read_binary_chunks(self.filename, 10)()) == [b"one\ntwo\nth", b"ree\n"]
+
+    def test_mmap_file(self) -> None:
+        view = mmap_file(self.filename)()
+        assert bytes(view[4:7]) == b"two"
+        assert len(view) == 14
+
+    def test_mmap_empty_file(self) -> None:
+        Path(self.filename).write_bytes(b"")
+        assert len(mmap_file(self.filename)()) == 0
+
+
+class TestWriteFile(unittest.TestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+        self.filename = str(self.directory / "out.txt")
+
+    def test_write_file(self) -> None:
+        action = write_file(self.filename, "hello\n") >> append_file(self.filename, "world\n")
+        action()
+        assert Path(self.filename).read_text() == "hello\nworld\n"
+
+    def test_write_lines_streamed(self) -> None:
+        consumed: list[int] = []
+
+        def lines() -> Iterator[str]:
+            for i in range(3):
+                consumed.append(i)
+                yield f"{i}\n"
+
+        action = write_lines(self.filename, lines())
+        assert consumed == []
+        action()
+        assert Path(self.filename).read_text() == "0\n1\n2\n"
+
+    def test_copy_lines(self) -> None:
+        Path(self.filename).write_text("a\nb\n")
+        copy = str(self.directory / "copy.txt")
+        action = read_lines(self.filename) | (lambda lines: write_lines(copy, lines, buffer_size=1024))
+        action()
+        assert Path(copy).read_text() == "a\nb\n"
+
+    def test_write_atomic(self) -> None:
+        Path(self.filename).write_text("old")
+
+        def lines() -> Iterator[str]:
+            yield "new"
+            assert Path(self.filename).read_text() == "old"
+            yield "er"
+
+        write_lines(self.filename, lines(), atomic=True)()
+        assert Path(self.filename).read_text() == "newer"
+        assert [path.name for path in self.directory.iterdir()] == ["out.txt"]
+
+    def test_write_atomic_error(self) -> None:
+        Path(self.filename).write_text("old")
+
+        def lines() -> Iterator[str]:
+            yield "new"
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            write_lines(self.filename, lines(), atomic=True)()
+        assert Path(self.filename).read_text() == "old"
+        assert [path.name for path in self.directory.iterdir()] == ["out.txt"]
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX file modes")
+    def test_write_atomic_mode(self) -> None:
+        reference = self.directory / "reference.txt"
+        reference.write_text("")
+        with mock.patch("os.umask", side_effect=AssertionError("umask changed")):
+            write_file(self.filename, "new", atomic=True)()
+        assert Path(self.filename).stat().st_mode == reference.stat().st_mode
+
+    def test_append_atomic(self) -> None:
+        with pytest.raises(ValueError, match="atomic"):
+            AppendFile(self.filename, "text", Return(Unit), atomic=True)
+
+    def test_write_file_map(self) -> None:
+        action = write_file(self.filename, "x").map(lambda _: 42)
+        assert action() == 42
+        assert Path(self.filename).read_text() == "x"
+
+
+def sleep_io(seconds: float, value: int) -> IO[int]:
+    async def sleep() -> int:
+        await asyncio.sleep(seconds)
+        return value
+
+    return from_async(sleep)
+
+
+class InFlight:
+    """Actions that wait for each other, counting how many run at once.
+
+    The actions only finish when parties of them run at the same time,
+    so running them tests concurrency without timing anything.
+    """
+
+    def __init__(self, parties: int) -> None:
+        self.running = 0
+        self.max_running = 0
+        self.lock = threading.Lock()
+        self.barrier = threading.Barrier(parties, timeout=10)
+        self.async_barrier = asyncio.Barrier(parties)
+
+    def enter(self) -> None:
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+
+    def exit(self) -> None:
+        with self.lock:
+            self.running -= 1
+
+    def action(self, value: int) -> IO[int]:
+        """An action for threads, e.g. of par run without asyncio."""
+
+        async def wait() -> int:
+            self.enter()
+            try:
+                self.barrier.wait()
+            finally:
+                self.exit()
+            return value
+
+        return from_async(wait)
+
+    def async_action(self, value: int) -> IO[int]:
+        """An action for tasks, e.g. of par run on asyncio."""
+
+        async def wait() -> int:
+            self.enter()
+            try:
+                async with asyncio.timeout(10):
+                    await self.async_barrier.wait()
+            finally:
+                self.exit()
+            return value
+
+        return from_async(wait)
+
+
+class TestAsyncIO(unittest.IsolatedAsyncioTestCase):
+    async def test_run_async(self) -> None:
+        recorder = Recorder(self, ["Ada"])
+        action = put_line("Name?") >> get_line() | (lambda name: put_line(f"Hi {name}") >> IO.unit(len(name)))
+        assert await action.run_async() == 3
+        assert recorder.events == ["Name?", "<input>", "Hi Ada"]
+
+    async def test_par_overlaps(self) -> None:
+        in_flight = InFlight(3)
+        action = par(*(in_flight.async_action(i) for i in (1, 2, 3))).map(sum)
+        assert await action.run_async() == 6
+        assert in_flight.max_running == 3
+
+    async def test_gather_bind(self) -> None:
+        action = gather(IO.unit(1), sleep_io(0, 2)) | (lambda xs: IO.unit(xs[0] + xs[1]))
+        assert await action.run_async() == 3
+
+    async def test_run_process(self) -> None:
+        action = run_process(sys.executable, "-c", "print(input().upper())", input="hello").map(
+            lambda p: (p.returncode, p.stdout.strip())
+        )
+        assert await action.run_async() == (0, "HELLO")
+
+
+class TestPar(unittest.TestCase):
+    def test_par_threads(self) -> None:
+        in_flight = InFlight(2)
+        action = par(in_flight.action(1), in_flight.action(2))
+        assert action() == [1, 2]
+        assert in_flight.max_running == 2
+
+    def test_run_process(self) -> None:
+        process = run_process(sys.executable, "-c", "import sys; sys.exit(3)")()
+        assert process.returncode == 3
+
+
+class TestTraverse(unittest.TestCase):
+    def test_sequence(self) -> None:
+        recorder = Recorder(self)
+        action = IO.sequence([put_line("a") >> Return(1), put_line("b") >> Return(2)])
+        assert action() == [1, 2]
+        assert recorder.lines == ["a", "b"]
+
+    def test_sequence_long(self) -> None:
+        action = IO.sequence(Return(i) for i in range(100_000)).map(sum)
+        assert action() == sum(range(100_000))
+        assert action() == sum(range(100_000))
+
+    def test_traverse(self) -> None:
+        made: list[int] = []
+
+        def fn(i: int) -> IO[int]:
+            made.append(i)
+            return Return(i * 2)
+
+        action = IO.traverse(range(3), fn)
+        assert made == []
+        assert action() == [0, 2, 4]
+        assert made == [0, 1, 2]
+        assert "Traverse (3, fn)" in str(action)
+
+    def test_traverse_read_file(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            paths = [Path(directory) / f"{i}.txt" for i in range(3)]
+            for i, path in enumerate(paths):
+                path.write_text(str(i))
+            assert IO.traverse(map(str, paths), read_file)() == ["0", "1", "2"]
+            assert IO.par_traverse(map(str, paths), read_file, max_workers=2)() == ["0", "1", "2"]
+
+    def test_par_traverse_ordered(self) -> None:
+        action = IO.par_traverse(range(4), lambda i: sleep_io(0.05 * (4 - i), i))
+        assert action() == [0, 1, 2, 3]
+
+    def test_par_traverse_max_workers(self) -> None:
+        in_flight = InFlight(2)
+        action = IO.par_traverse(range(4), in_flight.action, max_workers=2)
+        assert action() == [0, 1, 2, 3]
+        assert in_flight.max_running == 2
+
+    def test_par_traverse_max_workers_async(self) -> None:
+        in_flight = InFlight(2)
+        action = IO.par_traverse(range(4), in_flight.async_action, max_workers=2).map(sum)
+        assert asyncio.run(action.run_async()) == 6
+        assert in_flight.max_running == 2
+
+
+class TestBracket(unittest.TestCase):
+    def test_bracket(self) -> None:
+        recorder = Recorder(self)
+        action = bracket(
+            put_line("acquire") >> Return(1),
+            lambda r: put_line(f"use {r}") >> Return(r + 1),
+            lambda r: put_line(f"release {r}"),
+        )
+        assert action() == 2
+        assert recorder.lines == ["acquire", "use 1", "release 1"]
+
+    def test_bracket_error(self) -> None:
+        recorder = Recorder(self)
+
+        def use(r: int) -> IO[int]:
+            raise RuntimeError("failed")
+
+        action = bracket(Return(1), use, lambda r: put_line(f"release {r}"))
+        with pytest.raises(RuntimeError):
+            action()
+        assert recorder.lines == ["release 1"]
+
+    def test_bracket_map(self) -> None:
+        action = bracket(Return(1), lambda r: Return(r + 1), lambda _: Return(None)).map(str)
+        assert action() == "2"
+        assert "Bracket (<lambda>, <lambda>)" in str(action)
+
+    def test_bracket_async(self) -> None:
+        recorder = Recorder(self)
+        action = bracket(Return(1), lambda r: put_line(f"use {r}") >> Return(r), lambda r: put_line(f"release {r}"))
+        assert asyncio.run(action.run_async()) == 1
+        assert recorder.lines == ["use 1", "release 1"]
+
+    def test_with_resource(self) -> None:
+        events: list[str] = []
+
+        @contextmanager
+        def manager() -> Iterator[str]:
+            events.append("enter")
+            try:
+                yield "resource"
+            finally:
+                events.append("exit")
+
+        action = with_resource(manager, lambda r: Return(r.upper()))
+        assert action() == "RESOURCE"
+        assert action() == "RESOURCE"
+        assert events == ["enter", "exit", "enter", "exit"]
+
+    def test_with_resource_file(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "data.txt"
+            path.write_text("one\ntwo\n")
+            action = with_resource(path.open, lambda f: Return(f.readline()) | (lambda a: Return(a + f.readline())))
+            assert action() == "one\ntwo\n"
+
+    def test_with_resource_suppressed(self) -> None:
+        def use(resource: None) -> IO[int]:
+            raise KeyError("key")
+
+        action = with_resource(lambda: suppress(KeyError), use)
+        with pytest.raises(RuntimeError, match="suppressed"):
+            action()
+        with pytest.raises(RuntimeError, match="suppressed"):
+            asyncio.run(action.run_async())
+
+
+class TestResourcePool(unittest.TestCase):
+    def setUp(self) -> None:
+        self.created: list[int] = []
+        self.closed: list[int] = []
+        self.pool = ResourcePool(self.create, self.closed.append, max_size=2)
+
+    def create(self) -> int:
+        self.created.append(len(self.created))
+        return self.created[-1]
+
+    def test_reuse(self) -> None:
+        action = self.pool.use(Return)
+        assert [action() for _ in range(100)] == [0] * 100
+        assert self.created == [0]
+        self.pool.close()
+        assert self.closed == [0]
+
+    def test_max_size(self) -> None:
+        resources = [self.pool.acquire() for _ in range(3)]
+        for r in resources:
+            self.pool.release(r)
+        assert self.closed == [2]
+
+    def test_error_closes(self) -> None:
+        def use(r: int) -> IO[int]:
+            raise RuntimeError("broken")
+
+        with pytest.raises(RuntimeError):
+            self.pool.use(use)()
+        assert self.closed == [0]
+        assert self.pool.use(Return)() == 1
+
+    def test_par(self) -> None:
+        with self.pool:
+            action = par(*(self.pool.use(Return) for _ in range(10)))
+            assert len(action()) == 10
+        assert sorted(self.closed) == self.created
@@ -0,0 +1,109 @@
+import asyncio
+import tempfile
+import unittest
+from pathlib import Path
+
+import pytest
+
+from oslash import IO, append_file, get_line, mmap_file, put_line, read_file, read_lines, write_lines
+from oslash.ioaction import par
+from oslash.iohandler import Handler, RecordingHandler, ReplayHandler, StdioHandler, StringIOHandler, current_handler
+
+
+def greet() -> IO[str]:
+    return get_line() | (lambda name: put_line(f"Hello {name}!") | (lambda _: read_file("motd.txt")))
+
+
+class TestHandler(unittest.TestCase):
+    def test_default_handler(self) -> None:
+        assert isinstance(current_handler(), StdioHandler)
+
+    def test_incomplete_handler(self) -> None:
+        class PrintHandler(Handler):
+            def print(self, text: str) -> None:
+                pass
+
+        with pytest.raises(TypeError):
+            PrintHandler()  # type: ignore[abstract]
+
+    def test_string_io(self) -> None:
+        with StringIOHandler("Ada\n", {"motd.txt": "Welcome"}) as handler:
+            assert current_handler() is handler
+            assert greet()() == "Welcome"
+        assert handler.getvalue() == "Hello Ada!\n"
+        assert isinstance(current_handler(), StdioHandler)
+
+    def test_string_io_eof(self) -> None:
+        with StringIOHandler(), pytest.raises(EOFError):
+            get_line()()
+
+    def test_string_io_missing_file(self) -> None:
+        with StringIOHandler(), pytest.raises(FileNotFoundError):
+            read_file("missing.txt")()
+
+    def test_nested(self) -> None:
+        with StringIOHandler() as outer:
+            with StringIOHandler() as inner:
+                put_line("inner")()
+            put_line("outer")()
+        assert inner.getvalue() == "inner\n"
+        assert outer.getvalue() == "outer\n"
+
+    def test_stdio_read_file(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            filename = str(Path(directory) / "data.txt")
+            Path(filename).write_text("text")
+            assert read_file(filename)() == "text"
+
+    def test_record_replay(self) -> None:
+        with RecordingHandler(StringIOHandler("Ada\n", {"motd.txt": "Welcome"})) as recorder:
+            greet()()
+        assert recorder.events == [
+            ("input", None, "Ada"),
+            ("print", "Hello Ada!", None),
+            ("read_file", "motd.txt", "Welcome"),
+        ]
+
+        with ReplayHandler(recorder.events) as replay:
+            assert greet()() == "Welcome"
+        assert replay.done
+
+    def test_replay_mismatch(self) -> None:
+        replay = ReplayHandler([("input", None, "Ada"), ("print", "Hello Ada!", None)])
+        with replay, pytest.raises(ValueError, match="expected print"):
+            (get_line() | (lambda name: put_line(f"Bye {name}")))()
+
+    def test_replay_ended(self) -> None:
+        with ReplayHandler([]), pytest.raises(ValueError, match="Replay ended"):
+            get_line()()
+
+    def test_string_io_files(self) -> None:
+        action = write_lines("out.txt", ["one\n", "two\n"]) >> append_file("out.txt", "three\n")
+        action = action >> read_lines("out.txt").map(list)
+        with StringIOHandler() as handler:
+            assert action() == ["one\n", "two\n", "three\n"]
+            assert bytes(mmap_file("out.txt")()) == b"one\ntwo\nthree\n"
+        assert handler.files == {"out.txt": "one\ntwo\nthree\n"}
+
+    def test_record_replay_files(self) -> None:
+        action = write_lines("out.txt", ["a\n", "b\n"]) >> read_lines("out.txt").map(list)
+        with RecordingHandler(StringIOHandler()) as recorder:
+            assert action() == ["a\n", "b\n"]
+        assert recorder.events == [("write_file", "out.txt", "a\nb\n"), ("open", "out.txt", "a\nb\n")]
+
+        with ReplayHandler(recorder.events) as replay:
+            assert action() == ["a\n", "b\n"]
+        assert replay.done
+
+        with ReplayHandler(recorder.events), pytest.raises(ValueError, match="to write"):
+            write_lines("out.txt", ["c\n"])()
+
+    def test_par(self) -> None:
+        with StringIOHandler("a\nb\n") as handler:
+            assert sorted(par(get_line(), get_line())()) == ["a", "b"]
+        assert handler.stdin.read() == ""
+
+    def test_run_async(self) -> None:
+        with StringIOHandler("Ada\n", {"motd.txt": "Welcome"}) as handler:
+            assert asyncio.run(greet().run_async()) == "Welcome"
+        assert handler.getvalue() == "Hello Ada!\n"
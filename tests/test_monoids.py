@@ -0,0 +1,59 @@
+import unittest
+from typing import Any
+
+from oslash import Writer
+from oslash.monoids import Counter, Max, Min, Product, Sum
+
+
+class TestMonoids(unittest.TestCase):
+    def test_sum(self) -> None:
+        assert Sum(2) + Sum(3) == Sum(5)
+        assert Sum.empty() + Sum(3) == Sum(3)
+
+    def test_product(self) -> None:
+        assert Product(2) + Product(3) == Product(6)
+        assert Product(3) + Product.empty() == Product(3)
+
+    def test_max_min(self) -> None:
+        assert Max(2) + Max(3) + Max.empty() == Max(3)
+        assert Min(2) + Min(3) + Min.empty() == Min(2)
+
+    def test_counter(self) -> None:
+        counts = Counter("abca") + Counter({"a": -1})
+        assert counts == Counter({"a": 1, "b": 1, "c": 1})
+        assert isinstance(counts, Counter)
+        assert Counter.empty() + Counter("a") == Counter("a")
+
+    def test_add_is_pure(self) -> None:
+        a, b = Sum(1), Sum(2)
+        _ = a + b
+        assert a == Sum(1)
+        assert b == Sum(2)
+
+    def test_iadd_is_in_place(self) -> None:
+        acc = Sum.empty()
+        acc_id = id(acc)
+        acc += Sum(2)
+        assert id(acc) == acc_id
+        assert acc == Sum(2)
+
+
+class TestMonoidWriter(unittest.TestCase):
+    def test_sum_writer(self) -> None:
+        SumWriter: type[Any] = Writer.create("SumWriter", Sum)  # type: ignore[assignment]
+        entries = [Sum(i) for i in range(100)]
+        m: Any = SumWriter.unit(0)
+        for entry in entries:
+            m = m.bind(lambda x, entry=entry: SumWriter(x + 1, entry))
+        assert m.run() == (100, Sum(4950))
+        assert entries[0] == Sum(0)
+
+    def test_counter_writer(self) -> None:
+        HistogramWriter: type[Any] = Writer.create("HistogramWriter", Counter)  # type: ignore[assignment]
+        m = HistogramWriter(1, Counter("a")).bind(lambda x: HistogramWriter(x, Counter("ab")))
+        assert m.run() == (1, Counter({"a": 2, "b": 1}))
+
+    def test_max_writer(self) -> None:
+        MaxWriter: type[Any] = Writer.create("MaxWriter", Max)  # type: ignore[assignment]
+        m = MaxWriter.unit(1).bind(lambda x: MaxWriter(x, Max(7))).bind(lambda x: MaxWriter(x, Max(3)))
+        assert m.run() == (1, Max(7))
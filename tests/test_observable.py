@@ -1,7 +1,27 @@
+import threading
+import time
 import unittest
 from collections.abc import Callable
-
-from oslash.observable import Observable
+from unittest import mock
+
+import pytest
+
+from oslash.observable import (
+    BehaviorSubject,
+    Disposable,
+    Observable,
+    Observer,
+    Overflow,
+    ReplaySubject,
+    Subject,
+)
+from oslash.scheduler import (
+    ProcessPoolScheduler,
+    RealTimeScheduler,
+    ThreadPoolScheduler,
+    TimeScheduler,
+    VirtualTimeScheduler,
+)
 from oslash.util import compose, identity
 
 
@@ -125,3 +145,538 @@ class TestObservableMonad(unittest.TestCase):
         g: Callable[[int], Observable[int]] = lambda y: Observable.unit(y * 42)
 
         assert m.bind(f).bind(g) == m.bind(lambda x: f(x).bind(g))
+
+
+class TestObservableProtocol(unittest.TestCase):
+    def test_observable_completed(self) -> None:
+        result: list[str] = []
+
+        Observable.from_iterable([1, 2]).map(lambda x: x * 10).filter(lambda x: x > 10).subscribe(
+            lambda x: result.append(f"OnNext({x})"), on_completed=lambda: result.append("OnCompleted")
+        )
+        assert result == ["OnNext(20)", "OnCompleted"]
+
+    def test_observable_flat_map_completed(self) -> None:
+        result: list[str] = []
+
+        def inner(x: int) -> Observable[int]:
+            return Observable.from_iterable([x, x + 1])
+
+        Observable.from_iterable([10, 20]).flat_map(inner).subscribe(
+            lambda x: result.append(f"OnNext({x})"), on_completed=lambda: result.append("OnCompleted")
+        )
+        assert result == ["OnNext(10)", "OnNext(11)", "OnNext(20)", "OnNext(21)", "OnCompleted"]
+
+    def test_observable_error(self) -> None:
+        errors: list[Exception] = []
+        result: list[int] = []
+
+        Observable.from_iterable([1, 0, 2]).map(lambda x: 10 // x).subscribe(result.append, errors.append)
+        assert result == [10]
+        assert len(errors) == 1
+        assert isinstance(errors[0], ZeroDivisionError)
+
+    def test_observable_error_without_handler(self) -> None:
+        with pytest.raises(ZeroDivisionError):
+            Observable.from_iterable([1, 0]).map(lambda x: 10 // x).subscribe(lambda _: None)
+
+    def test_observable_error_in_producer(self) -> None:
+        errors: list[Exception] = []
+
+        def subscribe(observer: Observer[int]) -> None:
+            raise ValueError("boom")
+
+        Observable(subscribe).map(lambda x: x + 1).subscribe(on_error=errors.append)
+        assert [str(error) for error in errors] == ["boom"]
+
+    def test_observable_take_stops_producer(self) -> None:
+        produced: list[int] = []
+        result: list[str] = []
+
+        def subscribe(observer: Observer[int]) -> None:
+            for x in range(100):
+                if observer.is_stopped:
+                    return
+                produced.append(x)
+                observer.on_next(x)
+
+        Observable(subscribe).map(lambda x: x * 2).take(3).subscribe(
+            lambda x: result.append(f"OnNext({x})"), on_completed=lambda: result.append("OnCompleted")
+        )
+        assert result == ["OnNext(0)", "OnNext(2)", "OnNext(4)", "OnCompleted"]
+        assert produced == [0, 1, 2]
+
+    def test_observable_dispose(self) -> None:
+        observers: list[Observer[int]] = []
+        disposed: list[bool] = []
+
+        def subscribe(observer: Observer[int]) -> Disposable:
+            observers.append(observer)
+            return Disposable(lambda: disposed.append(True))
+
+        result: list[int] = []
+        subscription = Observable(subscribe).map(lambda x: x + 1).subscribe(result.append)
+        observers[0].on_next(1)
+        subscription.dispose()
+        observers[0].on_next(2)
+
+        assert result == [2]
+        assert observers[0].is_stopped
+        assert disposed == [True]
+
+    def test_observable_on_next_function(self) -> None:
+        result: list[int] = []
+
+        Observable(lambda on_next: on_next(42)).subscribe(result.append)
+        assert result == [42]
+
+
+class TestObservableFusion(unittest.TestCase):
+    def test_observable_fused_map_filter(self) -> None:
+        stream = Observable.from_iterable(range(10)).map(lambda x: x * 3).filter(lambda x: x % 2 == 0)
+        stream = stream.map(lambda x: x + 1).filter(lambda x: x > 5)
+        result: list[int] = []
+
+        stream.subscribe(result.append)
+        assert result == [7, 13, 19, 25]
+
+    def test_observable_fused_single_subscription(self) -> None:
+        observers: list[Observer[int]] = []
+
+        def subscribe(observer: Observer[int]) -> None:
+            observers.append(observer)
+
+        stream = Observable(subscribe)
+        for _ in range(10):
+            stream = stream.map(lambda x: x + 1).filter(lambda x: x > 0)
+        stream.subscribe(lambda _: None)
+        assert len(observers) == 1
+
+    def test_observable_fused_branches(self) -> None:
+        doubled = Observable.from_iterable([1, 2, 3]).map(lambda x: x * 2)
+        left: list[int] = []
+        right: list[int] = []
+
+        doubled.map(lambda x: x + 1).subscribe(left.append)
+        doubled.filter(lambda x: x > 2).subscribe(right.append)
+        assert left == [3, 5, 7]
+        assert right == [4, 6]
+
+    def test_observable_fused_error(self) -> None:
+        errors: list[Exception] = []
+        result: list[int] = []
+
+        stream = Observable.from_iterable([1, 0, 2]).filter(lambda x: x < 2).map(lambda x: 10 // x)
+        stream.subscribe(result.append, errors.append)
+        assert result == [10]
+        assert len(errors) == 1
+        assert isinstance(errors[0], ZeroDivisionError)
+
+
+class TestSubject(unittest.TestCase):
+    def test_subject_multicast(self) -> None:
+        subject: Subject[int] = Subject()
+        first: list[int] = []
+        second: list[int] = []
+
+        subject.subscribe(first.append)
+        subject.on_next(1)
+        subscription = subject.map(lambda x: x * 10).subscribe(second.append)
+        subject.on_next(2)
+        subscription.dispose()
+        subject.on_next(3)
+
+        assert first == [1, 2, 3]
+        assert second == [20]
+
+    def test_subject_completed(self) -> None:
+        subject: Subject[int] = Subject()
+        result: list[str] = []
+
+        subject.subscribe(on_completed=lambda: result.append("first"))
+        subject.on_completed()
+        subject.on_next(1)
+        subject.subscribe(on_completed=lambda: result.append("late"))
+        assert result == ["first", "late"]
+
+    def test_subject_error(self) -> None:
+        subject: Subject[int] = Subject()
+        errors: list[Exception] = []
+
+        subject.subscribe(on_error=errors.append)
+        subject.on_error(ValueError("boom"))
+        subject.subscribe(on_error=errors.append)
+        assert [str(error) for error in errors] == ["boom", "boom"]
+
+    def test_behavior_subject(self) -> None:
+        subject = BehaviorSubject(0)
+        result: list[int] = []
+
+        subject.on_next(1)
+        subject.subscribe(result.append)
+        subject.on_next(2)
+        assert result == [1, 2]
+        assert subject.value == 2
+
+    def test_replay_subject(self) -> None:
+        subject: ReplaySubject[int] = ReplaySubject(buffer_size=2)
+        result: list[str] = []
+
+        for x in range(5):
+            subject.on_next(x)
+        subject.on_completed()
+        subject.subscribe(lambda x: result.append(f"OnNext({x})"), on_completed=lambda: result.append("OnCompleted"))
+        assert result == ["OnNext(3)", "OnNext(4)", "OnCompleted"]
+
+    def test_observable_publish(self) -> None:
+        subscriptions: list[int] = []
+
+        def subscribe(observer: Observer[int]) -> None:
+            subscriptions.append(1)
+            for x in range(3):
+                observer.on_next(x)
+            observer.on_completed()
+
+        published = Observable(subscribe).map(lambda x: x + 1).publish()
+        first: list[int] = []
+        second: list[int] = []
+        published.subscribe(first.append)
+        published.filter(lambda x: x > 1).subscribe(second.append)
+        assert first == []
+
+        published.connect()
+        assert first == [1, 2, 3]
+        assert second == [2, 3]
+        assert subscriptions == [1]
+
+    def test_observable_publish_replay(self) -> None:
+        published = Observable.from_iterable(range(3)).publish(ReplaySubject[int])
+        published.connect()
+        result: list[int] = []
+
+        published.subscribe(result.append)
+        assert result == [0, 1, 2]
+
+    def test_observable_share(self) -> None:
+        observers: list[Observer[int]] = []
+        disposed: list[bool] = []
+
+        def subscribe(observer: Observer[int]) -> Disposable:
+            observers.append(observer)
+            return Disposable(lambda: disposed.append(True))
+
+        shared = Observable(subscribe).share()
+        first: list[int] = []
+        second: list[int] = []
+        subscription = shared.subscribe(first.append)
+        other = shared.subscribe(second.append)
+        observers[0].on_next(1)
+        subscription.dispose()
+        observers[0].on_next(2)
+        assert disposed == []
+
+        other.dispose()
+        assert first == [1]
+        assert second == [1, 2]
+        assert len(observers) == 1
+        assert disposed == [True]
+
+    def test_observable_share_resubscribe(self) -> None:
+        shared = Observable.from_iterable([1, 2]).share()
+        result: list[int] = []
+
+        shared.subscribe(result.append)
+        shared.subscribe(result.append)
+        assert result == [1, 2, 1, 2]
+
+
+def squares(x: int) -> Observable[int]:
+    return Observable.from_iterable([x * x])
+
+
+def run_until_done[T](stream: Observable[T]) -> tuple[list[T], list[Exception]]:
+    done = threading.Event()
+    result: list[T] = []
+    errors: list[Exception] = []
+
+    def on_error(error: Exception) -> None:
+        errors.append(error)
+        done.set()
+
+    stream.subscribe(result.append, on_error, done.set)
+    assert done.wait(10)
+    return result, errors
+
+
+class TestObservableScheduler(unittest.TestCase):
+    def test_flat_map_thread_pool_ordered(self) -> None:
+        def slow(x: int) -> Observable[int]:
+            time.sleep(0.001 * (5 - x))
+            return Observable.from_iterable([x, x * 10])
+
+        with ThreadPoolScheduler(4) as scheduler:
+            stream = Observable.from_iterable(range(5)).flat_map(slow, scheduler=scheduler)
+            result, errors = run_until_done(stream)
+        assert result == [0, 0, 1, 10, 2, 20, 3, 30, 4, 40]
+        assert errors == []
+
+    def test_flat_map_thread_pool_unordered(self) -> None:
+        with ThreadPoolScheduler(4) as scheduler:
+            stream = Observable.from_iterable(range(20)).flat_map(squares, scheduler=scheduler, ordered=False)
+            result, _ = run_until_done(stream)
+        assert sorted(result) == [x * x for x in range(20)]
+
+    def test_flat_map_max_concurrency(self) -> None:
+        lock = threading.Lock()
+        running = 0
+        most = 0
+
+        def slow(x: int) -> Observable[int]:
+            nonlocal running, most
+            with lock:
+                running += 1
+                most = max(most, running)
+            time.sleep(0.005)
+            with lock:
+                running -= 1
+            return Observable.unit(x)
+
+        with ThreadPoolScheduler(8) as scheduler:
+            stream = Observable.from_iterable(range(10)).flat_map(slow, scheduler=scheduler, max_concurrency=2)
+            result, _ = run_until_done(stream)
+        assert result == list(range(10))
+        assert most <= 2
+
+    def test_flat_map_scheduler_error(self) -> None:
+        def fail(x: int) -> Observable[int]:
+            if x == 3:
+                raise ValueError(x)
+            return Observable.unit(x)
+
+        with ThreadPoolScheduler(2) as scheduler:
+            stream = Observable.from_iterable(range(5)).flat_map(fail, scheduler=scheduler)
+            result, errors = run_until_done(stream)
+        assert result == [0, 1, 2]
+        assert [str(error) for error in errors] == ["3"]
+
+    def test_flat_map_process_pool(self) -> None:
+        with ProcessPoolScheduler(2) as scheduler:
+            stream = Observable.from_iterable(range(5)).flat_map(squares, scheduler=scheduler)
+            result, _ = run_until_done(stream)
+        assert result == [0, 1, 4, 9, 16]
+
+
+def timed(scheduler: VirtualTimeScheduler, events: list[tuple[float, int]], end: float) -> Observable[int]:
+    def subscribe(observer: Observer[int]) -> None:
+        for at, x in events:
+            scheduler.schedule(at, lambda x=x: observer.on_next(x))
+        scheduler.schedule(end, observer.on_completed)
+
+    return Observable(subscribe)
+
+
+class TestObservableTime(unittest.TestCase):
+    def setUp(self) -> None:
+        self.scheduler = VirtualTimeScheduler()
+        self.result: list[tuple[float, object]] = []
+
+    def record(self, x: object) -> None:
+        self.result.append((self.scheduler.now(), x))
+
+    def test_interval(self) -> None:
+        subscription = Observable.interval(1.0, self.scheduler).subscribe(self.record)
+        self.scheduler.advance_by(3.5)
+        subscription.dispose()
+        self.scheduler.advance_by(10.0)
+        assert self.result == [(1.0, 0), (2.0, 1), (3.0, 2)]
+
+    def test_interval_take(self) -> None:
+        Observable.interval(1.0, self.scheduler).take(2).subscribe(self.record)
+        self.scheduler.run()
+        assert self.result == [(1.0, 0), (2.0, 1)]
+
+    def test_debounce(self) -> None:
+        events = [(0.0, 1), (0.5, 2), (2.0, 3), (2.2, 4), (5.0, 5)]
+        timed(self.scheduler, events, 5.5).debounce(1.0, self.scheduler).subscribe(self.record)
+        self.scheduler.run()
+        assert self.result == [(1.5, 2), (3.2, 4), (5.5, 5)]
+
+    def test_delay(self) -> None:
+        completed: list[float] = []
+        stream = timed(self.scheduler, [(1.0, 1), (2.0, 2)], 3.0).delay(5.0, self.scheduler)
+        stream.subscribe(self.record, on_completed=lambda: completed.append(self.scheduler.now()))
+        self.scheduler.run()
+        assert self.result == [(6.0, 1), (7.0, 2)]
+        assert completed == [8.0]
+
+    def test_timeout(self) -> None:
+        errors: list[tuple[float, Exception]] = []
+        stream = timed(self.scheduler, [(1.0, 1), (2.0, 2), (9.0, 3)], 10.0).timeout(1.5, self.scheduler)
+        stream.subscribe(self.record, lambda error: errors.append((self.scheduler.now(), error)))
+        self.scheduler.run()
+        assert self.result == [(1.0, 1), (2.0, 2)]
+        assert len(errors) == 1
+        assert errors[0][0] == 3.5
+        assert isinstance(errors[0][1], TimeoutError)
+
+    def test_buffer_with_time(self) -> None:
+        stream = Observable.interval(1.0, self.scheduler).buffer_with_time(3.0, self.scheduler)
+        stream.take(3).subscribe(self.record)
+        self.scheduler.advance_by(100.0)
+        assert self.result == [(3.0, [0, 1]), (6.0, [2, 3, 4]), (9.0, [5, 6, 7])]
+
+    def test_real_time_scheduler(self) -> None:
+        scheduler = RealTimeScheduler()
+        done = threading.Event()
+        result: list[int] = []
+
+        cancel = scheduler.schedule(0.01, lambda: result.append(1))
+        cancel()
+        scheduler.schedule(0.02, done.set)
+        scheduler.schedule(0.01, lambda: result.append(2))
+        assert done.wait(5)
+        assert result == [2]
+
+    def test_real_time_scheduler_error(self) -> None:
+        scheduler = RealTimeScheduler()
+        errors: list[BaseException | None] = []
+        done = threading.Event()
+        result: list[int] = []
+
+        def fail(x: int) -> None:
+            raise ValueError(x)
+
+        with mock.patch("threading.excepthook", lambda args: errors.append(args.exc_value)):
+            Observable.interval(0.01, scheduler).take(1).subscribe(fail)
+            Observable.interval(0.01, scheduler).take(2).subscribe(result.append, on_completed=done.set)
+            assert done.wait(5)
+        assert result == [0, 1]
+        assert len(errors) == 1
+        assert isinstance(errors[0], ValueError)
+
+    def test_time_scheduler_abstract(self) -> None:
+        class Scheduler(TimeScheduler):
+            pass
+
+        with pytest.raises(TypeError):
+            Scheduler()  # type: ignore[abstract]
+
+
+class TestObservableBackpressure(unittest.TestCase):
+    def test_observable_buffer(self) -> None:
+        result: list[list[int]] = []
+
+        Observable.from_iterable(range(7)).buffer(3).subscribe(result.append)
+        assert result == [[0, 1, 2], [3, 4, 5], [6]]
+
+    def test_observable_window(self) -> None:
+        result: list[list[int]] = []
+
+        def on_window(window: Observable[int]) -> None:
+            values: list[int] = []
+            window.subscribe(values.append)
+            result.append(values)
+
+        Observable.from_iterable(range(5)).window(2).subscribe(on_window)
+        assert result == [[0, 1], [2, 3], [4]]
+
+    def test_observable_throttle(self) -> None:
+        scheduler = VirtualTimeScheduler()
+        result: list[int] = []
+
+        def subscribe(observer: Observer[int]) -> None:
+            for x in range(10):
+                scheduler.advance_to(x * 0.4)
+                observer.on_next(x)
+
+        Observable(subscribe).throttle(1.0, scheduler).subscribe(result.append)
+        assert result == [0, 3, 6, 9]
+
+    def test_observable_sample(self) -> None:
+        scheduler = VirtualTimeScheduler()
+        result: list[int] = []
+
+        def subscribe(observer: Observer[int]) -> None:
+            for x in range(10):
+                scheduler.advance_to(x * 0.4)
+                observer.on_next(x)
+            observer.on_completed()
+
+        Observable(subscribe).sample(1.0, scheduler).subscribe(result.append)
+        assert result == [2, 4, 7, 9]
+
+    def on_backpressure(self, overflow: Overflow) -> list[int]:
+        started, release, completed = threading.Event(), threading.Event(), threading.Event()
+        result: list[int] = []
+
+        def subscribe(observer: Observer[int]) -> None:
+            observer.on_next(0)
+            started.wait(1)
+            for x in range(1, 10):
+                observer.on_next(x)
+            observer.on_completed()
+
+        def on_next(x: int) -> None:
+            started.set()
+            release.wait(1)
+            result.append(x)
+
+        Observable(subscribe).on_backpressure_buffer(3, overflow).subscribe(on_next, on_completed=completed.set)
+        release.set()
+        assert completed.wait(1)
+        return result
+
+    def test_observable_backpressure_drop(self) -> None:
+        assert self.on_backpressure(Overflow.DROP) == [0, 1, 2, 3]
+
+    def test_observable_backpressure_latest(self) -> None:
+        assert self.on_backpressure(Overflow.LATEST) == [0, 7, 8, 9]
+
+    def test_observable_backpressure_block(self) -> None:
+        completed = threading.Event()
+        result: list[int] = []
+
+        def on_next(x: int) -> None:
+            time.sleep(0.0001)
+            result.append(x)
+
+        Observable.from_iterable(range(100)).on_backpressure_buffer(4).subscribe(on_next, on_completed=completed.set)
+        assert completed.wait(1)
+        assert result == list(range(100))
+
+    def test_observable_backpressure_error(self) -> None:
+        errored = threading.Event()
+        result: list[int] = []
+        errors: list[Exception] = []
+
+        def on_error(error: Exception) -> None:
+            errors.append(error)
+            errored.set()
+
+        Observable.from_iterable([1, 0]).map(lambda x: 1 // x).on_backpressure_buffer(2).subscribe(
+            result.append, on_error
+        )
+        assert errored.wait(1)
+        assert result == [1]
+        assert isinstance(errors[0], ZeroDivisionError)
+
+    def test_observable_backpressure_observer_error(self) -> None:
+        errored, returned = threading.Event(), threading.Event()
+        errors: list[Exception] = []
+
+        def on_next(x: int) -> None:
+            if x == 3:
+                raise ValueError(x)
+
+        def on_error(error: Exception) -> None:
+            errors.append(error)
+            errored.set()
+
+        def produce() -> None:
+            Observable.from_iterable(range(100)).on_backpressure_buffer(2).subscribe(on_next, on_error)
+            returned.set()
+
+        threading.Thread(target=produce, daemon=True).start()
+        assert errored.wait(1)
+        assert returned.wait(1)
+        assert isinstance(errors[0], ValueError)
@@ -1,5 +1,9 @@
+import itertools
 import unittest
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
 
 from oslash import Reader
 from oslash.reader import MonadReader
@@ -113,3 +117,59 @@ class TestReaderMonad(unittest.TestCase):
         g: Callable[[int], Reader[int, int]] = lambda y: Reader.unit(y * 42)
 
         assert m.bind(f).bind(g).run(env) == m.bind(lambda x: f(x).bind(g)).run(env)
+
+
+class TestReaderRunMany(unittest.TestCase):
+    def test_reader_run_many(self) -> None:
+        r: Reader[int, int] = Reader(lambda x: x * 10)
+
+        assert list(r.run_many([1, 2, 3])) == [10, 20, 30]
+
+    def test_reader_run_many_is_lazy(self) -> None:
+        seen: list[int] = []
+
+        def fn(x: int) -> int:
+            seen.append(x)
+            return x
+
+        results = Reader(fn).run_many(iter([1, 2, 3]))
+        assert seen == []
+        assert next(results) == 1
+        assert seen == [1]
+
+    def test_reader_run_many_executor(self) -> None:
+        r: Reader[int, int] = Reader(lambda x: x + 1)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            assert list(r.run_many(range(100), executor=executor)) == list(range(1, 101))
+
+    def test_reader_run_many_executor_window(self) -> None:
+        consumed: list[int] = []
+
+        def envs() -> Iterator[int]:
+            for i in itertools.count():
+                consumed.append(i)
+                yield i
+
+        r: Reader[int, int] = Reader(lambda x: x * 2)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = r.run_many(envs(), executor=executor, chunksize=2, window=3)
+            assert list(itertools.islice(results, 5)) == [0, 2, 4, 6, 8]
+            results.close()  # type: ignore[attr-defined]
+        assert len(consumed) <= 2 * (3 + 3)
+
+    def test_reader_run_many_invalid(self) -> None:
+        r: Reader[int, int] = Reader(lambda x: x + 1)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            with pytest.raises(ValueError, match="chunksize"):
+                r.run_many(range(10), executor=executor, chunksize=0)
+            with pytest.raises(ValueError, match="window"):
+                r.run_many(range(10), executor=executor, window=0)
+
+    def test_reader_run_many_local(self) -> None:
+        r: Reader[str, int] = MonadReader.asks(len)
+        local: Reader[str, int] = MonadReader(r.run).local(lambda env: env * 2)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            assert list(local.run_many(["a", "bb"], executor=executor, chunksize=2)) == [2, 4]
@@ -30,6 +30,15 @@ class TestCompose(unittest.TestCase):
         i = compose(h, g, f)
         assert i(10) == 215
 
+    def test_compose_4(self) -> None:
+        f: Callable[[int], int] = lambda x: x * 42
+        g: Callable[[int], int] = lambda y: y + 10
+        h: Callable[[int], float] = lambda z: z / 2
+        i: Callable[[float], str] = lambda w: f"{w}"
+        j = compose(i, h, g, f)
+        assert j(10) == "215.0"
+        assert j(10) == "215.0"
+
     def test_compose_composition(self) -> None:
         u: Callable[[int], int] = lambda x: x * 42
         v: Callable[[int], int] = lambda x: x + 42
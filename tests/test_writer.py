@@ -1,8 +1,9 @@
+import io
 import unittest
 from collections.abc import Callable
 from typing import Any
 
-from oslash import StringWriter, Writer
+from oslash import LogSink, StreamingWriter, StringWriter, Writer
 
 
 class TestWriterMonad(unittest.TestCase):
@@ -43,3 +44,106 @@ class TestWriterMonad(unittest.TestCase):
         a = StringWriter.unit(42).bind(f).bind(g)
         b = StringWriter.unit(42).bind(lambda x: f(x).bind(g))
         assert a == b
+
+    def test_writer_long_chain(self) -> None:
+        m: Any = StringWriter.unit(0)
+        for _ in range(10000):
+            m = m.bind(lambda x: StringWriter(x + 1, "x"))
+        assert m.run() == (10000, "x" * 10000)
+
+    def test_writer_list_log(self) -> None:
+        ListWriter: type[Any] = Writer.create("ListWriter", list)  # type: ignore[assignment]
+        m: Any = ListWriter.unit(0)
+        for i in range(1, 4):
+            m = m.bind(lambda x, i=i: ListWriter(x + i, [i]))
+        assert m.run() == (6, [1, 2, 3])
+
+    def test_writer_run_twice(self) -> None:
+        m = StringWriter.unit(1).bind(lambda x: StringWriter(x, "a")).bind(lambda x: StringWriter(x, "b"))
+        assert m.run() == (1, "ab")
+        assert m.run() == (1, "ab")
+
+
+class TestWriterCreate(unittest.TestCase):
+    def test_writer_create_is_cached(self) -> None:
+        IntWriter = Writer.create("IntWriter", int)  # type: ignore[arg-type]
+        assert Writer.create("IntWriter", int) is IntWriter  # type: ignore[arg-type]
+        assert Writer.create("IntWriter", str) is not IntWriter
+        assert StringWriter is Writer.create("StringWriter", str)
+
+    def test_writer_create_unit(self) -> None:
+        ListWriter: type[Any] = Writer.create("ListWriter", list)  # type: ignore[assignment]
+        w = ListWriter.unit(42)
+        assert isinstance(w, ListWriter)
+        assert w.run() == (42, [])
+
+    def test_writer_static_subclass(self) -> None:
+        class ListWriter(Writer[int, list[str]]):
+            @classmethod
+            def empty_log(cls) -> list[str]:
+                return []
+
+        m = ListWriter.unit(1).bind(lambda x: ListWriter(x + 1, ["inc"]))
+        assert m.run() == (2, ["inc"])
+
+
+class TestStreamingWriter(unittest.TestCase):
+    def test_streaming_writer_file(self) -> None:
+        out = io.StringIO()
+        AuditWriter = StreamingWriter.with_sink("AuditWriter", LogSink(out))
+        m = AuditWriter.unit(42).bind(lambda x: AuditWriter(x * 10, "a")).bind(lambda x: AuditWriter(x + 1, "b"))
+        value, sink = m.run()
+        assert value == 421
+        assert out.getvalue() == "ab"
+        assert sink.entries == 2  # type: ignore[attr-defined]
+
+    def test_streaming_writer_nested_order(self) -> None:
+        out = io.StringIO()
+        AuditWriter = StreamingWriter.with_sink("AuditWriter", LogSink(out))
+        m = AuditWriter.tell("a").bind(lambda _: AuditWriter.tell("b").bind(lambda _: AuditWriter.tell("c")))
+        m.run()
+        assert out.getvalue() == "abc"
+
+    def test_streaming_writer_buffered(self) -> None:
+        batches: list[list[str]] = []
+        AuditWriter = StreamingWriter.with_sink("AuditWriter", LogSink(batches.append, flush_size=3))
+        m: Any = AuditWriter.unit(0)
+        for i in range(7):
+            m = m.bind(lambda x, i=i: AuditWriter(x + 1, str(i)))
+        assert batches == [["0", "1", "2"], ["3", "4", "5"]]
+        m.run()
+        assert batches == [["0", "1", "2"], ["3", "4", "5"], ["6"]]
+
+    def test_streaming_writer_reuse_tell(self) -> None:
+        out = io.StringIO()
+        AuditWriter = StreamingWriter.with_sink("AuditWriter", LogSink(out))
+        x = AuditWriter.tell("x;")
+        AuditWriter.unit(1).bind(lambda _: x).bind(lambda _: x).run()
+        assert out.getvalue() == "x;x;"
+
+    def test_streaming_writer_run_twice(self) -> None:
+        out = io.StringIO()
+        AuditWriter = StreamingWriter.with_sink("AuditWriter", LogSink(out))
+        x = AuditWriter.tell("x;")
+
+        def program() -> Any:
+            return AuditWriter.unit(1).bind(lambda _: x)
+
+        program().run()
+        program().run()
+        assert out.getvalue() == "x;x;"
+
+    def test_streaming_writer_map(self) -> None:
+        out = io.StringIO()
+        AuditWriter = StreamingWriter.with_sink("AuditWriter", LogSink(out))
+        m = AuditWriter.tell("a").map(lambda aw: (42, aw[1]))
+        assert m.run()[0] == 42
+        assert out.getvalue() == "a"
+
+    def test_streaming_writer_map_buffered(self) -> None:
+        batches: list[list[str]] = []
+        AuditWriter = StreamingWriter.with_sink("AuditWriter", LogSink(batches.append, flush_size=3))
+        m = AuditWriter.tell("a").map(lambda aw: (1, aw[1])).map(lambda aw: (aw[0] + 1, "b"))
+        assert batches == []
+        assert m.run()[0] == 2
+        assert batches == [["a", "b"]]